@@ -42,7 +42,10 @@ app_schemas: list[ConfigSchema | MapConfigSchema] = [
             # MPD supports at most 10k tracks, some clients segfault when this
             # is exceeded.
             "max_tracklist_length": types.Integer(minimum=1),
+            "lookup_cache_size": types.Integer(minimum=0),
+            "library_timeout": types.Integer(minimum=1, optional=True),
             "restore_state": types.Boolean(optional=True),
+            "actor_stats": types.Boolean(),
         },
     ),
     ConfigSchema(
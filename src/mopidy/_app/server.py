@@ -12,7 +12,7 @@ from pykka.messages import ProxyCall
 from mopidy import exceptions
 from mopidy._app import process
 from mopidy._app.extensions import ExtensionManager, ExtensionStatus
-from mopidy._lib import gi, logs
+from mopidy._lib import actor_stats, gi, logs
 from mopidy._lib.process import exit_process
 from mopidy.audio import AudioProxy, GstAudio
 from mopidy.backend import BackendActor, BackendProxy
@@ -49,6 +49,10 @@ def command() -> int:
     frontend_classes = cast(list[type[ThreadingActor]], registry["frontend"])
     core = None
 
+    if config["core"]["actor_stats"]:
+        logger.info("Recording actor statistics")
+        actor_stats.enable()
+
     exit_status_code = 0
     try:
         mixer = None
@@ -82,6 +86,7 @@ def command() -> int:
         if mixer_class is not None:
             stop_mixer(mixer_class)
         process.stop_remaining_actors()
+        actor_stats.disable()
     return exit_status_code
 
 
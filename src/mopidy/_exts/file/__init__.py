@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 import logging
 from pathlib import Path
-from typing import override
+from typing import TYPE_CHECKING, override
 
 import mopidy
 from mopidy import config, ext
 
+if TYPE_CHECKING:
+    import cyclopts
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,10 +28,22 @@ class Extension(ext.Extension):
         schema["show_dotfiles"] = config.Boolean(optional=True)
         schema["follow_symlinks"] = config.Boolean(optional=True)
         schema["metadata_timeout"] = config.Integer(optional=True)
+        schema["watch"] = config.Boolean(optional=True)
         return schema
 
+    @override
+    def get_command(self) -> cyclopts.App:
+        from .commands import app  # noqa: PLC0415
+
+        return app
+
     @override
     def setup(self, registry: ext.Registry) -> None:
         from .backend import FileBackend  # noqa: PLC0415
+        from .web import image_app_factory  # noqa: PLC0415
 
         registry.add("backend", FileBackend)
+        registry.add(
+            "http:app",
+            {"name": self.ext_name, "factory": image_app_factory},
+        )
@@ -19,6 +19,22 @@ class FileBackend(pykka.ThreadingActor, backend.Backend):
     @override
     def __init__(self, *, config: Config, audio: AudioProxy) -> None:
         super().__init__(config=config, audio=audio)
-        self.library = library.FileLibraryProvider(backend=self, config=config)
-        self.playback = backend.PlaybackProvider(audio=audio, backend=self)
+        self._file_library = library.FileLibraryProvider(backend=self, config=config)
+        self.library = self._file_library
+        self.playback = FilePlaybackProvider(audio=audio, backend=self)
         self.playlists = None
+
+    @override
+    def on_start(self) -> None:
+        library = self.actor_ref.proxy().library
+        self._file_library.start_watching(on_change=library.refresh_paths)
+
+    @override
+    def on_stop(self) -> None:
+        self._file_library.stop_watching()
+        self._file_library.stop_updating()
+
+
+class FilePlaybackProvider(backend.PlaybackProvider):
+    # File URIs are playable as they are, so preparing them is free.
+    prepare_next_uri = True
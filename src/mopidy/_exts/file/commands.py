@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, cast
+
+import cyclopts
+
+from mopidy.config import Config
+
+from . import Extension
+from .index import TrackIndex
+from .media import MediaTree
+from .types import FileConfig
+
+if TYPE_CHECKING:
+    from .library import IndexStats
+
+logger = logging.getLogger(__name__)
+
+# Seconds between progress log messages during a scan.
+_PROGRESS_INTERVAL = 10
+
+app = cyclopts.App(help="Manage the file library.")
+
+
+@app.command
+def scan() -> None:
+    """Scan the media dirs and update the track index.
+
+    Only new and changed files are scanned. Files that no longer exist are
+    removed from the index.
+    """
+    # Defer the imports until the command runs, as they initialize GStreamer.
+    from mopidy.audio.scan import Scanner  # noqa: PLC0415
+
+    from .library import update_index  # noqa: PLC0415
+
+    config = Config.get_global()
+    ext_config = cast(FileConfig, config[Extension.ext_name])
+
+    tree = MediaTree(config)
+    if not tree.media_dirs:
+        logger.warning("No media dirs to scan. Please set file/media_dirs.")
+        return
+
+    scanner = Scanner(timeout=ext_config["metadata_timeout"])
+    index = TrackIndex(Extension.get_data_dir(config) / "tracks.db")
+    last_report = time.monotonic()
+
+    def report_progress(stats: IndexStats) -> None:
+        nonlocal last_report
+        if time.monotonic() - last_report < _PROGRESS_INTERVAL:
+            return
+        last_report = time.monotonic()
+        logger.info(
+            f"Scanned {stats.scanned} of {stats.files} files found so far "
+            f"({stats.files_per_second:.1f} files/s)"
+        )
+
+    try:
+        stats = update_index(tree, index, scanner, progress=report_progress)
+    finally:
+        index.close()
+
+    print(f"Scanned file library: {stats}")  # noqa: T201
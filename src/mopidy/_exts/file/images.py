@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pathlib
+import re
+import struct
+import tempfile
+from typing import NamedTuple, cast
+
+from mopidy._lib.gi import Gst
+from mopidy.models import Image
+from mopidy.types import Uri
+
+logger = logging.getLogger(__name__)
+
+# Path below the HTTP server's root where the image cache is served.
+URI_PREFIX = "/file/images/"
+
+# Widths of the thumbnails offered in addition to the original images.
+THUMBNAIL_WIDTHS = (64, 300)
+
+# Names of image files in an album directory, in order of preference.
+FOLDER_IMAGE_NAMES = (
+    "cover.jpg",
+    "cover.jpeg",
+    "cover.png",
+    "folder.jpg",
+    "folder.jpeg",
+    "folder.png",
+    "front.jpg",
+    "front.jpeg",
+    "front.png",
+)
+
+_NAME_RE = re.compile(r"^(?P<digest>[0-9a-f]{64})(-(?P<width>\d+))?\.(jpg|png|gif)$")
+
+_RESIZE_TIMEOUT_MS = 5000
+
+
+class ImageInfo(NamedTuple):
+    extension: str
+    width: int | None
+    height: int | None
+
+
+class ImageCache:
+    """Content-addressed cache of image files.
+
+    Images are stored under the SHA-256 digest of their content, so the same
+    album art embedded in every track of an album is only stored once.
+    Thumbnails are created on first request, and then kept next to the
+    original image.
+
+    Args:
+        path: The directory to store images in. Created if missing.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def store(self, data: bytes) -> Image | None:
+        """Add an image to the cache.
+
+        Args:
+            data: The image file content.
+
+        Returns:
+            The cached image, or `None` if the data is not a supported image.
+        """
+        if (info := get_image_info(data)) is None:
+            return None
+        name = f"{hashlib.sha256(data).hexdigest()}.{info.extension}"
+        target = self.path / name
+        if not target.exists():
+            _write_atomically(target, data)
+        return Image(
+            uri=Uri(URI_PREFIX + name),
+            width=info.width,
+            height=info.height,
+        )
+
+    def contains(self, image: Image) -> bool:
+        """Check if an image returned by [store][] is still in the cache."""
+        name = image.uri.removeprefix(URI_PREFIX)
+        return (self.path / name).is_file()
+
+    def with_thumbnails(self, image: Image) -> list[Image]:
+        """Get an image along with the thumbnails available for it.
+
+        Thumbnails are only offered for widths smaller than the original
+        image, and only if the original's dimensions are known. Animated
+        GIF images are never resized.
+
+        Args:
+            image: An image returned by [store][].
+        """
+        digest, _, extension = image.uri.removeprefix(URI_PREFIX).partition(".")
+        if not image.width or not image.height or extension == "gif":
+            return [image]
+        thumbnails = [
+            Image(
+                uri=Uri(f"{URI_PREFIX}{digest}-{width}.jpg"),
+                width=width,
+                height=round(image.height * width / image.width),
+            )
+            for width in THUMBNAIL_WIDTHS
+            if width < image.width
+        ]
+        return [image, *thumbnails]
+
+    def ensure(self, name: str) -> bool:
+        """Make sure a cached image or thumbnail exists, creating it if needed.
+
+        Args:
+            name: The file name of the image, as found in its URI.
+
+        Returns:
+            Whether the file now exists in the cache.
+        """
+        if (match := _NAME_RE.match(name)) is None:
+            return False
+        if (self.path / name).is_file():
+            return True
+        if match["width"] is None or int(match["width"]) not in THUMBNAIL_WIDTHS:
+            return False
+        originals = sorted(self.path.glob(f"{match['digest']}.*"))
+        if not originals:
+            return False
+        return _resize(originals[0], self.path / name, int(match["width"]))
+
+
+def get_image_info(data: bytes) -> ImageInfo | None:
+    """Detect the format and dimensions of an image from its header.
+
+    Supports JPEG, PNG, and GIF images. The dimensions are `None` if they
+    can't be found in the header.
+
+    Args:
+        data: The image file content.
+    """
+    if data.startswith(b"\x89PNG\r\n\x1a\n") and len(data) >= 24:
+        width, height = struct.unpack(">II", data[16:24])
+        return ImageInfo("png", width, height)
+    if data.startswith((b"GIF87a", b"GIF89a")) and len(data) >= 10:
+        width, height = struct.unpack("<HH", data[6:10])
+        return ImageInfo("gif", width, height)
+    if data.startswith(b"\xff\xd8"):
+        width, height = _get_jpeg_size(data)
+        return ImageInfo("jpg", width, height)
+    return None
+
+
+def _get_jpeg_size(data: bytes) -> tuple[int | None, int | None]:
+    # Walk the JPEG segments until we find a start of frame marker.
+    offset = 2
+    while offset + 9 <= len(data):
+        if data[offset] != 0xFF:
+            break
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return width, height
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        offset += 2 + length
+    return None, None
+
+
+def _get_tmp_path(target: pathlib.Path) -> pathlib.Path:
+    fd, name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    os.close(fd)
+    return pathlib.Path(name)
+
+
+def _write_atomically(target: pathlib.Path, data: bytes) -> None:
+    tmp_path = _get_tmp_path(target)
+    tmp_path.write_bytes(data)
+    tmp_path.replace(target)
+
+
+def _resize(source: pathlib.Path, target: pathlib.Path, width: int) -> bool:
+    # Let GStreamer decode the image and scale it to the given width, keeping
+    # the aspect ratio, before encoding it as JPEG.
+    pipeline = Gst.parse_launch(
+        "filesrc name=src ! decodebin ! videoconvert ! videoscale "
+        "! capsfilter name=caps ! jpegenc ! filesink name=sink"
+    )
+    pipeline = cast(Gst.Pipeline, pipeline)
+    src = pipeline.get_by_name("src")
+    caps = pipeline.get_by_name("caps")
+    sink = pipeline.get_by_name("sink")
+    bus = pipeline.get_bus()
+    if src is None or caps is None or sink is None or bus is None:
+        logger.warning(f"Failed resizing {source.as_uri()}: broken pipeline")
+        return False
+
+    tmp_target = _get_tmp_path(target)
+    src.set_property("location", str(source))
+    caps.set_property("caps", Gst.Caps.from_string(f"video/x-raw,width={width:d}"))
+    sink.set_property("location", str(tmp_target))
+    try:
+        pipeline.set_state(Gst.State.PLAYING)
+        msg = bus.timed_pop_filtered(
+            _RESIZE_TIMEOUT_MS * Gst.MSECOND,
+            Gst.MessageType.EOS | Gst.MessageType.ERROR,
+        )
+    finally:
+        pipeline.set_state(Gst.State.NULL)
+
+    if msg is None or msg.type != Gst.MessageType.EOS:
+        error = msg.parse_error()[0] if msg is not None else "timeout"
+        logger.warning(f"Failed resizing {source.as_uri()}: {error}")
+        tmp_target.unlink(missing_ok=True)
+        return False
+    tmp_target.replace(target)
+    return True
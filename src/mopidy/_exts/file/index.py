@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import pydantic
+
+from mopidy.models import Image, Track
+
+if TYPE_CHECKING:
+    import os
+    from pathlib import Path
+
+    from mopidy.types import Uri
+
+logger = logging.getLogger(__name__)
+
+# Bump this whenever the layout of existing tables or the stored track format
+# changes. An index with a different version is thrown away and rebuilt on
+# demand. New tables can be added without a bump.
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracks (
+    uri TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    track TEXT
+);
+CREATE TABLE IF NOT EXISTS images (
+    uri TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    images TEXT NOT NULL
+);
+"""
+
+_IMAGE_LIST = pydantic.TypeAdapter(list[Image])
+
+
+class TrackIndex:
+    """Persistent index of scanned tracks.
+
+    Each entry is keyed by the file URI and stores the file's modification
+    time and size at the time it was scanned. An entry is only returned as
+    long as the file still has the same modification time and size, so
+    changed files are always rescanned.
+
+    Files that failed scanning are stored without a track, so that a full
+    library scan doesn't retry them until they change.
+
+    The index is safe to use from multiple threads.
+
+    Args:
+        path: Path to the SQLite database file. Created if missing.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        try:
+            self._connection = self._connect()
+        except sqlite3.DatabaseError as exc:
+            logger.warning(f"Recreating broken track index {path.as_uri()}: {exc}")
+            path.unlink(missing_ok=True)
+            self._connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        with connection:
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS tracks")
+                connection.execute("DROP TABLE IF EXISTS images")
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION:d}")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM tracks"
+            ).fetchone()
+        return count
+
+    def get(self, uri: Uri, stat: os.stat_result) -> Track | None:
+        """Get the indexed track for `uri` if the file is unchanged.
+
+        Args:
+            uri: URI of the file.
+            stat: Current stat result of the file.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT mtime, size, track FROM tracks WHERE uri = ?",
+                (uri,),
+            ).fetchone()
+        if row is None:
+            return None
+        mtime, size, data = row
+        if mtime != stat.st_mtime_ns or size != stat.st_size or data is None:
+            return None
+        try:
+            return Track.model_validate_json(data)
+        except pydantic.ValidationError:
+            logger.debug("Ignoring invalid track index entry for %s", uri)
+            return None
+
+    @property
+    def data_version(self) -> int:
+        """A number that changes when another connection modifies the index.
+
+        Changes made through this instance do not change the data version.
+        """
+        with self._lock:
+            (version,) = self._connection.execute("PRAGMA data_version").fetchone()
+        return version
+
+    def get_tracks(self, prefix: str = "") -> list[Track]:
+        """Get all indexed tracks, regardless of whether the files changed.
+
+        Args:
+            prefix: Only include tracks with URIs starting with this prefix.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT uri, track FROM tracks "
+                "WHERE track IS NOT NULL AND substr(uri, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+        tracks = []
+        for uri, data in rows:
+            try:
+                tracks.append(Track.model_validate_json(data))
+            except pydantic.ValidationError:
+                logger.debug("Ignoring invalid track index entry for %s", uri)
+        return tracks
+
+    def get_file_stats(self, prefix: str = "") -> dict[Uri, tuple[int, int]]:
+        """Get the modification time and size of all indexed files.
+
+        Args:
+            prefix: Only include URIs starting with this prefix.
+
+        Returns:
+            A mapping of URI to modification time in nanoseconds and size.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT uri, mtime, size FROM tracks WHERE substr(uri, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+        return {uri: (mtime, size) for uri, mtime, size in rows}
+
+    def put(self, uri: Uri, stat: os.stat_result, track: Track | None) -> None:
+        """Add or replace the indexed track for `uri`.
+
+        Args:
+            uri: URI of the file.
+            stat: Stat result of the file when it was scanned.
+            track: The scanned track, or `None` if scanning failed.
+        """
+        self.put_many([(uri, stat, track)])
+
+    def put_many(
+        self,
+        entries: Iterable[tuple[Uri, os.stat_result, Track | None]],
+    ) -> None:
+        """Add or replace multiple indexed tracks in one transaction.
+
+        Args:
+            entries: Tuples of URI, stat result and track.
+        """
+        rows = [
+            (
+                uri,
+                stat.st_mtime_ns,
+                stat.st_size,
+                (
+                    track.model_dump_json(by_alias=True, exclude_none=True)
+                    if track is not None
+                    else None
+                ),
+            )
+            for uri, stat, track in entries
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO tracks (uri, mtime, size, track) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def remove(self, uris: Iterable[Uri]) -> None:
+        """Remove the entries for the given URIs, if any.
+
+        Args:
+            uris: URIs of the files to forget.
+        """
+        rows = [(uri,) for uri in uris]
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM tracks WHERE uri = ?", rows)
+            self._connection.executemany("DELETE FROM images WHERE uri = ?", rows)
+
+    def get_images(self, uri: Uri, stat: os.stat_result) -> list[Image] | None:
+        """Get the images extracted from `uri` if the file is unchanged.
+
+        Args:
+            uri: URI of the track or image file.
+            stat: Current stat result of the file.
+
+        Returns:
+            The images, which may be an empty list, or `None` if the file
+            has not been indexed or has changed.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT mtime, size, images FROM images WHERE uri = ?",
+                (uri,),
+            ).fetchone()
+        if row is None:
+            return None
+        mtime, size, data = row
+        if mtime != stat.st_mtime_ns or size != stat.st_size:
+            return None
+        try:
+            return _IMAGE_LIST.validate_json(data)
+        except pydantic.ValidationError:
+            logger.debug("Ignoring invalid image index entry for %s", uri)
+            return None
+
+    def put_images(
+        self,
+        uri: Uri,
+        stat: os.stat_result,
+        images: list[Image],
+    ) -> None:
+        """Add or replace the images extracted from `uri`.
+
+        Args:
+            uri: URI of the track or image file.
+            stat: Stat result of the file when the images were extracted.
+            images: The extracted images.
+        """
+        data = _IMAGE_LIST.dump_json(images, by_alias=True, exclude_none=True)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO images (uri, mtime, size, images) "
+                "VALUES (?, ?, ?, ?)",
+                (uri, stat.st_mtime_ns, stat.st_size, data.decode()),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
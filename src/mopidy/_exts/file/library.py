@@ -1,31 +1,36 @@
+import functools
+import itertools
 import logging
 import os
 import pathlib
-from collections.abc import Generator
-from typing import TypedDict, cast, override
+import queue
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Mapping
+from dataclasses import dataclass
+from typing import cast, override
 
 from mopidy import backend, exceptions
 from mopidy import config as config_lib
 from mopidy._lib import paths
 from mopidy.audio import scan, tags
-from mopidy.models import Ref, Track
-from mopidy.types import Uri
+from mopidy.models import Image, Ref, SearchResult, Track
+from mopidy.types import DistinctField, Query, SearchField, Uri
 
 from . import Extension
+from .images import FOLDER_IMAGE_NAMES, ImageCache
+from .index import TrackIndex
+from .media import MediaTree
+from .search import SearchIndex
 from .types import FileConfig
+from .watcher import MediaWatcher
 
 logger = logging.getLogger(__name__)
 
 
-class MediaDir(TypedDict):
-    path: pathlib.Path
-    name: str
-
-
 class FileLibraryProvider(backend.LibraryProvider):
     """Library for browsing local files."""
 
-    # TODO: get_images that can pull from metadata and/or .folder.png etc?
     # TODO: handle playlists?
 
     def __init__(self, backend: backend.Backend, config: config_lib.Config) -> None:
@@ -33,19 +38,21 @@ class FileLibraryProvider(backend.LibraryProvider):
 
         ext_config = cast(FileConfig, config[Extension.ext_name])
 
-        self._media_dirs = list(self._get_media_dirs(config))
-        self._show_dotfiles = ext_config["show_dotfiles"]
-        self._excluded_file_extensions = tuple(
-            file_ext.lower() for file_ext in ext_config["excluded_file_extensions"]
-        )
-        self._follow_symlinks = ext_config["follow_symlinks"]
-
+        self._tree = MediaTree(config)
         self._scanner = scan.Scanner(timeout=ext_config["metadata_timeout"])
+        self._index = TrackIndex(Extension.get_data_dir(config) / "tracks.db")
+        self._images = ImageCache(Extension.get_cache_dir(config) / "images")
+        self._search_index: SearchIndex | None = None
+        self._search_index_version: int | None = None
+        self._refresh_count = 0
+        self._updater: IndexUpdater | None = None
+        self._watch = ext_config["watch"]
+        self._watcher: MediaWatcher | None = None
 
         self.root_directory = self._get_root_directory()
 
     @override
-    def browse(self, uri: Uri) -> list[Ref]:  # noqa: C901
+    def browse(self, uri: Uri) -> list[Ref]:
         logger.debug("Browsing files at: %s", uri)
         result = []
         local_path = paths.uri_to_path(uri)
@@ -53,42 +60,24 @@ class FileLibraryProvider(backend.LibraryProvider):
         if str(local_path) == "root":
             return list(self._get_media_dirs_refs())
 
-        if not self._is_in_basedir(local_path):
+        local_path = local_path.resolve()
+        if not self._tree.is_in_basedir(local_path):
             logger.warning(
                 "Rejected attempt to browse path (%s) outside dirs defined "
                 "in file/media_dirs config.",
                 uri,
             )
             return []
-        if paths.uri_to_path(uri).is_file():
+        if local_path.is_file():
             logger.error("Rejected attempt to browse file (%s)", uri)
             return []
 
-        for dir_entry in local_path.iterdir():
-            child_path = dir_entry.resolve()
-            uri = paths.path_to_uri(child_path)
-
-            if not self._show_dotfiles and dir_entry.name.startswith("."):
-                continue
-
-            if (
-                self._excluded_file_extensions
-                and dir_entry.suffix.lower() in self._excluded_file_extensions
-            ):
-                continue
-
-            if dir_entry.is_symlink() and not self._follow_symlinks:
-                logger.debug("Ignoring symlink: %s", uri)
-                continue
-
-            if not self._is_in_basedir(child_path):
-                logger.debug("Ignoring symlink to outside base dir: %s", uri)
-                continue
-
-            if child_path.is_dir():
-                result.append(Ref.directory(name=dir_entry.name, uri=uri))
-            elif child_path.is_file():
-                result.append(Ref.track(name=dir_entry.name, uri=uri))
+        for entry in self._tree.iterdir(local_path):
+            uri = paths.path_to_uri(entry.path)
+            if entry.is_dir:
+                result.append(Ref.directory(name=entry.name, uri=uri))
+            else:
+                result.append(Ref.track(name=entry.name, uri=uri))
 
         def order(ref: Ref) -> tuple:
             return (ref.type != Ref.DIRECTORY, ref.name)
@@ -98,73 +87,518 @@ class FileLibraryProvider(backend.LibraryProvider):
         return result
 
     @override
-    def lookup(self, uri: Uri) -> list[Track]:
-        logger.debug("Looking up file URI: %s", uri)
-        local_path = paths.uri_to_path(uri)
+    def refresh(self, uri: Uri | None = None) -> None:
+        local_path = None
+        if uri is not None:
+            local_path = paths.uri_to_path(uri).resolve()
+            if not self._tree.is_in_basedir(local_path) or not local_path.is_dir():
+                logger.warning(
+                    "Rejected attempt to refresh %s, which is not a directory "
+                    "inside the dirs defined in file/media_dirs config.",
+                    uri,
+                )
+                return
+        self._queue_update(
+            None if local_path is None else [local_path],
+            "Refreshed file library",
+        )
 
+    def refresh_paths(self, local_paths: Iterable[pathlib.Path]) -> None:
+        """Update the index for files and directories that have changed.
+
+        The update runs in the background, after any earlier refreshes.
+
+        Args:
+            local_paths: Changed, created, or deleted files and directories
+                inside the media dirs.
+        """
+        self._queue_update(list(local_paths), "Updated file library")
+
+    def start_watching(
+        self,
+        on_change: Callable[[set[pathlib.Path]], object],
+    ) -> None:
+        """Start watching the media dirs for changes, if enabled in the config.
+
+        Args:
+            on_change: Called from the watcher thread with the changed paths.
+                Should pass them on to [refresh_paths][] in the backend's
+                actor thread.
+        """
+        if not self._watch or not self._tree.media_dirs:
+            return
+        if not MediaWatcher.is_supported():
+            logger.warning("Watching file/media_dirs is only supported on Linux.")
+            return
         try:
-            result = self._scanner.scan(uri)
-            track = tags.convert_tags_to_track(
-                result.tags,
-                uri=uri,
-                length=result.duration,
-            )
-        except exceptions.ScannerError as e:
-            logger.warning("Failed looking up %s: %s", uri, e)
-            track = Track(uri=uri)
+            self._watcher = MediaWatcher(self._tree, on_change)
+        except OSError as exc:
+            logger.warning(f"Failed watching file/media_dirs: {exc}")
+            return
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop watching the media dirs for changes."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher.join()
+            self._watcher = None
+
+    def stop_updating(self) -> None:
+        """Stop updating the index once the current update is done.
+
+        Queued updates are dropped. They are picked up again by the next
+        refresh, as only files that changed since they were indexed are
+        scanned.
+        """
+        if self._updater is not None:
+            self._updater.stop()
+            self._updater = None
 
-        if not track.name:
-            track = track.replace(
-                name=local_path.name,
-            )
+    @override
+    def search(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+    ) -> SearchResult | None:
+        return self.search_page(query, uris, exact)
 
-        return [track]
+    @override
+    def search_page(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> SearchResult | None:
+        search_index = self._get_search_index()
+        matches = search_index.search(query, exact=exact)
+        if uris is not None:
+            prefixes = tuple(_get_search_prefixes(uris))
+            matches = {uri for uri in matches if uri.startswith(prefixes)}
+        # Only the tracks on the requested page are fetched from the index
+        page = sorted(matches)[offset : None if limit is None else offset + limit]
+        return SearchResult(tracks=tuple(search_index.get_tracks(page)))
 
-    def _get_root_directory(self) -> Ref | None:
-        if not self._media_dirs:
-            return None
-        if len(self._media_dirs) == 1:
-            uri = paths.path_to_uri(self._media_dirs[0]["path"])
-        else:
-            uri = Uri("file:root")
-        return Ref.directory(name="Files", uri=uri)
+    @override
+    def get_distinct(
+        self,
+        field: DistinctField,
+        query: Query[SearchField] | None = None,
+    ) -> set[str]:
+        search_index = self._get_search_index()
+        uris = search_index.search(query, exact=True) if query else None
+        return cast(set[str], search_index.get_distinct(field, uris))
 
-    def _get_media_dirs(self, config: config_lib.Config) -> Generator[MediaDir]:
-        for entry in config["file"]["media_dirs"]:
-            media_dir_split = entry.split("|", 1)
-            local_path = paths.expand_path(media_dir_split[0])
+    @override
+    def get_version(self) -> str:
+        # Changes when the index is updated by a refresh, the watcher, or
+        # another process, like `mopidy file scan`. Files changed on disk
+        # without any of those are not noticed, so core's lookup cache may
+        # keep serving their old tracks until then.
+        return f"{self._refresh_count}:{self._index.data_version}"
 
-            if local_path is None:
-                logger.debug(
-                    "Failed expanding path (%s) from file/media_dirs config value.",
-                    media_dir_split[0],
-                )
+    @override
+    def lookup_many(self, uris: Iterable[Uri]) -> dict[Uri, list[Track]]:
+        results: dict[Uri, list[Track]] = {}
+        pending: dict[Uri, tuple[pathlib.Path, os.stat_result | None]] = {}
+
+        for uri in uris:
+            logger.debug("Looking up file URI: %s", uri)
+            local_path = paths.uri_to_path(uri)
+            try:
+                stat = local_path.stat()
+            except OSError:
+                stat = None
+            if stat is not None and (track := self._index.get(uri, stat)) is not None:
+                results[uri] = [track]
+            else:
+                pending[uri] = (local_path, stat)
+
+        indexed = []
+        for uri, result in _scan_tracks(self._scanner, pending).items():
+            if isinstance(result, exceptions.ScannerError):
+                logger.warning("Failed looking up %s: %s", uri, result)
+                local_path, _ = pending[uri]
+                results[uri] = [_with_name(Track(uri=uri), local_path)]
                 continue
-            elif not local_path.is_dir():
-                logger.warning(
-                    "%s is not a directory. Please create the directory or "
-                    "update the file/media_dirs config value.",
-                    local_path,
+            _, stat = pending[uri]
+            if stat is not None:
+                indexed.append((uri, stat, result))
+            results[uri] = [result]
+
+        if indexed:
+            self._index.put_many(indexed)
+            if self._search_index is not None:
+                self._search_index.add(
+                    track
+                    for uri, _, track in indexed
+                    if self._tree.is_in_basedir(paths.uri_to_path(uri))
                 )
-                continue
+        return results
+
+    @override
+    def lookup(self, uri: Uri) -> list[Track]:
+        return self.lookup_many([uri])[uri]
 
-            if len(media_dir_split) == 2:
-                name = media_dir_split[1]
+    @override
+    def get_images(self, uris: Iterable[Uri]) -> dict[Uri, list[Image]]:
+        embedded: dict[Uri, list[Image]] = {}
+        dir_paths: dict[Uri, pathlib.Path] = {}
+        pending: dict[Uri, tuple[pathlib.Path, os.stat_result]] = {}
+
+        for uri in uris:
+            local_path = paths.uri_to_path(uri).resolve()
+            if not self._tree.is_in_basedir(local_path):
+                continue
+            try:
+                stat = local_path.stat()
+            except OSError:
+                continue
+            if local_path.is_dir():
+                dir_paths[uri] = local_path
+                embedded[uri] = []
+                continue
+            dir_paths[uri] = local_path.parent
+            images = self._index.get_images(uri, stat)
+            if images is None or not all(map(self._images.contains, images)):
+                pending[uri] = (local_path, stat)
             else:
-                # TODO: MPD client should accept `/` in dir name
-                name = media_dir_split[0].replace(os.sep, "+")
+                embedded[uri] = images
+        embedded.update(self._extract_images(pending))
+
+        folder_images = {
+            dir_path: self._get_folder_images(dir_path)
+            for dir_path in set(dir_paths.values())
+        }
+        return {
+            uri: [
+                thumbnail
+                for image in [*images, *folder_images[dir_paths[uri]]]
+                for thumbnail in self._images.with_thumbnails(image)
+            ]
+            for uri, images in embedded.items()
+        }
+
+    def _extract_images(
+        self,
+        files: dict[Uri, tuple[pathlib.Path, os.stat_result]],
+    ) -> dict[Uri, list[Image]]:
+        results: dict[Uri, list[Image]] = {}
+        for uri, result in self._scanner.scan_many(files).items():
+            images: list[Image] = []
+            results[uri] = images
+            if isinstance(result, exceptions.ScannerError):
+                logger.debug("Failed reading images from %s: %s", uri, result)
+                continue
+            for key in ("image", "preview-image"):
+                for data in result.tags.get(key, []):
+                    image = self._images.store(data)
+                    if image is not None and image not in images:
+                        images.append(image)
+            _, stat = files[uri]
+            self._index.put_images(uri, stat, images)
+        return results
+
+    def _queue_update(
+        self,
+        local_paths: list[pathlib.Path] | None,
+        message: str,
+    ) -> None:
+        if self._updater is None:
+            self._updater = IndexUpdater()
+            self._updater.start()
+        self._updater.submit(functools.partial(self._update, local_paths, message))
+
+    def _update(self, local_paths: list[pathlib.Path] | None, message: str) -> None:
+        # Runs in the updater thread, while the actor may keep using, or
+        # rebuilding, the search index.
+        search_index = self._search_index
+        stats = update_index(
+            self._tree,
+            self._index,
+            self._scanner,
+            local_paths,
+            search_index=search_index,
+        )
+        if self._search_index is not search_index:
+            # Rebuilt during the update, so it may lack some of the changes.
+            self._search_index = None
+        self._refresh_count += 1
+        logger.info(f"{message}: {stats}")
+
+    def _wait_for_updates(self) -> None:
+        if self._updater is not None:
+            self._updater.wait()
+
+    def _get_search_index(self) -> SearchIndex:
+        # The index is rebuilt if another process, like `mopidy file scan`,
+        # has updated the track index since we loaded it.
+        data_version = self._index.data_version
+        if self._search_index is None or self._search_index_version != data_version:
+            start = time.monotonic()
+            self._search_index = SearchIndex(
+                track
+                for media_dir in self._tree.media_dirs
+                for track in self._index.get_tracks(_get_uri_prefix(media_dir["path"]))
+            )
+            self._search_index_version = data_version
+            logger.info(
+                f"Loaded {len(self._search_index)} tracks into the search index "
+                f"in {time.monotonic() - start:.1f}s"
+            )
+        return self._search_index
 
-            yield MediaDir(path=local_path, name=name)
+    def _get_folder_images(self, dir_path: pathlib.Path) -> list[Image]:
+        try:
+            with os.scandir(dir_path) as dir_entries:
+                names = {entry.name.lower(): entry.name for entry in dir_entries}
+        except OSError:
+            return []
+        images = []
+        for candidate in FOLDER_IMAGE_NAMES:
+            if (name := names.get(candidate)) is None:
+                continue
+            local_path = dir_path / name
+            uri = paths.path_to_uri(local_path)
+            try:
+                stat = local_path.stat()
+                cached = self._index.get_images(uri, stat)
+                if cached is None or not all(map(self._images.contains, cached)):
+                    image = self._images.store(local_path.read_bytes())
+                    cached = [image] if image is not None else []
+                    self._index.put_images(uri, stat, cached)
+            except OSError as exc:
+                logger.debug(f"Failed reading {uri}: {exc}")
+                continue
+            images.extend(cached)
+        return images
+
+    def _get_root_directory(self) -> Ref | None:
+        if not self._tree.media_dirs:
+            return None
+        if len(self._tree.media_dirs) == 1:
+            uri = paths.path_to_uri(self._tree.media_dirs[0]["path"])
+        else:
+            uri = Uri("file:root")
+        return Ref.directory(name="Files", uri=uri)
 
     def _get_media_dirs_refs(self) -> Generator[Ref]:
-        for media_dir in self._media_dirs:
+        for media_dir in self._tree.media_dirs:
             yield Ref.directory(
                 name=media_dir["name"],
                 uri=paths.path_to_uri(media_dir["path"]),
             )
 
-    def _is_in_basedir(self, local_path: pathlib.Path) -> bool:
-        return any(
-            paths.is_path_inside_base_dir(local_path, media_dir["path"])
-            for media_dir in self._media_dirs
+
+class IndexUpdater(threading.Thread):
+    """Runs track index updates in a background thread, one at a time.
+
+    A full scan of a large library can take minutes, which is far too long to
+    block the backend actor. Running the updates in order also keeps manual
+    refreshes and the watcher's updates from scanning the same files at once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="FileIndexUpdater", daemon=True)
+        self._queue: queue.Queue[Callable[[], object] | None] = queue.Queue()
+        self._stopped = threading.Event()
+
+    def submit(self, update: Callable[[], object]) -> None:
+        """Queue an update to run after all earlier ones."""
+        self._queue.put(update)
+
+    def wait(self) -> None:
+        """Block until all queued updates are done."""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Stop the thread after the current update, dropping the rest."""
+        self._stopped.set()
+        self._queue.put(None)
+
+    @override
+    def run(self) -> None:
+        while (update := self._queue.get()) is not None:
+            try:
+                if not self._stopped.is_set():
+                    update()
+            except Exception:
+                logger.exception("Failed updating the file library")
+            finally:
+                self._queue.task_done()
+        self._queue.task_done()
+
+
+@dataclass
+class IndexStats:
+    """Summary of a track index update.
+
+    Attributes:
+        files: Number of files found in the media dirs.
+        scanned: Number of new or changed files that were scanned.
+        failed: Number of scanned files that couldn't be read as audio.
+        removed: Number of deleted files that were removed from the index.
+        scan_time: Seconds spent scanning files.
+        elapsed: Seconds spent in total, including walking the media dirs.
+    """
+
+    files: int = 0
+    scanned: int = 0
+    failed: int = 0
+    removed: int = 0
+    scan_time: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        """Number of scanned files per second spent scanning."""
+        if not self.scan_time:
+            return 0.0
+        return self.scanned / self.scan_time
+
+    @override
+    def __str__(self) -> str:
+        return (
+            f"{self.files} files, {self.scanned} scanned, {self.failed} failed, "
+            f"{self.removed} removed in {self.elapsed:.1f}s "
+            f"(walking {self.elapsed - self.scan_time:.1f}s, "
+            f"scanning {self.scan_time:.1f}s, {self.files_per_second:.1f} files/s)"
+        )
+
+
+# Number of files to scan before writing the results to the index.
+_SCAN_BATCH_SIZE = 100
+
+
+def update_index(  # noqa: C901, PLR0913
+    tree: MediaTree,
+    index: TrackIndex,
+    scanner: scan.Scanner,
+    local_paths: Iterable[pathlib.Path] | None = None,
+    *,
+    search_index: SearchIndex | None = None,
+    progress: Callable[[IndexStats], None] | None = None,
+) -> IndexStats:
+    """Bring the track index up to date with the files in the media dirs.
+
+    Only files that are new or have a different modification time or size
+    than when they were last indexed are scanned. Indexed files that are no
+    longer found are removed from the index.
+
+    Args:
+        tree: The media dirs to walk.
+        index: The track index to update.
+        scanner: The scanner to read file metadata with.
+        local_paths: Only update these directories or files, which may have
+            been deleted. Defaults to all media dirs.
+        search_index: Search index to apply the same changes to.
+        progress: Called with the current stats after each batch of scanned
+            files.
+    """
+    start = time.monotonic()
+    stats = IndexStats()
+
+    roots = (
+        [media_dir["path"] for media_dir in tree.media_dirs]
+        if local_paths is None
+        else list(local_paths)
+    )
+    known: dict[Uri, tuple[int, int]] = {}
+    for root in roots:
+        uri = paths.path_to_uri(root)
+        prefix = _get_uri_prefix(root)
+        known.update(
+            (indexed_uri, file_stats)
+            for indexed_uri, file_stats in index.get_file_stats(uri).items()
+            if indexed_uri == uri or indexed_uri.startswith(prefix)
+        )
+    seen: set[Uri] = set()
+
+    def changed_files() -> Generator[tuple[Uri, tuple[pathlib.Path, os.stat_result]]]:
+        for path, stat in tree.walk(roots):
+            uri = paths.path_to_uri(path)
+            if uri in seen:
+                continue
+            seen.add(uri)
+            stats.files += 1
+            if known.get(uri) != (stat.st_mtime_ns, stat.st_size):
+                yield uri, (path, stat)
+
+    for batch in itertools.batched(changed_files(), _SCAN_BATCH_SIZE, strict=False):
+        batch_start = time.monotonic()
+        files = dict(batch)
+        entries: list[tuple[Uri, os.stat_result, Track | None]] = []
+        for uri, result in _scan_tracks(scanner, files).items():
+            _, stat = files[uri]
+            if isinstance(result, exceptions.ScannerError):
+                logger.debug("Failed scanning %s: %s", uri, result)
+                stats.failed += 1
+                entries.append((uri, stat, None))
+            else:
+                entries.append((uri, stat, result))
+        index.put_many(entries)
+        if search_index is not None:
+            search_index.remove(uri for uri, _, track in entries if track is None)
+            search_index.add(track for _, _, track in entries if track is not None)
+        stats.scanned += len(files)
+        stats.scan_time += time.monotonic() - batch_start
+        if progress is not None:
+            progress(stats)
+
+    removed = known.keys() - seen
+    index.remove(removed)
+    if search_index is not None:
+        search_index.remove(removed)
+    stats.removed = len(removed)
+
+    stats.elapsed = time.monotonic() - start
+    return stats
+
+
+def _scan_tracks(
+    scanner: scan.Scanner,
+    files: Mapping[Uri, tuple[pathlib.Path, os.stat_result | None]],
+) -> dict[Uri, Track | exceptions.ScannerError]:
+    results: dict[Uri, Track | exceptions.ScannerError] = {}
+    for scanned_uri, result in scanner.scan_many(files).items():
+        uri = Uri(scanned_uri)
+        if isinstance(result, exceptions.ScannerError):
+            results[uri] = result
+            continue
+        local_path, stat = files[uri]
+        track = tags.convert_tags_to_track(
+            result.tags,
+            uri=uri,
+            length=result.duration,
+            last_modified=_mtime_ms(stat),
         )
+        results[uri] = _with_name(track, local_path)
+    return results
+
+
+def _get_uri_prefix(local_path: pathlib.Path) -> str:
+    return paths.path_to_uri(local_path).rstrip("/") + "/"
+
+
+def _get_search_prefixes(uris: Iterable[Uri]) -> Generator[str]:
+    for uri in uris:
+        if uri in ("file:", "file:root"):
+            # Matches all URIs
+            yield ""
+        else:
+            yield _get_uri_prefix(paths.uri_to_path(uri))
+
+
+def _with_name(track: Track, local_path: pathlib.Path) -> Track:
+    if track.name:
+        return track
+    return track.replace(name=local_path.name)
+
+
+def _mtime_ms(stat: os.stat_result | None) -> int | None:
+    if stat is None:
+        return None
+    return stat.st_mtime_ns // 1_000_000
@@ -0,0 +1,232 @@
+import logging
+import os
+import pathlib
+from collections.abc import Generator, Iterable
+from typing import NamedTuple, TypedDict, cast
+
+from mopidy import config as config_lib
+from mopidy._lib import paths
+
+from . import Extension
+from .types import FileConfig
+
+logger = logging.getLogger(__name__)
+
+
+# Number of directory listings to keep in the cache.
+_LISTING_CACHE_SIZE = 256
+
+
+class MediaDir(TypedDict):
+    path: pathlib.Path
+    name: str
+
+
+class MediaEntry(NamedTuple):
+    name: str
+    path: pathlib.Path
+    is_dir: bool
+
+
+class MediaTree:
+    """The files and directories below the configured media dirs.
+
+    Applies the `file/show_dotfiles`, `file/excluded_file_extensions`, and
+    `file/follow_symlinks` config values, and never leaves the media dirs.
+    """
+
+    def __init__(self, config: config_lib.Config) -> None:
+        ext_config = cast(FileConfig, config[Extension.ext_name])
+
+        self.media_dirs = list(get_media_dirs(config))
+        self._show_dotfiles = ext_config["show_dotfiles"]
+        self._excluded_file_extensions = tuple(
+            file_ext.lower() for file_ext in ext_config["excluded_file_extensions"]
+        )
+        self._follow_symlinks = ext_config["follow_symlinks"]
+        self._listings: dict[pathlib.Path, tuple[int, tuple[MediaEntry, ...]]] = {}
+
+    def is_in_basedir(self, local_path: pathlib.Path) -> bool:
+        return any(
+            paths.is_path_inside_base_dir(local_path, media_dir["path"])
+            for media_dir in self.media_dirs
+        )
+
+    def iterdir(self, local_path: pathlib.Path) -> tuple[MediaEntry, ...]:
+        """List the visible directories and files in a directory.
+
+        Listings are cached until the directory's modification time changes,
+        which happens whenever an entry is added, removed, or renamed.
+
+        Args:
+            local_path: The resolved path of the directory to list.
+        """
+        mtime = local_path.stat().st_mtime_ns
+        cached = self._listings.pop(local_path, None)
+        if cached is not None and cached[0] == mtime:
+            entries = cached[1]
+        else:
+            entries = tuple(self._scandir(local_path))
+        self._listings[local_path] = (mtime, entries)
+        if len(self._listings) > _LISTING_CACHE_SIZE:
+            del self._listings[next(iter(self._listings))]
+        return entries
+
+    def get_entry(self, local_path: pathlib.Path) -> MediaEntry | None:
+        """Get the entry for a path, if it is a visible directory or file.
+
+        Args:
+            local_path: The unresolved path, as found in its parent directory.
+        """
+        if self._is_excluded(local_path.name):
+            return None
+
+        child_path = local_path.resolve()
+
+        if local_path.is_symlink() and not self._follow_symlinks:
+            logger.debug("Ignoring symlink: %s", child_path)
+            return None
+
+        if not self.is_in_basedir(child_path):
+            logger.debug("Ignoring symlink to outside base dir: %s", child_path)
+            return None
+
+        if child_path.is_dir():
+            return MediaEntry(name=local_path.name, path=child_path, is_dir=True)
+        if child_path.is_file():
+            return MediaEntry(name=local_path.name, path=child_path, is_dir=False)
+        return None
+
+    def walk(
+        self,
+        local_paths: Iterable[pathlib.Path] | None = None,
+    ) -> Generator[tuple[pathlib.Path, os.stat_result]]:
+        """Yield all visible files below some paths, with their stat results.
+
+        Each directory is only visited once, even if it can be reached through
+        multiple symlinks. Directories that can't be read are logged and
+        skipped.
+
+        Args:
+            local_paths: The directories or files to walk. Paths that no
+                longer exist are ignored. Defaults to all media dirs.
+        """
+        for _, entries in self._walk(local_paths):
+            for entry in entries:
+                if entry.is_dir:
+                    continue
+                try:
+                    stat = entry.path.stat()
+                except OSError as exc:
+                    logger.warning(f"Failed reading {entry.path.as_uri()}: {exc}")
+                    continue
+                yield entry.path, stat
+
+    def walk_dirs(
+        self,
+        local_paths: Iterable[pathlib.Path] | None = None,
+    ) -> Generator[pathlib.Path]:
+        """Yield all visible directories below some paths, including themselves.
+
+        Args:
+            local_paths: The directories to walk. Defaults to all media dirs.
+        """
+        for dir_path, _ in self._walk(local_paths):
+            if dir_path is not None:
+                yield dir_path
+
+    def _walk(
+        self,
+        local_paths: Iterable[pathlib.Path] | None,
+    ) -> Generator[tuple[pathlib.Path | None, list[MediaEntry]]]:
+        if local_paths is None:
+            local_paths = [media_dir["path"] for media_dir in self.media_dirs]
+
+        # Yield any files among the given paths first, without a directory
+        pending: list[pathlib.Path] = []
+        files: list[MediaEntry] = []
+        for local_path in local_paths:
+            if local_path.is_dir():
+                pending.append(local_path.resolve())
+            elif (entry := self.get_entry(local_path)) is not None:
+                files.append(entry)
+        if files:
+            yield None, files
+        pending.reverse()
+
+        seen: set[pathlib.Path] = set()
+        while pending:
+            dir_path = pending.pop()
+            if dir_path in seen:
+                continue
+            seen.add(dir_path)
+            try:
+                entries = sorted(self._scandir(dir_path))
+            except OSError as exc:
+                logger.warning(f"Failed listing {dir_path.as_uri()}: {exc}")
+                continue
+            pending.extend(entry.path for entry in reversed(entries) if entry.is_dir)
+            yield dir_path, entries
+
+    def _scandir(self, local_path: pathlib.Path) -> Generator[MediaEntry]:
+        # The file type of each DirEntry comes with the directory listing, so
+        # only symlinks need extra syscalls to resolve and check them.
+        with os.scandir(local_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if self._is_excluded(dir_entry.name):
+                    continue
+                child_path = local_path / dir_entry.name
+                try:
+                    if dir_entry.is_symlink():
+                        if not self._follow_symlinks:
+                            logger.debug("Ignoring symlink: %s", child_path)
+                            continue
+                        child_path = child_path.resolve()
+                        if not self.is_in_basedir(child_path):
+                            logger.debug(
+                                "Ignoring symlink to outside base dir: %s",
+                                child_path,
+                            )
+                            continue
+                    if dir_entry.is_dir():
+                        yield MediaEntry(dir_entry.name, child_path, is_dir=True)
+                    elif dir_entry.is_file():
+                        yield MediaEntry(dir_entry.name, child_path, is_dir=False)
+                except OSError as exc:
+                    logger.debug(f"Failed reading {child_path.as_uri()}: {exc}")
+
+    def _is_excluded(self, name: str) -> bool:
+        if not self._show_dotfiles and name.startswith("."):
+            return True
+        return bool(
+            self._excluded_file_extensions
+            and pathlib.PurePath(name).suffix.lower() in self._excluded_file_extensions
+        )
+
+
+def get_media_dirs(config: config_lib.Config) -> Generator[MediaDir]:
+    for entry in config["file"]["media_dirs"]:
+        media_dir_split = entry.split("|", 1)
+        local_path = paths.expand_path(media_dir_split[0])
+
+        if local_path is None:
+            logger.debug(
+                "Failed expanding path (%s) from file/media_dirs config value.",
+                media_dir_split[0],
+            )
+            continue
+        elif not local_path.is_dir():
+            logger.warning(
+                "%s is not a directory. Please create the directory or "
+                "update the file/media_dirs config value.",
+                local_path,
+            )
+            continue
+
+        if len(media_dir_split) == 2:
+            name = media_dir_split[1]
+        else:
+            # TODO: MPD client should accept `/` in dir name
+            name = media_dir_split[0].replace(os.sep, "+")
+
+        yield MediaDir(path=local_path, name=name)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, get_args
+
+from mopidy.models import Album
+from mopidy.types import DistinctField
+
+if TYPE_CHECKING:
+    from mopidy.models import Track
+    from mopidy.types import Query, QueryValue, SearchField, Uri
+
+_FIELDS = (*get_args(DistinctField.__value__), "any")
+
+_INT_FIELDS = {"track_no", "disc_no"}
+
+# Fields that older clients may still use, mapped to their current names.
+_FIELD_ALIASES: dict[str, str] = {"track": "track_name"}
+
+
+class SearchIndex:
+    """In-memory inverted index of tracks.
+
+    For each search field, the index maps every distinct value to the URIs of
+    the tracks with that value. Exact matches are then a single dict lookup,
+    while substring matches only have to check each distinct value once,
+    instead of each track.
+
+    The index is safe to use from multiple threads.
+    """
+
+    def __init__(self, tracks: Iterable[Track] = ()) -> None:
+        self._lock = threading.RLock()
+        self._tracks: dict[Uri, Track] = {}
+        self._postings: dict[str, dict[QueryValue, set[Uri]]] = {
+            field: defaultdict(set) for field in _FIELDS
+        }
+        self._folded: dict[str, dict[QueryValue, str]] = {
+            field: {} for field in _FIELDS
+        }
+        self.add(tracks)
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __contains__(self, uri: object) -> bool:
+        return uri in self._tracks
+
+    def add(self, tracks: Iterable[Track]) -> None:
+        """Add or replace tracks in the index.
+
+        Args:
+            tracks: The tracks to index.
+        """
+        with self._lock:
+            for track in tracks:
+                if track.uri in self._tracks:
+                    self.remove([track.uri])
+                self._tracks[track.uri] = track
+                for field, values in _get_values(track).items():
+                    postings = self._postings[field]
+                    folded = self._folded[field]
+                    for value in values:
+                        postings[value].add(track.uri)
+                        if value not in folded:
+                            folded[value] = str(value).casefold()
+
+    def remove(self, uris: Iterable[Uri]) -> None:
+        """Remove tracks from the index.
+
+        Args:
+            uris: URIs of the tracks to remove. Unknown URIs are ignored.
+        """
+        with self._lock:
+            for uri in uris:
+                track = self._tracks.pop(uri, None)
+                if track is None:
+                    continue
+                for field, values in _get_values(track).items():
+                    postings = self._postings[field]
+                    for value in values:
+                        postings[value].discard(uri)
+                        if not postings[value]:
+                            del postings[value]
+                            del self._folded[field][value]
+
+    def search(
+        self,
+        query: Query[SearchField],
+        *,
+        exact: bool = False,
+    ) -> set[Uri]:
+        """Find the tracks matching all the values in the query.
+
+        Args:
+            query: Mapping of field names to the values to match.
+            exact: Match whole values exactly, instead of case-insensitive
+                substrings.
+
+        Returns:
+            The URIs of the matching tracks.
+        """
+        matches: list[set[Uri]] = []
+        with self._lock:
+            for field, values in query.items():
+                name = _FIELD_ALIASES.get(field, field)
+                if name not in self._postings:
+                    return set()
+                matches.extend(
+                    self._match(name, value, exact=exact) for value in values
+                )
+            if not matches:
+                return set(self._tracks)
+        matches.sort(key=len)
+        return set.intersection(*matches)
+
+    def get_tracks(self, uris: Iterable[Uri]) -> list[Track]:
+        """Get the indexed tracks with the given URIs.
+
+        Args:
+            uris: The track URIs. Unknown URIs are ignored.
+        """
+        with self._lock:
+            return [self._tracks[uri] for uri in uris if uri in self._tracks]
+
+    def get_distinct(
+        self,
+        field: DistinctField,
+        uris: set[Uri] | None = None,
+    ) -> set[QueryValue]:
+        """Get the distinct values of a field.
+
+        Args:
+            field: The field to get values for.
+            uris: Only include values from these tracks. Defaults to all
+                tracks.
+        """
+        name = _FIELD_ALIASES.get(field, field)
+        if name not in self._postings or name == "any":
+            return set()
+        with self._lock:
+            postings = self._postings[name]
+            if uris is None:
+                return set(postings)
+            if len(uris) < len(postings):
+                return {
+                    value
+                    for uri in uris
+                    if uri in self._tracks
+                    for value in _get_values(self._tracks[uri]).get(name, ())
+                }
+            return {value for value, matches in postings.items() if matches & uris}
+
+    def _match(self, field: str, value: QueryValue, *, exact: bool) -> set[Uri]:
+        postings = self._postings[field]
+        if field in _INT_FIELDS:
+            try:
+                value = int(value)
+            except ValueError:
+                return set()
+            return set(postings.get(value, ()))
+        if exact:
+            return set(postings.get(str(value), ()))
+        needle = str(value).casefold()
+        result: set[Uri] = set()
+        for candidate, folded in self._folded[field].items():
+            if needle in folded:
+                result |= postings[candidate]
+        return result
+
+
+def _get_values(track: Track) -> dict[str, set[QueryValue]]:
+    album = track.album or Album()
+    fields: dict[str, Iterable[object]] = {
+        "uri": [track.uri],
+        "track_name": [track.name],
+        "album": [album.name],
+        "artist": [artist.name for artist in track.artists],
+        "albumartist": [artist.name for artist in album.artists],
+        "composer": [artist.name for artist in track.composers],
+        "performer": [artist.name for artist in track.performers],
+        "track_no": [track.track_no],
+        "genre": [track.genre],
+        "date": [track.date],
+        "comment": [track.comment],
+        "disc_no": [track.disc_no],
+        "musicbrainz_albumid": [album.musicbrainz_id],
+        "musicbrainz_artistid": [
+            artist.musicbrainz_id for artist in (*track.artists, *album.artists)
+        ],
+        "musicbrainz_trackid": [track.musicbrainz_id],
+    }
+    values: dict[str, set[QueryValue]] = {}
+    for field, field_values in fields.items():
+        present = {
+            value if isinstance(value, int | str) else str(value)
+            for value in field_values
+            if value is not None and value != ""
+        }
+        if present:
+            values[field] = present
+    values["any"] = {
+        str(value) for field_values in values.values() for value in field_values
+    }
+    return values
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import pathlib
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    from .media import MediaTree
+
+logger = logging.getLogger(__name__)
+
+# Constants from <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Seconds without new events before a batch of changes is handled.
+DEBOUNCE_DELAY = 2.0
+
+# Max seconds to hold back changes during a continuous stream of events.
+MAX_DELAY = 30.0
+
+
+class Inotify:
+    """Minimal ctypes wrapper around the Linux inotify API."""
+
+    def __init__(self) -> None:
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise _os_error()
+
+    def add_watch(self, path: pathlib.Path, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise _os_error(path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> list[tuple[int, int, int, str]]:
+        """Read all pending events as tuples of wd, mask, cookie, and name."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, cookie, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class MediaWatcher(threading.Thread):
+    """Watches the media dirs for changes using inotify.
+
+    Changed paths are collected until no new events have arrived for
+    `DEBOUNCE_DELAY` seconds, so that e.g. copying an album into the media
+    dirs results in a single call to `on_change` with all the new files.
+
+    Args:
+        tree: The media dirs to watch.
+        on_change: Called from the watcher thread with the changed,
+            created, and deleted files and directories.
+    """
+
+    def __init__(
+        self,
+        tree: MediaTree,
+        on_change: Callable[[set[pathlib.Path]], object],
+    ) -> None:
+        super().__init__(name="FileWatcher", daemon=True)
+        self._tree = tree
+        self._on_change = on_change
+        self._inotify = Inotify()
+        self._watches: dict[int, pathlib.Path] = {}
+        self._changed: set[pathlib.Path] = set()
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def is_supported() -> bool:
+        return sys.platform.startswith("linux")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    @override
+    def run(self) -> None:
+        start = time.monotonic()
+        self._watch_dirs(None)
+        logger.info(
+            f"Watching {len(self._watches)} directories in the media dirs "
+            f"for changes, set up in {time.monotonic() - start:.1f}s"
+        )
+        try:
+            poll = select.poll()
+            poll.register(self._inotify.fd, select.POLLIN)
+            while not self._stop_event.is_set():
+                if poll.poll(self._get_timeout()):
+                    self._handle_events()
+                self._flush_if_settled()
+        finally:
+            self._inotify.close()
+
+    def _get_timeout(self) -> int:
+        if not self._changed:
+            return 1000
+        now = time.monotonic()
+        due = min(self._last_change + DEBOUNCE_DELAY, self._first_change + MAX_DELAY)
+        return max(0, min(1000, int((due - now) * 1000)))
+
+    def _watch_dirs(self, local_paths: list[pathlib.Path] | None) -> None:
+        for dir_path in self._tree.walk_dirs(local_paths):
+            try:
+                wd = self._inotify.add_watch(dir_path, _WATCH_MASK)
+            except OSError as exc:
+                if exc.errno == errno.ENOSPC:
+                    logger.warning(
+                        f"Failed watching {dir_path.as_uri()}: Too many watched "
+                        "directories. Increase fs.inotify.max_user_watches "
+                        "to watch all media dirs."
+                    )
+                    return
+                logger.debug(f"Failed watching {dir_path.as_uri()}: {exc}")
+                continue
+            self._watches[wd] = dir_path
+
+    def _handle_events(self) -> None:
+        for wd, mask, _, name in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("Missed media dir changes, rescanning all media dirs")
+                self._add_changes(
+                    {media_dir["path"] for media_dir in self._tree.media_dirs}
+                )
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if (dir_path := self._watches.get(wd)) is None:
+                continue
+            if mask & IN_MOVE_SELF:
+                # The directory now lives outside the path we know it by
+                self._inotify.rm_watch(wd)
+            path = dir_path / name if name else dir_path
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._watch_dirs([path])
+            if mask & IN_CREATE and not mask & IN_ISDIR:
+                # Wait for IN_CLOSE_WRITE before scanning new files
+                continue
+            self._add_changes({path})
+
+    def _add_changes(self, local_paths: set[pathlib.Path]) -> None:
+        now = time.monotonic()
+        if not self._changed:
+            self._first_change = now
+        self._last_change = now
+        self._changed |= local_paths
+
+    def _flush_if_settled(self) -> None:
+        if not self._changed:
+            return
+        now = time.monotonic()
+        if (
+            now - self._last_change < DEBOUNCE_DELAY
+            and now - self._first_change < MAX_DELAY
+        ):
+            return
+        changed = _remove_nested(self._changed)
+        self._changed = set()
+        logger.debug(f"Media dirs changed: {len(changed)} paths")
+        try:
+            self._on_change(changed)
+        except Exception:
+            logger.exception("Failed handling media dir changes")
+
+
+def _remove_nested(local_paths: set[pathlib.Path]) -> set[pathlib.Path]:
+    # Changes below a changed directory are covered by rescanning the directory
+    return {
+        path
+        for path in local_paths
+        if not any(parent in local_paths for parent in path.parents)
+    }
+
+
+def _os_error(path: pathlib.Path | None = None) -> OSError:
+    error = ctypes.get_errno()
+    return OSError(error, os.strerror(error), path)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, override
+
+import tornado.ioloop
+import tornado.web
+
+from . import Extension
+from .images import ImageCache
+
+if TYPE_CHECKING:
+    import datetime
+
+    from mopidy._exts.http.types import RequestRule
+    from mopidy.config import Config
+    from mopidy.core import CoreProxy
+
+
+def image_app_factory(
+    config: Config,
+    core: CoreProxy,  # noqa: ARG001
+) -> list[RequestRule]:
+    path = Extension.get_cache_dir(config) / "images"
+
+    class Handler(ImageHandler):
+        cache = ImageCache(path)
+
+    return [(r"/images/(.+)", Handler, {"path": str(path)})]
+
+
+class ImageHandler(tornado.web.StaticFileHandler):
+    """Serves images from the image cache, creating thumbnails on demand.
+
+    Subclasses set `cache` to the cache that `path` belongs to.
+    """
+
+    cache: ClassVar[ImageCache]
+
+    @override
+    async def get(self, path: str, include_body: bool = True) -> None:
+        # Resizing blocks while GStreamer runs, so keep it off the IO loop
+        exists = await tornado.ioloop.IOLoop.current().run_in_executor(
+            None, self.cache.ensure, path
+        )
+        if not exists:
+            raise tornado.web.HTTPError(404)
+        await super().get(path, include_body)
+
+    @override
+    def get_cache_time(
+        self,
+        path: str,
+        modified: datetime.datetime | None,
+        mime_type: str,
+    ) -> int:
+        # Images are named by their content, so they never change
+        return self.CACHE_MAX_AGE
@@ -15,7 +15,7 @@ import tornado.websocket
 import mopidy
 from mopidy import core
 
-from . import jsonrpc
+from . import jsonrpc, metrics
 from .types import HttpConfig
 
 if TYPE_CHECKING:
@@ -60,6 +60,13 @@ def make_mopidy_app_factory(
                     "csrf_protection": http_config["csrf_protection"],
                 },
             ),
+            (
+                r"/metrics",
+                MetricsHandler,
+                {
+                    "core": core,
+                },
+            ),
             (
                 r"/(.+)",
                 StaticFileHandler,
@@ -83,6 +90,7 @@ def make_mopidy_app_factory(
 def make_jsonrpc_wrapper(core_actor: CoreProxy) -> jsonrpc.Wrapper:
     inspector = jsonrpc.Inspector(
         objects={
+            "core.get_actor_stats": core.Core.get_actor_stats,
             "core.get_uri_schemes": core.Core.get_uri_schemes,
             "core.get_version": core.Core.get_version,
             "core.history": core.HistoryController,
@@ -96,6 +104,7 @@ def make_jsonrpc_wrapper(core_actor: CoreProxy) -> jsonrpc.Wrapper:
     return jsonrpc.Wrapper(
         objects={
             "core.describe": inspector.describe,
+            "core.get_actor_stats": core_actor.get_actor_stats,
             "core.get_uri_schemes": core_actor.get_uri_schemes,
             "core.get_version": core_actor.get_version,
             "core.history": core_actor.history,
@@ -105,6 +114,7 @@ def make_jsonrpc_wrapper(core_actor: CoreProxy) -> jsonrpc.Wrapper:
             "core.playlists": core_actor.playlists,
             "core.tracklist": core_actor.tracklist,
         },
+        request_durations=metrics.jsonrpc_request_durations,
     )
 
 
@@ -123,6 +133,8 @@ def _send_broadcast(
             f"{client.request.remote_ip} failed: {exc}",
         )
         # TODO: should this do the same cleanup as the on_message code?
+    finally:
+        metrics.pending_broadcasts.add(-1)
 
 
 class WebSocketHandler(tornado.websocket.WebSocketHandler):
@@ -141,6 +153,7 @@ class WebSocketHandler(tornado.websocket.WebSocketHandler):
         # safely cross the thread boundary by adding a callback to the loop.
         for client in cls.clients.copy():
             # One callback per client to keep time we hold up the loop short
+            metrics.pending_broadcasts.add(1)
             io_loop.add_callback(functools.partial(_send_broadcast, client, msg))
 
     def initialize(
@@ -292,6 +305,38 @@ class JsonRpcHandler(tornado.web.RequestHandler):
         self.finish()
 
 
+class MetricsHandler(tornado.web.RequestHandler):
+    def initialize(self, core: CoreProxy) -> None:  # ty:ignore[invalid-method-override]
+        self.core = core
+
+    def get(self) -> Awaitable[None] | None:  # ty:ignore[invalid-method-override]
+        set_mopidy_headers(self)
+        self.set_header("Content-Type", metrics.CONTENT_TYPE)
+
+        # Send all requests to core before waiting for any of the results
+        playback_state = self.core.playback.get_state()
+        tracklist_length = self.core.tracklist.get_length()
+        tracklist_version = self.core.tracklist.get_version()
+        actor_stats = self.core.get_actor_stats()
+
+        self.write(
+            metrics.format_metrics(
+                [
+                    *metrics.get_core_metrics(
+                        playback_state=playback_state.get(),
+                        tracklist_length=tracklist_length.get(),
+                        tracklist_version=tracklist_version.get(),
+                    ),
+                    *metrics.get_http_metrics(
+                        websocket_clients=len(WebSocketHandler.clients),
+                    ),
+                    *metrics.get_audio_metrics(),
+                    *metrics.get_actor_metrics(actor_stats.get()),
+                ]
+            )
+        )
+
+
 class ClientListHandler(tornado.web.RequestHandler):
     def initialize(self, apps: list[HttpApp], statics: list[HttpStatic]) -> None:  # ty:ignore[invalid-method-override]
         self.apps = apps
@@ -1,4 +1,5 @@
 import inspect
+import time
 import traceback
 from collections.abc import Callable
 from typing import Any, Literal
@@ -18,6 +19,7 @@ from pydantic import (
 from pydantic_core import PydanticUndefined, PydanticUndefinedType
 
 from mopidy import models
+from mopidy._lib.metrics import Summary
 
 MODEL_MAP: dict[str, type[BaseModel]] = {
     name: getattr(models, name) for name in models.__all__
@@ -181,16 +183,20 @@ class Wrapper:
     Args:
         objects: Mapping between mounting points and exposed functions or
             class instances.
+        request_durations: Summary to record the time taken by each call
+            in, by method name. Calls to unknown methods are not recorded.
     """
 
     def __init__(
         self,
         objects: dict[str, Any],
+        request_durations: Summary | None = None,
     ) -> None:
         if "" in objects:
             msg = "The empty string is not allowed as an object mount"
             raise AttributeError(msg)
         self.objects = objects
+        self.request_durations = request_durations
 
     def handle_json(self, request_json: str | bytes) -> bytes | None:
         """Handles an incoming request encoded as a JSON string.
@@ -252,6 +258,7 @@ class Wrapper:
 
         try:
             method = self._get_method(request.method)
+            started = time.monotonic()
 
             try:
                 result = method(*request.args, **request.kwargs)
@@ -282,6 +289,12 @@ class Wrapper:
                         "traceback": traceback.format_exc(),
                     },
                 ) from exc
+            finally:
+                if self.request_durations is not None:
+                    self.request_durations.observe(
+                        request.method,
+                        time.monotonic() - started,
+                    )
         except JsonRpcError as exc:
             if request.id is None:
                 # Request is a notification, so we don't need to respond
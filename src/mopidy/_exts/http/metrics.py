@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from mopidy._lib.metrics import Gauge, Summary, buffering_percent, scan_durations
+from mopidy.types import PlaybackState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mopidy.core import ActorStats
+
+# Content type of the Prometheus text exposition format.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Durations of JSON-RPC calls over HTTP and WebSocket, by method name.
+jsonrpc_request_durations = Summary()
+
+# Number of WebSocket broadcast messages waiting to be sent to clients.
+pending_broadcasts = Gauge()
+
+
+class Sample(NamedTuple):
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+class Metric(NamedTuple):
+    name: str
+    type: Literal["counter", "gauge", "summary"]
+    help: str
+    samples: list[Sample]
+
+
+def format_metrics(metrics: Iterable[Metric]) -> str:
+    """Format metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: The metrics to format. Metrics without samples are left out.
+    """
+    lines: list[str] = []
+    for metric in metrics:
+        if not metric.samples:
+            continue
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        lines.extend(
+            f"{sample.name}{_format_labels(sample.labels)} {sample.value}"
+            for sample in metric.samples
+        )
+    return "".join(f"{line}\n" for line in lines)
+
+
+def get_core_metrics(
+    *,
+    playback_state: PlaybackState,
+    tracklist_length: int,
+    tracklist_version: int,
+) -> list[Metric]:
+    """Get metrics for the state of core.
+
+    Args:
+        playback_state: The result of `core.playback.get_state()`.
+        tracklist_length: The result of `core.tracklist.get_length()`.
+        tracklist_version: The result of `core.tracklist.get_version()`.
+    """
+    return [
+        _gauge(
+            "mopidy_playback_state",
+            "Whether playback is in the given state.",
+            [
+                ({"state": state.value}, int(state == playback_state))
+                for state in PlaybackState
+            ],
+        ),
+        _gauge(
+            "mopidy_tracklist_length",
+            "Number of tracks in the tracklist.",
+            [({}, tracklist_length)],
+        ),
+        _gauge(
+            "mopidy_tracklist_version",
+            "Version of the tracklist, increased on every change.",
+            [({}, tracklist_version)],
+        ),
+    ]
+
+
+def get_http_metrics(*, websocket_clients: int) -> list[Metric]:
+    """Get metrics for the HTTP server.
+
+    Args:
+        websocket_clients: The number of connected WebSocket clients.
+    """
+    return [
+        _summary(
+            "mopidy_jsonrpc_request_duration_seconds",
+            "Time taken by JSON-RPC calls.",
+            "method",
+            jsonrpc_request_durations,
+        ),
+        _gauge(
+            "mopidy_websocket_clients",
+            "Number of connected WebSocket clients.",
+            [({}, websocket_clients)],
+        ),
+        _gauge(
+            "mopidy_websocket_pending_broadcasts",
+            "Number of broadcast messages waiting to be sent to WebSocket clients.",
+            [({}, pending_broadcasts.get() or 0)],
+        ),
+    ]
+
+
+def get_audio_metrics() -> list[Metric]:
+    """Get metrics for the audio scanner and playback."""
+    buffering = buffering_percent.get()
+    return [
+        _summary(
+            "mopidy_scan_duration_seconds",
+            "Time taken by audio scans of URIs.",
+            "scheme",
+            scan_durations,
+        ),
+        _gauge(
+            "mopidy_audio_buffering_percent",
+            "Last buffering percentage reported by GStreamer.",
+            [] if buffering is None else [({}, buffering)],
+        ),
+    ]
+
+
+def get_actor_metrics(stats: list[ActorStats]) -> list[Metric]:
+    """Get metrics for the actor statistics returned by core.
+
+    Args:
+        stats: The result of `core.get_actor_stats()`.
+    """
+    calls = Metric(
+        "mopidy_actor_calls_total",
+        "counter",
+        "Number of calls handled by the actor.",
+        [],
+    )
+    wait_time = Metric(
+        "mopidy_actor_call_wait_seconds_total",
+        "counter",
+        "Time calls spent waiting in the actor's inbox.",
+        [],
+    )
+    run_time = Metric(
+        "mopidy_actor_call_run_seconds_total",
+        "counter",
+        "Time the actor spent running calls.",
+        [],
+    )
+    depth = Metric(
+        "mopidy_actor_mailbox_depth",
+        "gauge",
+        "Number of calls waiting in the actor's inbox.",
+        [],
+    )
+    max_depth = Metric(
+        "mopidy_actor_mailbox_depth_max",
+        "gauge",
+        "Highest number of calls waiting in the actor's inbox.",
+        [],
+    )
+    for actor in stats:
+        labels = {"actor": actor["actor"]}
+        depth.samples.append(Sample(depth.name, labels, actor["mailbox_depth"]))
+        max_depth.samples.append(
+            Sample(max_depth.name, labels, actor["max_mailbox_depth"])
+        )
+        for method in actor["methods"]:
+            method_labels = {**labels, "method": method["method"]}
+            calls.samples.append(Sample(calls.name, method_labels, method["calls"]))
+            wait_time.samples.append(
+                Sample(wait_time.name, method_labels, method["wait_time"])
+            )
+            run_time.samples.append(
+                Sample(run_time.name, method_labels, method["run_time"])
+            )
+    return [calls, wait_time, run_time, depth, max_depth]
+
+
+def _gauge(
+    name: str,
+    help_text: str,
+    values: list[tuple[dict[str, str], float]],
+) -> Metric:
+    return Metric(
+        name,
+        "gauge",
+        help_text,
+        [Sample(name, labels, value) for labels, value in values],
+    )
+
+
+def _summary(name: str, help_text: str, label: str, summary: Summary) -> Metric:
+    samples: list[Sample] = []
+    for value, (count, total) in sorted(summary.collect().items()):
+        samples.append(Sample(f"{name}_count", {label: value}, count))
+        samples.append(Sample(f"{name}_sum", {label: value}, total))
+    return Metric(name, "summary", help_text, samples)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
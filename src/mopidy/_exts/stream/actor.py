@@ -3,6 +3,7 @@ import logging
 import re
 import time
 import urllib.parse
+from collections.abc import Iterable
 from typing import override
 
 import httpx
@@ -65,6 +66,42 @@ class StreamBackend(pykka.ThreadingActor, backend.Backend):
 class StreamLibraryProvider(backend.LibraryProvider):
     backend: StreamBackend
 
+    @override
+    def lookup_many(self, uris: Iterable[Uri]) -> dict[Uri, list[Track]]:
+        results: dict[Uri, list[Track]] = {}
+        to_scan = []
+        for uri in uris:
+            if urllib.parse.urlsplit(uri).scheme not in self.backend.uri_schemes:
+                results[uri] = []
+            elif self.backend._blacklist_re.match(uri):
+                logger.debug("URI matched metadata lookup blacklist: %s", uri)
+                results[uri] = [Track(uri=uri)]
+            else:
+                to_scan.append(uri)
+
+        # Scan all URIs in parallel first. Only the URIs that turn out to not
+        # be playable streams, e.g. playlists, need to be unwrapped one by one.
+        scan_results = self.backend._scanner.scan_many(
+            to_scan,
+            timeout=self.backend._timeout,
+        )
+        for uri in to_scan:
+            scan_result = scan_results[uri]
+            if isinstance(scan_result, scan._Result) and _is_stream(scan_result):
+                results[uri] = [
+                    tags.convert_tags_to_track(
+                        scan_result.tags,
+                        uri=uri,
+                        length=scan_result.duration,
+                    )
+                ]
+            else:
+                # Unwrap playlists from the scan we already did, so that
+                # URIs that failed scanning aren't scanned again.
+                results[uri] = [self._unwrap_track(uri, scan_result)]
+
+        return results
+
     @override
     def lookup(self, uri: Uri) -> list[Track]:
         if urllib.parse.urlsplit(uri).scheme not in self.backend.uri_schemes:
@@ -74,11 +111,19 @@ class StreamLibraryProvider(backend.LibraryProvider):
             logger.debug("URI matched metadata lookup blacklist: %s", uri)
             return [Track(uri=uri)]
 
+        return [self._unwrap_track(uri)]
+
+    def _unwrap_track(
+        self,
+        uri: Uri,
+        first_scan: scan._Result | exceptions.ScannerError | None = None,
+    ) -> Track:
         _, scan_result = _unwrap_stream(
             uri,
             timeout=self.backend._timeout,
             scanner=self.backend._scanner,
             http_client=self.backend._http_client,
+            first_scan=first_scan,
         )
 
         if scan_result:
@@ -91,12 +136,15 @@ class StreamLibraryProvider(backend.LibraryProvider):
             logger.warning("Problem looking up %s", uri)
             track = Track(uri=uri)
 
-        return [track]
+        return track
 
 
 class StreamPlaybackProvider(backend.PlaybackProvider):
     backend: StreamBackend
 
+    # Unwrapping playlists can take seconds, so do it before it is needed.
+    prepare_next_uri = True
+
     @override
     def translate_uri(self, uri: Uri) -> Uri | None:
         if urllib.parse.urlsplit(uri).scheme not in self.backend.uri_schemes:
@@ -115,16 +163,29 @@ class StreamPlaybackProvider(backend.PlaybackProvider):
         return unwrapped_uri
 
 
+def _is_stream(scan_result: scan._Result) -> bool:
+    has_interesting_mime = (
+        scan_result.mime is not None
+        and not scan_result.mime.startswith("text/")
+        and not scan_result.mime.startswith("application/")
+    )
+    return scan_result.playable or has_interesting_mime
+
+
 def _unwrap_stream(  # noqa: PLR0911  # TODO: cleanup the return value of this.
     uri: Uri,
     timeout: float,
     scanner: scan.Scanner,
     http_client: httpx.Client,
+    first_scan: scan._Result | exceptions.ScannerError | None = None,
 ) -> tuple[Uri | None, scan._Result | None]:
     """Get a stream URI from a playlist URI, `uri`.
 
     Unwraps nested playlists until something that's not a playlist is found or
     the `timeout` is reached.
+
+    If `uri` has already been scanned, its scan result, or the error raised
+    while scanning it, can be given as `first_scan` to not scan it again.
     """
     original_uri = uri
     seen_uris = set()
@@ -142,29 +203,20 @@ def _unwrap_stream(  # noqa: PLR0911  # TODO: cleanup the return value of this.
 
         logger.debug("Unwrapping stream from URI: %s", uri)
 
-        try:
-            scan_timeout = deadline - time.time()
-            if scan_timeout < 0:
-                logger.info(
-                    "Unwrapping stream from URI (%s) failed: timed out in %sms",
-                    uri,
-                    timeout,
-                )
-                return None, None
-            scan_result = scanner.scan(uri, timeout=scan_timeout)
-        except exceptions.ScannerError as exc:
-            logger.debug("GStreamer failed scanning URI (%s): %s", uri, exc)
-            scan_result = None
-
-        if scan_result is not None:
-            has_interesting_mime = (
-                scan_result.mime is not None
-                and not scan_result.mime.startswith("text/")
-                and not scan_result.mime.startswith("application/")
+        scan_timeout = deadline - time.time()
+        if scan_timeout < 0:
+            logger.info(
+                "Unwrapping stream from URI (%s) failed: timed out in %sms",
+                uri,
+                timeout,
             )
-            if scan_result.playable or has_interesting_mime:
-                logger.debug("Unwrapped potential %s stream: %s", scan_result.mime, uri)
-                return uri, scan_result
+            return None, None
+        scan_result = _scan_or_reuse(uri, scanner, scan_timeout, first_scan)
+        first_scan = None
+
+        if scan_result is not None and _is_stream(scan_result):
+            logger.debug("Unwrapped potential %s stream: %s", scan_result.mime, uri)
+            return uri, scan_result
 
         download_timeout = deadline - time.time()
         if download_timeout < 0:
@@ -198,3 +250,22 @@ def _unwrap_stream(  # noqa: PLR0911  # TODO: cleanup the return value of this.
         uri = Uri(urllib.parse.urljoin(uri, new_uri))
 
     return None, None
+
+
+def _scan_or_reuse(
+    uri: Uri,
+    scanner: scan.Scanner,
+    timeout: float,
+    first_scan: scan._Result | exceptions.ScannerError | None,
+) -> scan._Result | None:
+    """Scan `uri`, unless `first_scan` already holds the result of doing so."""
+    scan_result = first_scan
+    if scan_result is None:
+        try:
+            scan_result = scanner.scan(uri, timeout=timeout)
+        except exceptions.ScannerError as exc:
+            scan_result = exc
+    if isinstance(scan_result, exceptions.ScannerError):
+        logger.debug("GStreamer failed scanning URI (%s): %s", uri, scan_result)
+        return None
+    return scan_result
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import queue
+import time
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import pykka
+from pykka.messages import ProxyCall, ProxyGetAttr, ProxySetAttr
+
+if TYPE_CHECKING:
+    from pykka._envelope import Envelope
+
+
+class ActorMethodStats(TypedDict):
+    method: str
+    calls: int
+    wait_time: float
+    run_time: float
+
+
+class ActorStats(TypedDict):
+    actor: str
+    mailbox_depth: int
+    max_mailbox_depth: int
+    methods: list[ActorMethodStats]
+
+
+class _MethodStats:
+    __slots__ = ("calls", "run_time", "wait_time")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+
+
+class _TimedInbox(queue.Queue["Envelope[Any]"]):
+    """Actor inbox recording how long messages wait and run, by method.
+
+    Messages are timestamped when they are put in the inbox. A message is
+    considered running from when the actor gets it from the inbox until the
+    actor asks for the next message. The statistics are guarded by the
+    queue's own mutex, so they can be read from any thread.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.max_depth = 0
+        self.methods: dict[str, _MethodStats] = {}
+        self._running: tuple[_MethodStats, float] | None = None
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Envelope[Any]:
+        # Only the actor's own thread gets messages from its inbox.
+        if self._running is not None:
+            stats, started = self._running
+            self._running = None
+            with self.mutex:
+                stats.run_time += time.monotonic() - started
+        return super().get(block, timeout)
+
+    def _put(self, item: Envelope[Any]) -> None:
+        self.queue.append((time.monotonic(), item))
+        self.max_depth = max(self.max_depth, len(self.queue))
+
+    def _get(self) -> Envelope[Any]:
+        put_at, item = self.queue.popleft()
+        now = time.monotonic()
+        name = _get_method_name(item.message)
+        if (stats := self.methods.get(name)) is None:
+            stats = self.methods[name] = _MethodStats()
+        stats.calls += 1
+        stats.wait_time += now - put_at
+        self._running = (stats, now)
+        return item
+
+
+# The inbox factory of pykka's ThreadingActor, while it is replaced.
+_original_inbox_factory: Any = None
+
+
+def enable() -> None:
+    """Record statistics for the inboxes of all actors started from now on.
+
+    Actors that are already running are not affected, so this should be
+    called before any actors are started.
+
+    This replaces the inbox factory of pykka's `ThreadingActor`, which is
+    not part of pykka's public API, until [disable][] is called.
+    """
+    global _original_inbox_factory  # noqa: PLW0603
+    if _original_inbox_factory is not None:
+        return
+    _original_inbox_factory = pykka.ThreadingActor.__dict__["_create_actor_inbox"]
+    pykka.ThreadingActor._create_actor_inbox = staticmethod(_TimedInbox)  # ty:ignore[invalid-assignment]
+
+
+def disable() -> None:
+    """Stop recording statistics for actors started from now on.
+
+    Restores pykka's own inbox factory. Actors that are already running keep
+    recording statistics until they stop.
+    """
+    global _original_inbox_factory  # noqa: PLW0603
+    if _original_inbox_factory is None:
+        return
+    pykka.ThreadingActor._create_actor_inbox = _original_inbox_factory  # ty:ignore[invalid-assignment]
+    _original_inbox_factory = None
+
+
+def get_stats() -> list[ActorStats]:
+    """Get the statistics of all running actors with recorded statistics.
+
+    Returns a list with one dict per actor, with the actor's class name as
+    `actor`, the number of messages currently waiting in its inbox as
+    `mailbox_depth`, and the highest number of waiting messages since the
+    actor started as `max_mailbox_depth`. The `methods` list has the number
+    of `calls`, and the total `wait_time` in the inbox and `run_time` in
+    seconds, for each method called on the actor.
+    """
+    result: list[ActorStats] = []
+    for ref in pykka.ActorRegistry.get_all():
+        inbox = ref.actor_inbox
+        if not isinstance(inbox, _TimedInbox):
+            continue
+        with inbox.mutex:
+            result.append(
+                ActorStats(
+                    actor=ref.actor_class.__name__,
+                    mailbox_depth=len(inbox.queue),
+                    max_mailbox_depth=inbox.max_depth,
+                    methods=[
+                        ActorMethodStats(
+                            method=name,
+                            calls=stats.calls,
+                            wait_time=stats.wait_time,
+                            run_time=stats.run_time,
+                        )
+                        for name, stats in sorted(inbox.methods.items())
+                    ],
+                )
+            )
+    return result
+
+
+def _get_method_name(message: object) -> str:
+    if isinstance(message, ProxyCall | ProxyGetAttr | ProxySetAttr):
+        return ".".join(message.attr_path)
+    return type(message).__name__
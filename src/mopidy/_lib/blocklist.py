@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import overload
+
+# Blocks are split when they grow beyond twice this size, and merged with a
+# neighbor when they shrink below half of it.
+DEFAULT_BLOCK_SIZE = 256
+
+
+class BlockList[T, K: Hashable]:
+    """A list split into blocks, for cheap inserts, deletes, and lookups.
+
+    Items are stored in a list of blocks of up to `2 * block_size` items each.
+    Inserting or deleting a run of items only copies the affected blocks, and
+    the position of an item is found from its key without scanning the whole
+    list. For a list of n items and a block size of B, this makes these
+    operations O(n/B + B) instead of O(n), as the block offsets are rebuilt
+    after each change. The block size is fixed, so this is close to
+    O(sqrt n) for lists of around B² items, and grows linearly, but with a
+    much smaller constant than a regular list, for longer lists.
+
+    Indexing, slicing, and iteration work like for a regular list.
+
+    Args:
+        items: The initial items.
+        key: Function returning a unique key for an item.
+        block_size: The target number of items per block.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        *,
+        key: Callable[[T], K],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        self._key = key
+        self._block_size = block_size
+        self._blocks: list[list[T]] = []
+        self._block_of: dict[K, list[T]] = {}
+        self._len = 0
+
+        # The position of the first item in each block, and the index of each
+        # block, by the block's id(). Both are rebuilt on demand.
+        self._offsets: list[int] | None = None
+        self._block_indexes: dict[int, int] | None = None
+
+        self.insert(0, items)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __repr__(self) -> str:
+        return f"BlockList({list(self)!r})"
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return list(self)[index]
+            return self._get_range(start, stop)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            msg = "BlockList index out of range"
+            raise IndexError(msg)
+        block, inner = self._locate(index)
+        return self._blocks[block][inner]
+
+    def contains_key(self, key: K) -> bool:
+        """Check if the list contains an item with the given key."""
+        return key in self._block_of
+
+    def index_of_key(self, key: K) -> int | None:
+        """Get the position of the item with the given key.
+
+        Returns `None` if there is no such item.
+        """
+        block = self._block_of.get(key)
+        if block is None:
+            return None
+        offset = self._get_offsets()[self._get_block_indexes()[id(block)]]
+        return offset + list(map(self._key, block)).index(key)
+
+    def insert(self, index: int, items: Iterable[T]) -> None:
+        """Insert items before the given position.
+
+        Like `list.insert()`, positions past the end append the items, and
+        negative positions count from the end.
+        """
+        items = list(items)
+        if not items:
+            return
+        if index < 0:
+            index = max(0, index + self._len)
+        index = min(index, self._len)
+
+        if not self._blocks:
+            self._blocks.append([])
+            self._block_indexes = None
+        block_index, inner = self._locate(index)
+        block = self._blocks[block_index]
+        block[inner:inner] = items
+        for item in items:
+            self._block_of[self._key(item)] = block
+        self._len += len(items)
+        self._offsets = None
+
+        if len(block) > 2 * self._block_size:
+            self._split(block_index)
+
+    def delete(self, start: int | None, stop: int | None) -> list[T]:
+        """Delete the items in the slice `[start:stop]`.
+
+        Returns the deleted items.
+        """
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if start >= stop:
+            return []
+
+        first, inner = self._locate(start)
+        last = first
+        removed: list[T] = []
+        while len(removed) < stop - start:
+            block = self._blocks[last]
+            end = min(len(block), inner + stop - start - len(removed))
+            removed.extend(block[inner:end])
+            del block[inner:end]
+            last += 1
+            inner = 0
+
+        for item in removed:
+            del self._block_of[self._key(item)]
+        self._len -= len(removed)
+        self._compact(first, last)
+        return removed
+
+    def remove_keys(self, keys: Iterable[K]) -> None:
+        """Remove the items with the given keys. Unknown keys are ignored."""
+        keys = {key for key in keys if key in self._block_of}
+        if not keys:
+            return
+
+        blocks = {id(self._block_of[key]): self._block_of[key] for key in keys}
+        for block in blocks.values():
+            block[:] = [item for item in block if self._key(item) not in keys]
+        for key in keys:
+            del self._block_of[key]
+        self._len -= len(keys)
+
+        block_indexes = self._get_block_indexes()
+        affected = [block_indexes[block_id] for block_id in blocks]
+        self._compact(min(affected), max(affected) + 1)
+
+    def replace(self, items: Iterable[T]) -> None:
+        """Replace the items with the same keys, keeping their positions.
+
+        Items with unknown keys are ignored.
+        """
+        for item in items:
+            key = self._key(item)
+            block = self._block_of.get(key)
+            if block is not None:
+                block[list(map(self._key, block)).index(key)] = item
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._blocks = []
+        self._block_of = {}
+        self._len = 0
+        self._offsets = None
+        self._block_indexes = None
+
+    def _get_range(self, start: int, stop: int) -> list[T]:
+        if start >= stop:
+            return []
+        block_index, inner = self._locate(start)
+        result: list[T] = []
+        while len(result) < stop - start:
+            block = self._blocks[block_index]
+            result.extend(block[inner : inner + stop - start - len(result)])
+            block_index += 1
+            inner = 0
+        return result
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        # Find the block and the position within the block of a position in
+        # the list. The end of the list is located at the end of the last
+        # block.
+        if index >= self._len:
+            last = len(self._blocks) - 1
+            return last, len(self._blocks[last])
+        offsets = self._get_offsets()
+        block_index = bisect.bisect_right(offsets, index) - 1
+        return block_index, index - offsets[block_index]
+
+    def _get_offsets(self) -> list[int]:
+        if self._offsets is None:
+            self._offsets = [
+                0,
+                *itertools.accumulate(len(block) for block in self._blocks[:-1]),
+            ]
+        return self._offsets
+
+    def _get_block_indexes(self) -> dict[int, int]:
+        if self._block_indexes is None:
+            self._block_indexes = {
+                id(block): index for index, block in enumerate(self._blocks)
+            }
+        return self._block_indexes
+
+    def _split(self, block_index: int) -> None:
+        # Keep the first chunk in the existing block, so that only the items
+        # moved to new blocks need to be remapped.
+        block = self._blocks[block_index]
+        size = self._block_size
+        chunks = [block[i : i + size] for i in range(size, len(block), size)]
+        del block[size:]
+        for chunk in chunks:
+            for item in chunk:
+                self._block_of[self._key(item)] = chunk
+        self._blocks[block_index + 1 : block_index + 1] = chunks
+        self._offsets = None
+        self._block_indexes = None
+
+    def _compact(self, start: int, stop: int) -> None:
+        # Drop emptied blocks, and merge small blocks with their neighbors,
+        # among the blocks in [start:stop] and the blocks next to them.
+        start = max(0, start - 1)
+        stop = min(len(self._blocks), stop + 1)
+        min_size = self._block_size // 2
+        max_size = 2 * self._block_size
+
+        blocks: list[list[T]] = []
+        for block in self._blocks[start:stop]:
+            if not block:
+                continue
+            if (
+                blocks
+                and min(len(blocks[-1]), len(block)) < min_size
+                and len(blocks[-1]) + len(block) <= max_size
+            ):
+                blocks[-1].extend(block)
+                for item in block:
+                    self._block_of[self._key(item)] = blocks[-1]
+                continue
+            blocks.append(block)
+
+        self._blocks[start:stop] = blocks
+        self._offsets = None
+        self._block_indexes = None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, cast
+
+from mopidy.models import Album, Artist, TlTrack, Track
+
+if TYPE_CHECKING:
+    from mopidy.models._base import BaseModel
+
+# Shared instances of equal models, keyed by their type and field values.
+# Entries are dropped when the shared instance is no longer in use.
+_interned: weakref.WeakValueDictionary[tuple[object, ...], BaseModel] = (
+    weakref.WeakValueDictionary()
+)
+
+# Empty frozensets are not shared by Python, so share one ourselves.
+_NO_ARTISTS: frozenset[Artist] = frozenset()
+
+
+def intern_track(track: Track) -> Track:
+    """Get a shared instance of a track.
+
+    Returns the same instance for all equal tracks, and makes the track's
+    album and artists shared with all other interned tracks. Memory use for
+    many tracks from the same albums then grows with the number of unique
+    tracks, albums, and artists, instead of with the number of tracks.
+
+    Args:
+        track: The track to intern.
+    """
+    if (interned := _interned.get(_get_key(track))) is not None:
+        return cast(Track, interned)
+    album = None if track.album is None else _intern_album(track.album)
+    artists = _intern_artists(track.artists)
+    if album is not None and artists == album.artists:
+        # Most tracks have the same artists as their album
+        artists = album.artists
+    track = track.model_copy(
+        update={
+            "artists": artists,
+            "album": album,
+            "composers": _intern_artists(track.composers),
+            "performers": _intern_artists(track.performers),
+        }
+    )
+    return cast(Track, _interned.setdefault(_get_key(track), track))
+
+
+def intern_tl_track(tl_track: TlTrack) -> TlTrack:
+    """Get a tracklist track with a shared instance of its track.
+
+    Args:
+        tl_track: The tracklist track to intern the track of.
+    """
+    track = intern_track(tl_track.track)
+    if track is tl_track.track:
+        return tl_track
+    return TlTrack(tlid=tl_track.tlid, track=track)
+
+
+def _intern_album(album: Album) -> Album:
+    if (interned := _interned.get(_get_key(album))) is not None:
+        return cast(Album, interned)
+    album = album.model_copy(update={"artists": _intern_artists(album.artists)})
+    return cast(Album, _interned.setdefault(_get_key(album), album))
+
+
+def _intern_artists(artists: frozenset[Artist]) -> frozenset[Artist]:
+    if not artists:
+        return _NO_ARTISTS
+    return frozenset(
+        cast(Artist, _interned.setdefault(_get_key(artist), artist))
+        for artist in artists
+    )
+
+
+def _get_key(model: BaseModel) -> tuple[object, ...]:
+    # Models are frozen, so their field values can't change. The keys refer
+    # to the field values, so they must be taken from the shared instances,
+    # not from the models they are looked up with.
+    return (type(model), *model.__dict__.values())
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+
+
+class Summary:
+    """Number and sum of observed values, like durations, by label.
+
+    Observing a value only updates two numbers, so summaries are cheap enough
+    to always be on. Safe to use from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, tuple[int, float]] = {}
+
+    def observe(self, label: str, value: float) -> None:
+        with self._lock:
+            count, total = self._values.get(label, (0, 0.0))
+            self._values[label] = (count + 1, total + value)
+
+    def collect(self) -> dict[str, tuple[int, float]]:
+        """Get the number and sum of the values observed for each label."""
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge:
+    """A value that can go up and down. `None` until it is first set.
+
+    Safe to use from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value: float | None = None
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def add(self, amount: float) -> None:
+        with self._lock:
+            self._value = (self._value or 0) + amount
+
+    def get(self) -> float | None:
+        return self._value
+
+
+# Durations of scans by the audio scanner, in seconds, by URI scheme.
+scan_durations = Summary()
+
+# The last buffering percentage reported by GStreamer during playback.
+buffering_percent = Gauge()
@@ -45,6 +45,37 @@ class Audio:
         """
         raise NotImplementedError
 
+    def set_next_uri(
+        self,
+        uri: str | None,
+        live_stream: bool = False,
+        download: bool = False,
+        source_setup_callback: Callable[[Gst.Element], None] | None = None,
+        track_uri: str | None = None,
+    ) -> None:
+        """Set URI of audio to be played when the current URI is about to finish.
+
+        When the current URI is about to finish, audio switches to this URI
+        right away, instead of running the about-to-finish callback, and emits
+        a `next_uri_used` event. This gives gapless playback even when the
+        about-to-finish callback would have to wait for a busy core or
+        backend.
+
+        The next URI is only used once, and is cleared by [prepare_change][]
+        and [stop_playback][].
+
+        Args:
+            uri: The URI to play next, or `None` to clear the next URI.
+            live_stream: Disables buffering, reducing latency for streams,
+                and discarding data when paused.
+            download: Enables "download" buffering mode.
+            source_setup_callback: Callback to run when we set up the source
+                of the next URI.
+            track_uri: The URI of the track the next URI was resolved from,
+                which is passed on with the `next_uri_used` event.
+        """
+        raise NotImplementedError
+
     def set_source_setup_callback(
         self,
         callback: Callable[[Gst.Element], None],
@@ -70,6 +101,9 @@ class Audio:
         until this call has been made. [prepare_change][] is not needed before
         [set_uri][] in this one special case.
 
+        The callback is not run if a URI set with [set_next_uri][] is waiting
+        to be played.
+
         Args:
             callback: Callback to run when we need the next URI.
         """
@@ -144,6 +178,7 @@ class AudioProxy(ActorMemberMixin, pykka.ActorProxy[AudioActor]):
 
     state = proxy_field(Audio.state)
     set_uri = proxy_method(Audio.set_uri)
+    set_next_uri = proxy_method(Audio.set_next_uri)
     set_source_setup_callback = proxy_method(Audio.set_source_setup_callback)
     set_about_to_finish_callback = proxy_method(Audio.set_about_to_finish_callback)
     get_position = proxy_method(Audio.get_position)
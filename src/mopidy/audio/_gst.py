@@ -3,14 +3,15 @@ from __future__ import annotations
 import logging
 import os
 import threading
+import time
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, cast, override
+from typing import TYPE_CHECKING, Any, NamedTuple, cast, override
 
 import pykka
 from pykka.typing import proxy_method
 
 from mopidy import exceptions
-from mopidy._lib import logs, process
+from mopidy._lib import logs, metrics, process
 from mopidy._lib.gi import GLib, Gst, GstBase, GstPbutils
 from mopidy.audio import tags as tags_lib
 from mopidy.audio._api import Audio
@@ -45,6 +46,14 @@ _GST_STATE_MAPPING: dict[Gst.State, PlaybackState] = {
 }
 
 
+class _NextUri(NamedTuple):
+    uri: str
+    live_stream: bool
+    download: bool
+    source_setup_callback: Callable[[Gst.Element], None] | None
+    track_uri: str | None
+
+
 # TODO: expose this as a property on audio when #790 gets further along.
 class _Outputs(Gst.Bin):
     def __init__(self) -> None:
@@ -288,6 +297,8 @@ class _Handler:
             gst_logger.debug("Skip buffering during track change.")
             return
 
+        metrics.buffering_percent.set(percent)
+
         if structure is not None and structure.has_field("buffering-mode"):
             buffering_mode = structure.get_enum("buffering-mode", Gst.BufferingMode)
             if buffering_mode == Gst.BufferingMode.LIVE:
@@ -428,6 +439,11 @@ class GstAudio(Audio, pykka.ThreadingActor):
         self._about_to_finish_callback: Callable | None = None
         self._source_setup_callback: Callable | None = None
 
+        # The next URI is used from GStreamer's streaming thread, so that
+        # about-to-finish can be handled without waiting for any actor.
+        self._next_uri: _NextUri | None = None
+        self._next_uri_lock = threading.Lock()
+
         self._handler = _Handler(self)
         self._signals = Signals()
 
@@ -568,9 +584,36 @@ class GstAudio(Audio, pykka.ThreadingActor):
             return
 
         gst_logger.debug("Got about-to-finish event.")
-        if self._about_to_finish_callback:
+        start = time.monotonic()
+        if (next_uri := self._take_next_uri()) is not None:
+            logger.debug("Switching to next URI: %s", next_uri.uri)
+            self._source_setup_callback = next_uri.source_setup_callback
+            self.set_uri(
+                next_uri.uri,
+                live_stream=next_uri.live_stream,
+                download=next_uri.download,
+            )
+            logger.debug(
+                "Audio event: next_uri_used(uri=%r, track_uri=%r)",
+                next_uri.uri,
+                next_uri.track_uri,
+            )
+            AudioListener.send(
+                "next_uri_used", uri=next_uri.uri, track_uri=next_uri.track_uri
+            )
+        elif self._about_to_finish_callback:
             logger.debug("Running about-to-finish callback.")
             self._about_to_finish_callback()
+        logger.debug(
+            "Handled about-to-finish in %.1f ms (next URI was %s)",
+            (time.monotonic() - start) * 1000,
+            "ready" if next_uri is not None else "not ready",
+        )
+
+    def _take_next_uri(self) -> _NextUri | None:
+        with self._next_uri_lock:
+            next_uri, self._next_uri = self._next_uri, None
+        return next_uri
 
     def _on_source_setup(
         self,
@@ -631,6 +674,23 @@ class GstAudio(Audio, pykka.ThreadingActor):
         if self.mixer is not None and current_volume is not None:
             self.mixer.set_volume(current_volume)
 
+    @override
+    def set_next_uri(
+        self,
+        uri: str | None,
+        live_stream: bool = False,
+        download: bool = False,
+        source_setup_callback: Callable[[Gst.Element], None] | None = None,
+        track_uri: str | None = None,
+    ) -> None:
+        with self._next_uri_lock:
+            if uri is None:
+                self._next_uri = None
+            else:
+                self._next_uri = _NextUri(
+                    uri, live_stream, download, source_setup_callback, track_uri
+                )
+
     @override
     def set_source_setup_callback(
         self,
@@ -691,10 +751,12 @@ class GstAudio(Audio, pykka.ThreadingActor):
         # changes like updating data that is being pushed. The reason for this
         # is that GStreamer will reset all its state when it changes to
         # `Gst.State.READY`.
+        self._take_next_uri()
         return self._set_state(Gst.State.READY)
 
     @override
     def stop_playback(self) -> bool:
+        self._take_next_uri()
         return self._set_state(Gst.State.NULL)
 
     def _set_state(self, state: Gst.State) -> bool:
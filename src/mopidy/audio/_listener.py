@@ -38,6 +38,20 @@ class AudioListener(listener.Listener):
             uri: URI the stream has started playing.
         """
 
+    def next_uri_used(self, uri: Uri, track_uri: Uri | None) -> None:
+        """Called when audio switches to the URI set with `set_next_uri()`.
+
+        This happens when the current URI is about to finish, and is followed
+        by a `stream_changed` event when the next URI starts playing.
+
+        *MAY* be implemented by actor.
+
+        Args:
+            uri: URI audio switched to.
+            track_uri: URI of the track the URI was resolved from, as given
+                to `set_next_uri()`.
+        """
+
     def position_changed(self, position: DurationMs) -> None:
         """Called whenever the position of the stream changes.
 
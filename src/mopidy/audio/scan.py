@@ -1,11 +1,15 @@
 import logging
+import os
 import time
+import urllib.parse
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from pathlib import Path
 from typing import Any, NamedTuple, cast
 
 from mopidy import exceptions
-from mopidy._lib import logs
+from mopidy._lib import logs, metrics
 from mopidy._lib.gi import Gst, GstPbutils
 from mopidy.audio import tags as tags_lib
 from mopidy.audio._utils import Signals, setup_proxy
@@ -76,6 +80,7 @@ class Scanner:
             Named tuple: `uri`, `tags`, `duration`, `seekable`, `mime`, `playable`.
         """
         timeout = int(timeout or self._timeout_ms)
+        started = time.monotonic()
         pipeline, signals = _setup_pipeline(uri, self._proxy_config)
 
         try:
@@ -87,6 +92,51 @@ class Scanner:
             signals.clear()
             pipeline.set_state(Gst.State.NULL)
             del pipeline
+            metrics.scan_durations.observe(
+                urllib.parse.urlsplit(uri).scheme,
+                time.monotonic() - started,
+            )
+
+    def scan_many(
+        self,
+        uris: Iterable[str],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, _Result | exceptions.ScannerError]:
+        """Scan multiple URIs, running several scans at the same time.
+
+        Each URI is scanned in its own pipeline, just like with [scan][], but
+        up to `concurrency` pipelines are kept running in parallel.
+
+        Args:
+            uris: URIs of the resources to scan.
+            concurrency: Max number of URIs to scan at the same time. Defaults
+                to the number of CPUs.
+            timeout: Timeout for scanning each URI in milliseconds. Defaults
+                to the `timeout` value used when creating the scanner.
+
+        Returns:
+            Dict mapping each URI to its scan result, or to the
+            [ScannerError][mopidy.exceptions.ScannerError] raised while
+            scanning it.
+        """
+        uris = list(dict.fromkeys(uris))
+        workers = min(len(uris), concurrency or os.cpu_count() or 1)
+
+        def scan(uri: str) -> _Result | exceptions.ScannerError:
+            try:
+                return self.scan(uri, timeout=timeout)
+            except exceptions.ScannerError as exc:
+                return exc
+
+        if workers <= 1:
+            return {uri: scan(uri) for uri in uris}
+
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="Scanner",
+        ) as executor:
+            return dict(zip(uris, executor.map(scan, uris), strict=True))
 
 
 # Turns out it's _much_ faster to just create a new pipeline for every as
@@ -8,8 +8,10 @@ from typing import TYPE_CHECKING
 import pykka
 from pykka.typing import proxy_field, proxy_method
 
+from mopidy.models import SearchResult
+
 if TYPE_CHECKING:
-    from mopidy.models import Image, Ref, SearchResult, Track
+    from mopidy.models import Image, Ref, Track
     from mopidy.types import DistinctField, Query, SearchField, Uri
 
     from ._backend import Backend
@@ -40,6 +42,24 @@ class LibraryProvider:
         """
         return []
 
+    def browse_page(
+        self,
+        uri: Uri,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Ref]:
+        """Get a slice of the refs returned by [browse][].
+
+        See [mopidy.core.LibraryController.browse][].
+
+        *MAY be implemented by subclass.*
+
+        Default implementation slices the full result of [browse][]. Backends
+        that can list a directory partially should override this.
+        """
+        refs = self.browse(uri)
+        return refs[offset:] if limit is None else refs[offset : offset + limit]
+
     def get_distinct(
         self,
         field: DistinctField,
@@ -65,6 +85,21 @@ class LibraryProvider:
         """
         return {}
 
+    def get_version(self) -> int | str | None:
+        """Get the current version of the library's contents.
+
+        Used by core to invalidate cached lookup results when
+        `core/lookup_cache_size` is set. The version can be any value that
+        changes whenever lookups may return different tracks than before,
+        e.g. a change counter or the library's last modification time.
+
+        *MAY be implemented by subclass.*
+
+        Default implementation returns `None`, which means cached results are
+        kept until the library is refreshed.
+        """
+        return None
+
     def lookup_many(self, uris: Iterable[Uri]) -> dict[Uri, list[Track]]:
         """See [mopidy.core.LibraryController.lookup][].
 
@@ -100,13 +135,47 @@ class LibraryProvider:
         """
         return None
 
+    def search_page(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> SearchResult | None:
+        """Get a slice of the result returned by [search][].
+
+        The offset and limit apply to the tracks, artists, and albums of the
+        search result separately.
+
+        See [mopidy.core.LibraryController.search][].
+
+        *MAY be implemented by subclass.*
+
+        Default implementation slices the full result of [search][]. Backends
+        that can build partial search results should override this.
+        """
+        result = self.search(query=query, uris=uris, exact=exact)
+        if result is None:
+            return None
+        end = None if limit is None else offset + limit
+        return SearchResult(
+            uri=result.uri,
+            tracks=result.tracks[offset:end],
+            artists=result.artists[offset:end],
+            albums=result.albums[offset:end],
+        )
+
 
 class LibraryProviderProxy:
     root_directory = proxy_field(LibraryProvider.root_directory)
     browse = proxy_method(LibraryProvider.browse)
+    browse_page = proxy_method(LibraryProvider.browse_page)
     get_distinct = proxy_method(LibraryProvider.get_distinct)
     get_images = proxy_method(LibraryProvider.get_images)
+    get_version = proxy_method(LibraryProvider.get_version)
     lookup_many = proxy_method(LibraryProvider.lookup_many)
     lookup = proxy_method(LibraryProvider.lookup)
     refresh = proxy_method(LibraryProvider.refresh)
     search = proxy_method(LibraryProvider.search)
+    search_page = proxy_method(LibraryProvider.search_page)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import pykka
 from pykka.typing import proxy_method
@@ -24,6 +24,17 @@ logger = logging.getLogger(__name__)
 class PlaybackProvider:
     """A playback provider provides audio playback control."""
 
+    prepare_next_uri: ClassVar[bool] = False
+    """Whether to resolve the next track's playable URI ahead of time.
+
+    If `True`, the default [prepare_uri][] calls [translate_uri][] while the
+    current track plays. Only set this if [translate_uri][] has no side
+    effects, and its result stays playable for the length of a track.
+    """
+
+    # The last URI given to prepare_uri(), and the playable URI it resolved to.
+    _prepared_uri: tuple[Uri, Uri] | None = None
+
     def __init__(self, audio: AudioProxy, backend: Backend) -> None:
         self.audio = audio
         self.backend = backend
@@ -72,6 +83,60 @@ class PlaybackProvider:
         """
         return uri
 
+    def prepare_uri(self, uri: Uri) -> Uri | None:
+        """Resolve the playable URI of a track that will likely play next.
+
+        *MAY be reimplemented by subclass.*
+
+        Core calls this when a track starts playing, with the URI of the track
+        expected to follow it. This gives the backend time to do slow work,
+        like downloading a playlist or asking a remote service for a stream
+        URL, before the track is needed for gapless playback.
+
+        The default implementation does nothing and returns `None`, unless
+        [prepare_next_uri][] is set. It then calls [translate_uri][], and
+        keeps the result for the next [change_track][] call for the same URI.
+        Unless [change_track][] is reimplemented, it also gives the result to
+        audio, which then switches to it at about-to-finish without waiting
+        for core or the backend.
+
+        Args:
+            uri: The URI of the track to prepare.
+        """
+        if not self.prepare_next_uri:
+            return None
+        playable_uri = self.translate_uri(uri)
+        if playable_uri is None:
+            return None
+        self._prepared_uri = (uri, playable_uri)
+        # Backends that reimplement change_track() may do more than setting
+        # the URI, so leave the track change to them.
+        if (
+            self.audio is not None
+            and type(self).change_track is PlaybackProvider.change_track
+        ):
+            self.audio.set_next_uri(
+                playable_uri,
+                live_stream=self.is_live(playable_uri),
+                download=self.should_download(playable_uri),
+                source_setup_callback=self.on_source_setup,
+                track_uri=uri,
+            ).get()
+        return playable_uri
+
+    def forget_prepared_uri(self) -> None:
+        """Forget the URI resolved by the last [prepare_uri][] call.
+
+        *MAY be reimplemented by subclass.*
+
+        Core calls this when the track that will play next has changed. The
+        default implementation drops the kept URI, and clears the next URI in
+        audio.
+        """
+        self._prepared_uri = None
+        if self.audio is not None:
+            self.audio.set_next_uri(None).get()
+
     def is_live(self, uri: Uri) -> bool:
         """Decide if the URI should be treated as a live stream or not.
 
@@ -113,12 +178,17 @@ class PlaybackProvider:
         backends and core that backend authors should not touch.
 
         The default implementation will call [translate_uri][], which is what
-        you want to implement.
+        you want to implement, unless the URI was already resolved by
+        [prepare_uri][].
 
         Args:
             track: The track to play.
         """
-        uri = self.translate_uri(track.uri)
+        prepared_uri, self._prepared_uri = self._prepared_uri, None
+        if prepared_uri is not None and prepared_uri[0] == track.uri:
+            uri = prepared_uri[1]
+        else:
+            uri = self.translate_uri(track.uri)
         if uri != track.uri:
             logger.debug("Backend translated URI from %s to %s", track.uri, uri)
         if uri is None:
@@ -174,6 +244,8 @@ class PlaybackProviderProxy:
     play = proxy_method(PlaybackProvider.play)
     prepare_change = proxy_method(PlaybackProvider.prepare_change)
     translate_uri = proxy_method(PlaybackProvider.translate_uri)
+    prepare_uri = proxy_method(PlaybackProvider.prepare_uri)
+    forget_prepared_uri = proxy_method(PlaybackProvider.forget_prepared_uri)
     is_live = proxy_method(PlaybackProvider.is_live)
     should_download = proxy_method(PlaybackProvider.should_download)
     on_source_setup = proxy_method(PlaybackProvider.on_source_setup)
@@ -100,7 +100,10 @@ class CoreConfig(TypedDict):
     config_dir: pathlib.Path
     data_dir: pathlib.Path
     max_tracklist_length: int
+    lookup_cache_size: int
+    library_timeout: int | None
     restore_state: bool
+    actor_stats: bool
 
 
 class LoggingConfig(TypedDict):
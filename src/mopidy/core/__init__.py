@@ -1,13 +1,29 @@
+from mopidy._lib.actor_stats import ActorMethodStats, ActorStats
+
 from ._actor import Core, CoreProxy
 from ._history import HistoryController, HistoryControllerProxy
-from ._library import LibraryController, LibraryControllerProxy
+from ._library import (
+    BrowsePage,
+    LibraryController,
+    LibraryControllerProxy,
+    LookupCacheStats,
+    SearchPage,
+)
 from ._listener import CoreEvent, CoreEventData, CoreListener
 from ._mixer import MixerController, MixerControllerProxy
 from ._playback import PlaybackController, PlaybackControllerProxy
 from ._playlists import PlaylistsController, PlaylistsControllerProxy
-from ._tracklist import TracklistController, TracklistControllerProxy
+from ._tracklist import (
+    TracklistChange,
+    TracklistController,
+    TracklistControllerProxy,
+    TracklistOperation,
+)
 
 __all__ = [
+    "ActorMethodStats",
+    "ActorStats",
+    "BrowsePage",
     "Core",
     "CoreEvent",
     "CoreEventData",
@@ -17,12 +33,16 @@ __all__ = [
     "HistoryControllerProxy",
     "LibraryController",
     "LibraryControllerProxy",
+    "LookupCacheStats",
     "MixerController",
     "MixerControllerProxy",
     "PlaybackController",
     "PlaybackControllerProxy",
     "PlaylistsController",
     "PlaylistsControllerProxy",
+    "SearchPage",
+    "TracklistChange",
     "TracklistController",
     "TracklistControllerProxy",
+    "TracklistOperation",
 ]
@@ -4,14 +4,14 @@ import itertools
 import logging
 from collections.abc import Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, Any, override
 
 import pykka
 from pykka.typing import ActorMemberMixin, proxy_method
 
 import mopidy
 from mopidy import audio, backend, mixer
-from mopidy._lib import paths
+from mopidy._lib import actor_stats, paths
 from mopidy.types import PlaybackState, UriScheme
 
 from ._history import HistoryController
@@ -21,9 +21,10 @@ from ._mixer import MixerController
 from ._playback import PlaybackController
 from ._playlists import PlaylistsController
 from ._state_storage import CoreControllersState, StoredState
-from ._tracklist import TracklistController
+from ._tracklist import ResolveTracksMessage, TracklistController
 
 if TYPE_CHECKING:
+    from mopidy._lib.actor_stats import ActorStats
     from mopidy.config import Config
     from mopidy.mixer import MixerProxy
     from mopidy.types import Uri
@@ -110,6 +111,20 @@ class Core(
         """Get version of the Mopidy core API."""
         return mopidy.__version__
 
+    def get_actor_stats(self) -> list[ActorStats]:
+        """Get statistics for the calls to each actor, like core and backends.
+
+        Returns a list with one dict per actor, with the actor's class name as
+        `actor`, the number of calls waiting in its inbox as `mailbox_depth`,
+        and the highest number of waiting calls since the actor started as
+        `max_mailbox_depth`. The `methods` list has the number of `calls`,
+        and the total `wait_time` in the inbox and `run_time` in seconds, for
+        each method called on the actor.
+
+        The list is empty unless the `core/actor_stats` config value is set.
+        """
+        return actor_stats.get_stats()
+
     # The methods below are not part of the public interface, but are just an
     # implementation of BackendListener and MixerListener.
 
@@ -121,6 +136,10 @@ class Core(
     def stream_changed(self, uri: Uri) -> None:
         self.playback._on_stream_changed(uri)
 
+    @override
+    def next_uri_used(self, uri: Uri, track_uri: Uri | None) -> None:
+        self.playback._on_next_uri_used(uri, track_uri)
+
     @override
     def position_changed(self, position: int) -> None:
         self.playback._on_position_changed(position)
@@ -132,6 +151,8 @@ class Core(
         new_state: PlaybackState,
         target_state: PlaybackState | None,
     ) -> None:
+        self.playback._on_audio_state_changed()
+
         # NOTE: This is a temporary fix for issue #232 while we wait for a more
         # permanent solution with the implementation of issue #234. When the
         # Spotify play token is lost, the Spotify backend pauses audio
@@ -183,6 +204,13 @@ class Core(
                 self.playback._stream_title = title
                 CoreListener.send("stream_title_changed", title=title)
 
+    @override
+    def on_receive(self, message: Any) -> Any:
+        if isinstance(message, ResolveTracksMessage):
+            self.tracklist._resolve_tracks()
+            return None
+        return super().on_receive(message)
+
     def _setup(self) -> None:
         """Do not call this function. It is for internal use at startup."""
         try:
@@ -331,8 +359,10 @@ class CoreProxy(ActorMemberMixin, pykka.ActorProxy[Core]):
     tracklist: TracklistControllerProxy
     get_uri_schemes = proxy_method(Core.get_uri_schemes)
     get_version = proxy_method(Core.get_version)
+    get_actor_stats = proxy_method(Core.get_actor_stats)
     reached_end_of_stream = proxy_method(Core.reached_end_of_stream)
     stream_changed = proxy_method(Core.stream_changed)
+    next_uri_used = proxy_method(Core.next_uri_used)
     position_changed = proxy_method(Core.position_changed)
     state_changed = proxy_method(Core.state_changed)
     playlists_loaded = proxy_method(Core.playlists_loaded)
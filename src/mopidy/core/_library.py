@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import collections
 import contextlib
+import hashlib
+import json
 import logging
 import operator
+import time
 import urllib.parse
 import warnings
 from collections.abc import Generator, Iterable, Mapping
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
+import pykka
 from pykka.typing import proxy_method
 
 from mopidy import exceptions
@@ -31,6 +35,11 @@ def _backend_error_handling(
 ) -> Generator[None]:
     try:
         yield
+    except pykka.Timeout:
+        logger.warning(
+            "%s backend did not respond in time. Ignoring its result.",
+            backend.actor_ref.actor_class.__name__,
+        )
     except exceptions.ValidationError as e:
         logger.error(
             "%s backend returned bad data: %s",
@@ -46,6 +55,63 @@ def _backend_error_handling(
         )
 
 
+class BrowsePage(TypedDict):
+    refs: list[Ref]
+    next_token: str | None
+
+
+class SearchPage(TypedDict):
+    results: list[SearchResult]
+    next_token: str | None
+
+
+class LookupCacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class _LookupCache:
+    """Size-bounded LRU cache of lookup results.
+
+    Each entry is stored along with the version of the backend library it was
+    looked up from, and is only returned while the library is still at that
+    version.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[
+            Uri, tuple[UriScheme, int | str | None, list[Track]]
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, uri: Uri, version: int | str | None) -> list[Track] | None:
+        entry = self._entries.get(uri)
+        if entry is None or entry[1] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(uri)
+        self.hits += 1
+        return list(entry[2])
+
+    def put(self, uri: Uri, version: int | str | None, tracks: list[Track]) -> None:
+        scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
+        self._entries[uri] = (scheme, version, list(tracks))
+        self._entries.move_to_end(uri)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, schemes: set[UriScheme]) -> None:
+        for uri in [u for u, e in self._entries.items() if e[0] in schemes]:
+            del self._entries[uri]
+
+
 class LibraryController:
     """Manages browsing and searching for music."""
 
@@ -53,6 +119,19 @@ class LibraryController:
         self.backends = backends
         self.core = core
 
+        core_config = {}
+        if core._config and "core" in core._config:
+            core_config = core._config["core"]
+        cache_size = core_config.get("lookup_cache_size", 0)
+        self._lookup_cache = _LookupCache(cache_size) if cache_size else None
+        timeout = core_config.get("library_timeout")
+        self._timeout = timeout / 1000 if timeout else None
+
+    def _get_deadline(self) -> float | None:
+        if self._timeout is None:
+            return None
+        return time.monotonic() + self._timeout
+
     def _get_backend(self, uri: Uri) -> BackendProxy | None:
         uri_scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
         return self.backends.with_library.get(uri_scheme, None)
@@ -73,7 +152,12 @@ class LibraryController:
                 lst.append(uri)
         return result
 
-    def browse(self, uri: Uri | None) -> list[Ref]:
+    def browse(
+        self,
+        uri: Uri | None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[Ref]:
         """Browse directories and tracks at the given `uri`.
 
         `uri` is a string which represents some directory belonging to a
@@ -104,28 +188,64 @@ class LibraryController:
         Ref.directory(uri='dummy:directory:/bar', name='bar')
         ```
 
+        For large directories, use `offset` and `limit` to get one page of
+        the directory at a time, or see [browse_page][].
+
         Args:
             uri: URI to browse.
+            offset: Number of refs to skip.
+            limit: Max number of refs to return. Defaults to all.
         """
+        validation.check_integer(offset, min=0)
+        if limit is not None:
+            validation.check_integer(limit, min=0)
         if uri is None:
-            return self._roots()
+            return _slice(self._roots(), offset, limit)
         if not uri.strip():
             return []
         validation.check_uri(uri)
-        return self._browse(uri)
+        return self._browse(uri, offset, limit)
+
+    def browse_page(
+        self,
+        uri: Uri | None,
+        limit: int = 100,
+        token: str | None = None,
+    ) -> BrowsePage:
+        """Browse directories and tracks at the given `uri`, one page at a time.
+
+        Returns a dict with up to `limit` [Ref][mopidy.models.Ref] objects as
+        `refs`, see [browse][] for details. If there are more refs, the dict's
+        `next_token` is a continuation token to pass along with the same `uri`
+        to get the next page. Otherwise, it is `None`.
+
+        Args:
+            uri: URI to browse.
+            limit: Max number of refs per page.
+            token: Continuation token from the previous page, or `None` to
+                get the first page.
+        """
+        validation.check_integer(limit, min=1)
+        offset = 0 if token is None else _parse_page_token(token, uri)
+        refs = self.browse(uri, offset, limit + 1)
+        next_token = None
+        if len(refs) > limit:
+            next_token = _get_page_token(offset + limit, uri)
+        return BrowsePage(refs=refs[:limit], next_token=next_token)
 
     def _roots(self) -> list[Ref]:
         directories = set()
         backends = self.backends.with_library_browse.values()
         futures = {b: b.library.root_directory for b in backends}
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                root = future.get()
+                root = _get_result(future, deadline)
                 validation.check_instance(root, Ref)
                 directories.add(root)
         return sorted(directories, key=operator.attrgetter("name"))
 
-    def _browse(self, uri: Uri) -> list[Ref]:
+    def _browse(self, uri: Uri, offset: int, limit: int | None) -> list[Ref]:
         scheme = UriScheme(urllib.parse.urlparse(uri).scheme)
         backend = self.backends.with_library_browse.get(scheme)
 
@@ -133,7 +253,11 @@ class LibraryController:
             return []
 
         with _backend_error_handling(backend):
-            result = backend.library.browse(uri).get()
+            if offset == 0 and limit is None:
+                future = backend.library.browse(uri)
+            else:
+                future = backend.library.browse_page(uri, offset, limit)
+            result = _get_result(future, self._get_deadline())
             validation.check_instances(result, Ref)
             return result
 
@@ -180,9 +304,10 @@ class LibraryController:
             b: b.library.get_distinct(compat_field, query)
             for b in self.backends.with_library.values()
         }
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                values = future.get()
+                values = _get_result(future, deadline)
                 if values is not None:
                     if field_type is not None:
                         validation.check_instances(values, field_type)
@@ -211,12 +336,14 @@ class LibraryController:
         }
 
         results: dict[Uri, tuple[Image, ...]] = dict.fromkeys(uris, ())
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                if future.get() is None:
+                result = _get_result(future, deadline)
+                if result is None:
                     continue
-                validation.check_instance(future.get(), Mapping)
-                for uri, images in future.get().items():
+                validation.check_instance(result, Mapping)
+                for uri, images in result.items():
                     if uri not in uris:
                         msg = f"Got unknown image URI: {uri}"
                         raise exceptions.ValidationError(msg)
@@ -230,29 +357,87 @@ class LibraryController:
         If the URI expands to multiple tracks, the returned list will contain
         them all.
 
+        If `core/lookup_cache_size` is set, results are served from a cache
+        until the backend's library version changes or the library is
+        refreshed.
+
         Args:
             uris: Track URIs.
         """
         validation.check_uris(uris)
 
+        backends_to_uris = {
+            backend: backend_uris
+            for backend, backend_uris in self._get_backends_to_uris(uris).items()
+            if backend_uris
+        }
+        results = {u: [] for u in uris}
+        deadline = self._get_deadline()
+
+        cache = self._lookup_cache
+        versions: dict[BackendProxy, int | str | None] = {}
+        if cache is not None:
+            versions = self._get_library_versions(backends_to_uris, deadline)
+            for backend, version in versions.items():
+                misses = []
+                for uri in backends_to_uris[backend]:
+                    tracks = cache.get(uri, version)
+                    if tracks is None:
+                        misses.append(uri)
+                    else:
+                        results[uri] = tracks
+                backends_to_uris[backend] = misses
+
         futures = {
             backend: backend.library.lookup_many(backend_uris)
-            for (backend, backend_uris) in self._get_backends_to_uris(uris).items()
+            for (backend, backend_uris) in backends_to_uris.items()
             if backend_uris
         }
-        results = {u: [] for u in uris}
 
         for backend, future in futures.items():
             with _backend_error_handling(backend):
-                result = future.get()
+                result = _get_result(future, deadline)
                 if result is not None:
                     validation.check_instance(result, Mapping)
                     for uri, tracks in result.items():
                         validation.check_instances(tracks, Track)
                         results[uri] = tracks
+                        if cache is not None and backend in versions and tracks:
+                            cache.put(uri, versions[backend], tracks)
 
         return results
 
+    def _get_library_versions(
+        self,
+        backends: Iterable[BackendProxy],
+        deadline: float | None,
+    ) -> dict[BackendProxy, int | str | None]:
+        # Backends that fail to report a version are left out, so that their
+        # lookups skip the cache.
+        futures = {backend: backend.library.get_version() for backend in backends}
+        versions = {}
+        for backend, future in futures.items():
+            with _backend_error_handling(backend):
+                versions[backend] = _get_result(future, deadline)
+        return versions
+
+    def get_lookup_cache_stats(self) -> LookupCacheStats:
+        """Get statistics for the lookup cache.
+
+        Returns a dict with the number of cache `hits` and `misses` since
+        startup, the current number of cached URIs as `size`, and the
+        configured `max_size`. All values are zero if the cache is disabled.
+        """
+        cache = self._lookup_cache
+        if cache is None:
+            return LookupCacheStats(hits=0, misses=0, size=0, max_size=0)
+        return LookupCacheStats(
+            hits=cache.hits,
+            misses=cache.misses,
+            size=len(cache),
+            max_size=cache.max_size,
+        )
+
     def refresh(self, uri: Uri | None = None) -> None:
         """Refresh library. Limit to URI and below if an URI is given.
 
@@ -272,6 +457,8 @@ class LibraryController:
         for backend, backend_schemes in backends.items():
             if uri_scheme is None or uri_scheme in backend_schemes:
                 futures[backend] = backend.library.refresh(uri)
+                if self._lookup_cache is not None:
+                    self._lookup_cache.invalidate(backend_schemes)
 
         for backend, future in futures.items():
             with _backend_error_handling(backend):
@@ -282,6 +469,8 @@ class LibraryController:
         query: Query[SearchField],
         uris: Iterable[Uri] | None = None,
         exact: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> list[SearchResult]:
         """Search the library for tracks where `field` contains `values`.
 
@@ -309,10 +498,17 @@ class LibraryController:
             search({'artist': ['xyz', 'abc']})
             ```
 
+        To get large results one page at a time, use `offset` and `limit`, or
+        see [search_page][]. They apply to the tracks, artists, and albums of
+        each backend's search result separately.
+
         Args:
             query: One or more queries to search for.
             uris: Zero or more URI roots to limit the search to.
             exact: If the search should use exact matching.
+            offset: Number of tracks, artists, and albums to skip.
+            limit: Max number of tracks, artists, and albums to return.
+                Defaults to all.
         """
         query = _normalize_query(query)
 
@@ -320,17 +516,29 @@ class LibraryController:
             validation.check_uris(uris)
         validation.check_query(query)
         validation.check_boolean(exact)
+        validation.check_integer(offset, min=0)
+        if limit is not None:
+            validation.check_integer(limit, min=0)
 
         if not query:
             return []
 
         futures = {}
         for backend, backend_uris in self._get_backends_to_uris(uris).items():
-            futures[backend] = backend.library.search(
-                query=query,
-                uris=backend_uris,
-                exact=exact,
-            )
+            if offset == 0 and limit is None:
+                futures[backend] = backend.library.search(
+                    query=query,
+                    uris=backend_uris,
+                    exact=exact,
+                )
+            else:
+                futures[backend] = backend.library.search_page(
+                    query=query,
+                    uris=backend_uris,
+                    exact=exact,
+                    offset=offset,
+                    limit=limit,
+                )
 
         # Some of our tests check for LookupError to catch bad queries. This is
         # silly and should be replaced with query validation before passing it
@@ -338,10 +546,11 @@ class LibraryController:
         reraise = (TypeError, LookupError)
 
         results = []
+        deadline = self._get_deadline()
         for backend, future in futures.items():
             try:
                 with _backend_error_handling(backend, reraise=reraise):
-                    result = future.get()
+                    result = _get_result(future, deadline)
                     if result is not None:
                         validation.check_instance(result, SearchResult)
                         results.append(result)
@@ -355,6 +564,86 @@ class LibraryController:
 
         return results
 
+    def search_page(
+        self,
+        query: Query[SearchField],
+        uris: Iterable[Uri] | None = None,
+        exact: bool = False,
+        limit: int = 100,
+        token: str | None = None,
+    ) -> SearchPage:
+        """Search the library, one page at a time.
+
+        Returns a dict with a list of [SearchResult][mopidy.models.SearchResult]
+        objects as `results`, each with up to `limit` tracks, artists, and
+        albums, see [search][] for details. If there are more results, the
+        dict's `next_token` is a continuation token to pass along with the same
+        `query`, `uris`, and `exact` to get the next page. Otherwise, it is
+        `None`.
+
+        Args:
+            query: One or more queries to search for.
+            uris: Zero or more URI roots to limit the search to.
+            exact: If the search should use exact matching.
+            limit: Max number of tracks, artists, and albums per page.
+            token: Continuation token from the previous page, or `None` to
+                get the first page.
+        """
+        validation.check_integer(limit, min=1)
+        if uris is not None:
+            uris = list(uris)
+        # Serialize the request before search() normalizes the query in place
+        request = json.dumps([query, uris, exact], sort_keys=True, default=str)
+        offset = 0 if token is None else _parse_page_token(token, request)
+        results = self.search(query, uris, exact, offset, limit + 1)
+        next_token = None
+        if any(
+            len(items) > limit
+            for result in results
+            for items in (result.tracks, result.artists, result.albums)
+        ):
+            next_token = _get_page_token(offset + limit, request)
+        return SearchPage(
+            results=[
+                SearchResult(
+                    uri=result.uri,
+                    tracks=result.tracks[:limit],
+                    artists=result.artists[:limit],
+                    albums=result.albums[:limit],
+                )
+                for result in results
+            ],
+            next_token=next_token,
+        )
+
+
+def _get_result[T](future: pykka.Future[T], deadline: float | None) -> T:
+    # All backends share the same deadline, so a fan-out to several slow
+    # backends takes no longer than a single slow backend.
+    if deadline is None:
+        return future.get()
+    return future.get(timeout=max(0.0, deadline - time.monotonic()))
+
+
+def _slice[T](items: list[T], offset: int, limit: int | None) -> list[T]:
+    return items[offset:] if limit is None else items[offset : offset + limit]
+
+
+def _get_page_token(offset: int, request: object) -> str:
+    # The token includes a digest of the request, so that a token can't be
+    # used to continue a different request by mistake.
+    key = json.dumps(request, sort_keys=True, default=str)
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return f"{offset}:{digest}"
+
+
+def _parse_page_token(token: str, request: object) -> int:
+    offset, _, _ = token.partition(":")
+    if not offset.isdigit() or token != _get_page_token(int(offset), request):
+        msg = f"Invalid page token for this request: {token!r}"
+        raise exceptions.ValidationError(msg)
+    return int(offset)
+
 
 def _normalize_query(query: Query[SearchField]) -> Query[SearchField]:
     broken_client = False
@@ -381,8 +670,11 @@ def _normalize_query(query: Query[SearchField]) -> Query[SearchField]:
 
 class LibraryControllerProxy:
     browse = proxy_method(LibraryController.browse)
+    browse_page = proxy_method(LibraryController.browse_page)
     get_distinct = proxy_method(LibraryController.get_distinct)
     get_images = proxy_method(LibraryController.get_images)
+    get_lookup_cache_stats = proxy_method(LibraryController.get_lookup_cache_stats)
     lookup = proxy_method(LibraryController.lookup)
     refresh = proxy_method(LibraryController.refresh)
     search = proxy_method(LibraryController.search)
+    search_page = proxy_method(LibraryController.search_page)
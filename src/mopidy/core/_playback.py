@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 import urllib.parse
 from collections.abc import Iterable
 from typing import TYPE_CHECKING
@@ -25,6 +26,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds to interpolate the time position from the last known position,
+# before asking the backend for the time position again.
+_POSITION_RESYNC_INTERVAL = 1.0
+
+
+def _get_prepare_key(tl_track: TlTrack | None) -> tuple[TracklistId, Uri] | None:
+    # Resolving a lazily added track keeps its TLID and URI, so its URI needs
+    # no new preparing.
+    if tl_track is None:
+        return None
+    return (tl_track.tlid, tl_track.track.uri)
+
 
 class PlaybackController:
     """Manages playback state and the currently playing track."""
@@ -48,11 +61,20 @@ class PlaybackController:
 
         self._pending_position: DurationMs | None = None
         self._last_position: DurationMs | None = None
+
+        # The last known time position, and the monotonic time it was known at.
+        self._position_anchor: tuple[DurationMs, float] | None = None
         self._previous: bool = False
 
         self._start_at_position: DurationMs | None = None
         self._start_paused: bool = False
 
+        # The track backends were last asked to prepare as the next track, and
+        # all tracks asked for since the current track started, with the
+        # current track at the time.
+        self._next_tl_track: TlTrack | None = None
+        self._prepared_tl_tracks: list[tuple[TlTrack | None, TlTrack]] = []
+
         if self._audio:
             self._audio.set_about_to_finish_callback(self._on_about_to_finish_callback)
 
@@ -131,22 +153,48 @@ class PlaybackController:
         """
         validation.check_choice(new_state, validation.PLAYBACK_STATES)
 
+        self._position_anchor = None
         (old_state, self._state) = (self.get_state(), new_state)
         logger.debug("Changing state: %s -> %s", old_state, new_state)
 
         self._trigger_playback_state_changed(old_state, new_state)
 
     def get_time_position(self) -> DurationMs:
-        """Get time position in milliseconds."""
+        """Get time position in milliseconds.
+
+        The time position is only asked from the backend once a second, or
+        when the playback state or the position changed. In between, it is
+        calculated from the last known position.
+        """
         if self._pending_position is not None:
             return self._pending_position
         backend = self._get_backend(self.get_current_tl_track())
         if not backend:
             return DurationMs(0)
+        if (position := self._get_interpolated_position()) is not None:
+            return position
         # TODO: Wrap backend call in error handling.
-        return backend.playback.get_time_position().get()
+        position = backend.playback.get_time_position().get()
+        self._position_anchor = (position, time.monotonic())
+        return position
+
+    def _get_interpolated_position(self) -> DurationMs | None:
+        if self._position_anchor is None:
+            return None
+        position, anchored_at = self._position_anchor
+        elapsed = time.monotonic() - anchored_at
+        if elapsed >= _POSITION_RESYNC_INTERVAL:
+            return None
+        if self._state != PlaybackState.PLAYING:
+            return position
+        position = DurationMs(position + round(elapsed * 1000))
+        length = getattr(self.get_current_track(), "length", None)
+        if length is not None:
+            position = DurationMs(min(position, length))
+        return position
 
     def _on_end_of_stream(self) -> None:
+        self._clear_next_track()
         self.set_state(PlaybackState.STOPPED)
         if self._current_tl_track:
             self._trigger_track_playback_ended(self.get_time_position())
@@ -158,6 +206,7 @@ class PlaybackController:
         else:
             # This code path handles the stop() case, uri should be none.
             position, self._last_position = self._last_position, None
+        self._position_anchor = None
 
         if self._pending_position is None:
             self._trigger_track_playback_ended(position)
@@ -182,7 +231,62 @@ class PlaybackController:
                 self.set_state(PlaybackState.PLAYING)
                 self._trigger_track_playback_started()
 
-    def _on_position_changed(self, _position: int) -> None:
+            self._clear_next_track()
+            self._update_next_track()
+
+    def _update_next_track(self) -> None:
+        # Let the backend resolve the next track's URI while the current track
+        # plays, and give it to audio, so that it is ready when the current
+        # track is about to finish. This runs whenever the next track may have
+        # changed, so don't wait for the backend, and only ask it when the
+        # next track actually changed, as resolving may need network access.
+        if self._state == PlaybackState.STOPPED:
+            return
+        tlid = self.core.tracklist.get_eot_tlid()
+        tl_track = None if tlid is None else self.core.tracklist._get_tl_track(tlid)
+        if _get_prepare_key(tl_track) == _get_prepare_key(self._next_tl_track):
+            return
+
+        self._forget_prepared_tracks()
+        self._next_tl_track = tl_track
+        backend = self._get_backend(tl_track)
+        if tl_track is not None and backend is not None:
+            backend.playback.prepare_uri(tl_track.track.uri)
+            self._prepared_tl_tracks.append((self._current_tl_track, tl_track))
+
+    def _forget_prepared_tracks(self) -> None:
+        # A backend may still be resolving a track we no longer want, and give
+        # it to audio later. Asking the same backend to forget it is handled
+        # after that, so an outdated URI never stays in audio.
+        backends: list[BackendProxy] = []
+        for _, tl_track in self._prepared_tl_tracks:
+            backend = self._get_backend(tl_track)
+            if backend is not None and backend not in backends:
+                backends.append(backend)
+        for backend in backends:
+            backend.playback.forget_prepared_uri()
+
+    def _clear_next_track(self) -> None:
+        self._forget_prepared_tracks()
+        self._next_tl_track = None
+        self._prepared_tl_tracks = []
+
+    def _get_prepared_tl_track(self, track_uri: Uri | None) -> TlTrack | None:
+        # Audio reports the URI of the track it was given the next URI for,
+        # so there is no need to wait for the backend's result. If the same
+        # URI was prepared more than once, audio has the latest one.
+        for previous_tl_track, tl_track in reversed(self._prepared_tl_tracks):
+            if tl_track.track.uri != track_uri:
+                continue
+            if previous_tl_track != self._current_tl_track:
+                # The URI was prepared to follow another track.
+                return None
+            # The track may have been resolved or removed since
+            return self.core.tracklist._get_tl_track(tl_track.tlid)
+        return None
+
+    def _on_position_changed(self, position: int) -> None:
+        self._position_anchor = (DurationMs(position), time.monotonic())
         if self._pending_position is not None:
             self._trigger_seeked(self._pending_position)
             self._pending_position = None
@@ -206,21 +310,35 @@ class PlaybackController:
             ),
         )
 
+    def _on_next_uri_used(self, uri: Uri, track_uri: Uri | None) -> None:
+        # Audio has switched to the prepared next track at about-to-finish,
+        # without running the about-to-finish callback.
+        if self._state == PlaybackState.STOPPED or self._pending_tl_track:
+            # A play(), next(), or stop() was handled after audio switched,
+            # but before this event. Don't let the outdated next URI be used
+            # again.
+            logger.debug("Ignoring outdated next URI: %s", uri)
+            self._clear_next_track()
+            if self._audio:
+                self._audio.set_next_uri(None)
+            return
+
+        tl_track = self._get_prepared_tl_track(track_uri)
+        if tl_track is None:
+            # The tracklist changed after audio switched, e.g. the track was
+            # removed. Pick the next track like without a next URI.
+            logger.debug("Audio switched to an outdated next URI: %s", uri)
+            self._on_about_to_finish()
+            return
+
+        self._set_last_position_to_end()
+        self._pending_tl_track = tl_track
+
     def _on_about_to_finish(self) -> None:
         if self._state == PlaybackState.STOPPED:
             return
 
-        # Unless overridden by other calls (e.g. next / previous / stop) this
-        # will be the last position recorded until the track gets reassigned.
-        if self._current_tl_track is not None:
-            if self._current_tl_track.track.length is not None:
-                self._last_position = DurationMs(self._current_tl_track.track.length)
-            else:
-                self._last_position = None
-        else:
-            # TODO: Check if case when track.length isn't populated needs to be
-            # handled.
-            pass
+        self._set_last_position_to_end()
 
         pending = self.core.tracklist.eot_track(self._current_tl_track)
         # avoid endless loop if 'repeat' is 'true' and no track is playable
@@ -247,17 +365,42 @@ class PlaybackController:
                 logger.info("No playable track in the list.")
                 break
 
+    def _set_last_position_to_end(self) -> None:
+        # Unless overridden by other calls (e.g. next / previous / stop) this
+        # will be the last position recorded until the track gets reassigned.
+        if self._current_tl_track is not None:
+            if self._current_tl_track.track.length is not None:
+                self._last_position = DurationMs(self._current_tl_track.track.length)
+            else:
+                self._last_position = None
+        else:
+            # TODO: Check if case when track.length isn't populated needs to be
+            # handled.
+            pass
+
+    def _on_audio_state_changed(self) -> None:
+        # Audio may have paused or resumed on its own, e.g. when buffering.
+        self._position_anchor = None
+
     def _on_tracklist_change(self) -> None:
         """Tell the playback controller that the current playlist has changed.
 
         Used by [TracklistController][mopidy.core.TracklistController].
         """
-        tl_tracks = self.core.tracklist.get_tl_tracks()
-        if not tl_tracks:
+        tl_track = self.get_current_tl_track()
+        if not self.core.tracklist.get_length():
             self.stop()
             self._set_current_tl_track(None)
-        elif self.get_current_tl_track() not in tl_tracks:
+        elif tl_track is not None and not self.core.tracklist._contains(tl_track):
             self._set_current_tl_track(None)
+        self._update_next_track()
+
+    def _on_options_change(self) -> None:
+        """Tell the playback controller that the tracklist options have changed.
+
+        Used by [TracklistController][mopidy.core.TracklistController].
+        """
+        self._update_next_track()
 
     def next(self) -> None:
         """Change to the next track.
@@ -313,11 +456,8 @@ class PlaybackController:
         tl_track: TlTrack | None = None
         if tlid is not None:
             validation.check_integer(tlid, min=1)
-            for candidate_tl_track in self.core.tracklist.get_tl_tracks():
-                if candidate_tl_track.tlid == tlid:
-                    tl_track = candidate_tl_track
-                    break
-            else:
+            tl_track = self.core.tracklist._get_tl_track(tlid)
+            if tl_track is None:
                 logger.info(
                     "Tried to play track with TLID %d, "
                     "but it was not found in the tracklist.",
@@ -363,6 +503,7 @@ class PlaybackController:
 
         # TODO: Wrap backend call in error handling.
         backend.playback.prepare_change()
+        self._position_anchor = None
 
         try:
             if not backend.playback.change_track(pending_tl_track.track).get():
@@ -483,6 +624,7 @@ class PlaybackController:
         backend = self._get_backend(self.get_current_tl_track())
         if not backend:
             return False
+        self._position_anchor = None
         # TODO: Wrap backend call in error handling.
         return backend.playback.seek(time_position).get()
 
@@ -493,6 +635,7 @@ class PlaybackController:
             backend = self._get_backend(self.get_current_tl_track())
             # TODO: Wrap backend call in error handling.
             if not backend or backend.playback.stop().get():
+                self._clear_next_track()
                 self.set_state(PlaybackState.STOPPED)
 
     def _trigger_track_playback_paused(self) -> None:
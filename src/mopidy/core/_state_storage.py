@@ -9,6 +9,7 @@ from typing import Literal
 from pydantic.fields import Field
 from pydantic.types import NonNegativeInt  # noqa: TC002
 
+from mopidy._lib import interning
 from mopidy.models import Ref, TlTrack  # noqa: TC001
 from mopidy.models._base import BaseModel
 from mopidy.types import DurationMs, Percentage, PlaybackState, TracklistId
@@ -177,11 +178,28 @@ class StoredState(BaseModel):
             return None
         try:
             with gzip.open(str(path), "rb") as fp:
-                return StoredState.model_validate_json(fp.read())
+                stored_state = StoredState.model_validate_json(fp.read())
         except (OSError, ValueError) as exc:
             logger.warning(f"Loading JSON failed: {exc}")
             return None
 
+        # Share the albums and artists of the loaded tracks, which are
+        # otherwise parsed into new objects for every track.
+        tracklist = stored_state.state.tracklist
+        tracklist = tracklist.model_copy(
+            update={
+                "tl_tracks": tuple(
+                    interning.intern_tl_track(tl_track)
+                    for tl_track in tracklist.tl_tracks
+                )
+            }
+        )
+        return stored_state.model_copy(
+            update={
+                "state": stored_state.state.model_copy(update={"tracklist": tracklist})
+            }
+        )
+
     def dump(self, path: pathlib.Path) -> None:
         """Dump state to file."""
         # TODO: cleanup directory/basename.* files.
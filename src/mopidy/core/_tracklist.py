@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import logging
+import operator
 import random
 import warnings
+from collections import deque
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict, cast
 from warnings import deprecated
 
+import pykka
 from pykka.typing import proxy_method
 
 from mopidy import exceptions
+from mopidy._lib import interning
+from mopidy._lib.blocklist import BlockList
 from mopidy.core import _validation as validation
 from mopidy.core._state_storage import TracklistControllerState
 from mopidy.models import TlTrack, Track
@@ -25,24 +30,101 @@ if TYPE_CHECKING:
     from ._actor import Core
 
 
+# Number of changes to keep for clients catching up with get_changes().
+_CHANGE_JOURNAL_SIZE = 1000
+
+# Methods that can be used in operations passed to apply().
+_APPLY_METHODS = ("add", "clear", "move", "remove", "shuffle")
+
+# Number of lazily added URIs to look up at a time.
+_RESOLVE_BATCH_SIZE = 50
+
+
+class TracklistChange(TypedDict):
+    """A change to the tracklist, as returned by `get_changes()`.
+
+    Each change has exactly one of `inserted`, `removed`, `moved`, or
+    `updated` set:
+
+    `inserted`
+        The tracks were inserted at `position`.
+    `removed`
+        The tracks with these TLIDs were removed.
+    `moved`
+        The tracks with these TLIDs were taken out of the tracklist, and
+        inserted in the given order at `position`.
+    `updated`
+        The tracks with the same TLIDs were replaced by these, keeping their
+        positions. This happens when lazily added tracks are looked up.
+    """
+
+    version: int
+    inserted: list[TlTrack]
+    removed: list[TracklistId]
+    moved: list[TracklistId]
+    updated: list[TlTrack]
+    position: int | None
+
+
+class TracklistOperation(TypedDict):
+    """An operation to run with `apply()`.
+
+    `method` is the name of a tracklist method, and `params` the keyword
+    arguments to call it with.
+    """
+
+    method: str
+    params: NotRequired[dict[str, Any]]
+
+
+class ResolveTracksMessage:
+    """Message the core actor sends itself to look up lazily added tracks."""
+
+
 class TracklistController:
     """Manages the queued tracks."""
 
     def __init__(self, core: Core) -> None:
         self.core = core
         self._next_tlid: TracklistId = TracklistId(1)
-        self._tl_tracks: list[TlTrack] = []
         self._version: int = 0
 
+        # The tracklist is stored in blocks, so that inserting, moving, and
+        # removing tracks only copies the affected blocks, and the position of
+        # a track can be found from its TLID.
+        self._tl_tracks: BlockList[TlTrack, TracklistId] = BlockList(
+            key=operator.attrgetter("tlid")
+        )
+        self._tl_tracks_by_tlid: dict[TracklistId, TlTrack] = {}
+        self._tlids_by_uri: dict[Uri, set[TracklistId]] = {}
+
+        # The most recent changes, and the oldest version they cover.
+        self._changes: deque[TracklistChange] = deque()
+        self._changes_since: int = 0
+
+        # Set while apply() is running, to delay the version increase.
+        self._applying: bool = False
+        self._applied_changes: bool = False
+
+        # Lazily added tracks waiting to be looked up in the library.
+        self._unresolved: deque[TracklistId] = deque()
+        self._resolving: bool = False
+
         self._consume: bool = False
         self._random: bool = False
-        self._shuffled: list[TlTrack] = []
+
+        # The tracks left to play in random mode, in random order. New tracks
+        # are inserted at random positions, so the order never has to be
+        # rebuilt while the tracklist changes.
+        self._shuffled: BlockList[TlTrack, TracklistId] = BlockList(
+            key=operator.attrgetter("tlid")
+        )
         self._repeat: bool = False
         self._single: bool = False
 
     def get_tl_tracks(self) -> list[TlTrack]:
         """Get tracklist as list of [TlTrack][mopidy.models.TlTrack]."""
-        return self._tl_tracks[:]
+        return list(self._tl_tracks)
 
     def get_tracks(self) -> list[Track]:
         """Get tracklist as list of [Track][mopidy.models.Track]."""
@@ -60,7 +142,32 @@ class TracklistController:
         """
         return self._version
 
+    def get_changes(self, since_version: int) -> list[TracklistChange] | None:
+        """Get the changes made to the tracklist since the given version.
+
+        Lets clients keep a copy of a large tracklist in sync by applying the
+        changes in order, instead of fetching the whole tracklist every time
+        the [tracklist_changed][mopidy.core.CoreListener.tracklist_changed]
+        event is triggered.
+
+        Only a limited number of recent changes are kept. Returns `None` if
+        the changes since the given version are no longer available, or if
+        the version is newer than the current version, e.g. because Mopidy
+        was restarted. The client must then fetch the whole tracklist using
+        [get_tl_tracks][] and [get_version][] instead.
+
+        Args:
+            since_version: The tracklist version known by the client.
+        """
+        validation.check_integer(since_version, min=0)
+        if not self._changes_since <= since_version <= self._version:
+            return None
+        return [change for change in self._changes if change["version"] > since_version]
+
     def _increase_version(self) -> None:
+        if self._applying:
+            self._applied_changes = True
+            return
         self._version += 1
         self.core.playback._on_tracklist_change()
         self._trigger_tracklist_changed()
@@ -85,8 +192,8 @@ class TracklistController:
         """
         validation.check_boolean(value)
         if self.get_consume() != value:
+            self._consume = value
             self._trigger_options_changed()
-        self._consume = value
 
     def get_random(self) -> bool:
         """Get random mode.
@@ -107,12 +214,14 @@ class TracklistController:
             Tracks are played in the order of the tracklist.
         """
         validation.check_boolean(value)
-        if self.get_random() != value:
-            self._trigger_options_changed()
-        if value:
-            self._shuffled = self.get_tl_tracks()
-            random.shuffle(self._shuffled)
+        changed = self.get_random() != value
         self._random = value
+        if value:
+            self._reshuffle()
+        else:
+            self._shuffled.clear()
+        if changed:
+            self._trigger_options_changed()
 
     def get_repeat(self) -> bool:
         """Get repeat mode.
@@ -136,8 +245,8 @@ class TracklistController:
         """
         validation.check_boolean(value)
         if self.get_repeat() != value:
+            self._repeat = value
             self._trigger_options_changed()
-        self._repeat = value
 
     def get_single(self) -> bool:
         """Get single mode.
@@ -159,8 +268,8 @@ class TracklistController:
         """
         validation.check_boolean(value)
         if self.get_single() != value:
+            self._single = value
             self._trigger_options_changed()
-        self._single = value
 
     def index(
         self,
@@ -185,14 +294,11 @@ class TracklistController:
             tl_track = self.core.playback.get_current_tl_track()
 
         if tl_track is not None:
-            try:
-                return self._tl_tracks.index(tl_track)
-            except ValueError:
-                pass
-        elif tlid is not None:
-            for i, tl_track in enumerate(self._tl_tracks):
-                if tl_track.tlid == tlid:
-                    return i
+            if self._tl_tracks_by_tlid.get(tl_track.tlid) != tl_track:
+                return None
+            return self._tl_tracks.index_of_key(tl_track.tlid)
+        if tlid is not None:
+            return self._tl_tracks.index_of_key(tlid)
         return None
 
     def get_eot_tlid(self) -> TracklistId | None:
@@ -278,8 +384,7 @@ class TracklistController:
             and (self.get_repeat() or not tl_track)
         ):
             logger.debug("Shuffling tracks")
-            self._shuffled = self._tl_tracks[:]
-            random.shuffle(self._shuffled)
+            self._reshuffle()
 
         if self.get_random():
             if self._shuffled:
@@ -355,6 +460,7 @@ class TracklistController:
         *,
         at_position: int | None = None,
         uris: Iterable[Uri] | None = None,
+        lazy: bool = False,
     ) -> list[TlTrack]:
         """Add tracks to the tracklist.
 
@@ -362,6 +468,15 @@ class TracklistController:
         looked up in the library and the resulting tracks are added to the
         tracklist.
 
+        If `lazy` is set, the URIs are added right away as tracks with only
+        their URI set, and are looked up in the library afterwards, in
+        batches, without blocking other calls to core in between. Each batch
+        replaces the tracks with the tracks found in the library, keeping
+        their TLIDs, and triggers the
+        [tracklist_changed][mopidy.core.CoreListener.tracklist_changed]
+        event. URIs that are looked up to multiple tracks, like albums, are
+        expanded in place, and URIs without any tracks are removed.
+
         If `at_position` is given, the tracks are inserted at the given
         position in the tracklist. If `at_position` is not given, the tracks
         are appended to the end of the tracklist.
@@ -373,16 +488,21 @@ class TracklistController:
             tracks: Tracks to add.
             at_position: Position in tracklist to add tracks.
             uris: List of URIs for tracks to add.
+            lazy: Look up the URIs after adding them.
         """
         if sum(o is not None for o in [tracks, uris]) != 1:
             msg = 'Exactly one of "tracks" or "uris" must be set'
             raise ValueError(msg)
+        if lazy and uris is None:
+            msg = '"lazy" can only be set together with "uris"'
+            raise ValueError(msg)
 
         if tracks is not None:
             validation.check_instances(tracks, Track)
         if uris is not None:
             validation.check_uris(uris)
         validation.check_integer(at_position or 0)
+        validation.check_boolean(lazy)
 
         if tracks:
             warnings.warn(
@@ -392,28 +512,26 @@ class TracklistController:
             )
 
         if tracks is None:
-            tracks = []
             assert uris is not None
-            track_map = self.core.library.lookup(uris=uris)
-            for uri in uris:
-                tracks.extend(track_map[uri])
+            tracks = self._lookup_tracks(uris, lazy=lazy)
 
         tl_tracks = []
         max_length = self.core._config["core"]["max_tracklist_length"]
 
-        for track in tracks:
-            if self.get_length() >= max_length:
-                msg = f"Tracklist may contain at most {max_length:d} tracks."
-                raise exceptions.TracklistFull(msg)
-
-            tl_track = TlTrack(self._next_tlid, track)
-            self._next_tlid = TracklistId(self._next_tlid + 1)
-            if at_position is not None:
-                self._tl_tracks.insert(at_position, tl_track)
-                at_position += 1
-            else:
-                self._tl_tracks.append(tl_track)
-            tl_tracks.append(tl_track)
+        try:
+            for track in tracks:
+                if self.get_length() + len(tl_tracks) >= max_length:
+                    msg = f"Tracklist may contain at most {max_length:d} tracks."
+                    raise exceptions.TracklistFull(msg)
+
+                track = interning.intern_track(track)
+                tl_tracks.append(TlTrack(self._next_tlid, track))
+                self._next_tlid = TracklistId(self._next_tlid + 1)
+        finally:
+            # Tracks added before the tracklist got full are kept
+            self._insert(tl_tracks, at_position)
+            if lazy:
+                self._add_unresolved(tl_tracks)
 
         if tl_tracks:
             self._increase_version()
@@ -426,7 +544,7 @@ class TracklistController:
         Triggers the
         [tracklist_changed][mopidy.core.CoreListener.tracklist_changed] event.
         """
-        self._tl_tracks = []
+        self._set_tl_tracks([])
         self._increase_version()
 
     def filter(self, criteria: Query[TracklistField]) -> list[TlTrack]:
@@ -454,15 +572,39 @@ class TracklistController:
         Args:
             criteria: One or more rules to match by.
         """
-        tlids = criteria.pop("tlid", [])
+        tlids = cast(Iterable[TracklistId], criteria.pop("tlid", []))
         validation.check_query(criteria, validation.TRACKLIST_FIELDS.keys())
         validation.check_instances(tlids, int)
 
-        matches = self._tl_tracks
-        for key, values in criteria.items():
-            matches = [ct for ct in matches if getattr(ct.track, key) in values]
+        # Narrow down the candidates using the TLID and URI indexes, so that
+        # only the matching tracks are visited.
+        candidates: set[TracklistId] | None = None
         if tlids:
-            matches = [ct for ct in matches if ct.tlid in tlids]
+            candidates = self._tl_tracks_by_tlid.keys() & set(tlids)
+        if "uri" in criteria:
+            uris = cast("Iterable[Uri]", criteria["uri"])
+            uri_tlids = {
+                tlid for uri in set(uris) for tlid in self._tlids_by_uri.get(uri, ())
+            }
+            candidates = uri_tlids if candidates is None else candidates & uri_tlids
+
+        if candidates is None:
+            matches = list(self._tl_tracks)
+        else:
+            positions = {
+                tlid: position
+                for tlid in candidates
+                if (position := self._tl_tracks.index_of_key(tlid)) is not None
+            }
+            matches = [
+                self._tl_tracks_by_tlid[tlid]
+                for tlid in sorted(positions, key=positions.__getitem__)
+            ]
+        for key, values in criteria.items():
+            if key == "uri":
+                continue
+            wanted = set(values)
+            matches = [ct for ct in matches if getattr(ct.track, key) in wanted]
         return matches
 
     def move(self, start: int, end: int, to_position: int) -> None:
@@ -498,13 +640,74 @@ class TracklistController:
             msg = "to_position can not be larger than tracklist length"
             raise AssertionError(msg)
 
-        new_tl_tracks = tl_tracks[:start] + tl_tracks[end:]
-        for tl_track in tl_tracks[start:end]:
-            new_tl_tracks.insert(to_position, tl_track)
-            to_position += 1
-        self._tl_tracks = new_tl_tracks
+        moved = tl_tracks.delete(start, end)
+        tl_tracks.insert(to_position, moved)
+        self._record_change(moved=moved, position=to_position)
         self._increase_version()
 
+    def apply(self, operations: Iterable[TracklistOperation]) -> list[Any]:
+        """Run many tracklist operations as one change.
+
+        Each operation names one of the methods [add][], [clear][], [move][],
+        [remove][], or [shuffle][], along with the keyword arguments to call
+        it with:
+
+        ```python
+        apply([
+            {"method": "clear"},
+            {"method": "add", "params": {"uris": ["dummy:a", "dummy:b"]}},
+            {"method": "move", "params": {"start": 0, "end": 1, "to_position": 2}},
+        ])
+        ```
+
+        The operations are run in order, without any other calls to core in
+        between. The tracklist version is only increased once, and the
+        [tracklist_changed][mopidy.core.CoreListener.tracklist_changed]
+        event is only triggered once, after all operations have been run.
+
+        If an operation fails, the tracklist is restored to how it was before
+        the first operation, and the error is raised.
+
+        Returns a list with the return value of each operation.
+
+        Args:
+            operations: The operations to run.
+        """
+        operations = list(operations)
+        for operation in operations:
+            validation.check_instance(operation, dict)
+            validation.check_choice(operation.get("method"), _APPLY_METHODS)
+
+        tl_tracks = list(self._tl_tracks)
+        shuffled = list(self._shuffled)
+        next_tlid = self._next_tlid
+        unresolved = self._unresolved.copy()
+        self._applying = True
+        try:
+            results = [
+                getattr(self, operation["method"])(**operation.get("params", {}))
+                for operation in operations
+            ]
+        except Exception:
+            self._set_tl_tracks(tl_tracks)
+            # Restoring the tracks reshuffles them all in random mode, which
+            # would bring back tracks that were already played.
+            self._shuffled.clear()
+            self._shuffled.insert(0, shuffled)
+            self._next_tlid = next_tlid
+            self._unresolved = unresolved
+            while self._changes and self._changes[-1]["version"] > self._version:
+                self._changes.pop()
+            self._applied_changes = False
+            raise
+        finally:
+            self._applying = False
+
+        if self._applied_changes:
+            self._applied_changes = False
+            self._increase_version()
+        return results
+
     def remove(self, criteria: Query[TracklistField]) -> list[TlTrack]:
         """Remove the matching tracks from the tracklist.
 
@@ -519,9 +722,7 @@ class TracklistController:
             criteria: One or more rules to match by.
         """
         tl_tracks = self.filter(criteria)
-        for tl_track in tl_tracks:
-            position = self._tl_tracks.index(tl_track)
-            del self._tl_tracks[position]
+        self._discard(tl_tracks)
         self._increase_version()
         return tl_tracks
 
@@ -552,11 +753,11 @@ class TracklistController:
             msg = "end can not be larger than tracklist length"
             raise AssertionError(msg)
 
-        before = tl_tracks[: start or 0]
-        shuffled = tl_tracks[start:end]
-        after = tl_tracks[end or len(tl_tracks) :]
+        start, end, _ = slice(start, end).indices(len(tl_tracks))
+        shuffled = tl_tracks.delete(start, end)
         random.shuffle(shuffled)
-        self._tl_tracks = before + shuffled + after
+        tl_tracks.insert(start, shuffled)
+        self._record_change(moved=shuffled, position=start)
         self._increase_version()
 
     def slice(self, start: int, end: int) -> list[TlTrack]:
@@ -571,10 +772,187 @@ class TracklistController:
         # TODO: validate slice?
         return self._tl_tracks[start:end]
 
+    def _get_tl_track(self, tlid: TracklistId) -> TlTrack | None:
+        """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
+        return self._tl_tracks_by_tlid.get(tlid)
+
+    def _contains(self, tl_track: TlTrack) -> bool:
+        """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
+        return self._tl_tracks_by_tlid.get(tl_track.tlid) == tl_track
+
+    def _set_tl_tracks(self, tl_tracks: list[TlTrack]) -> None:
+        if self._tl_tracks:
+            self._record_change(removed=list(self._tl_tracks))
+        self._tl_tracks.clear()
+        self._shuffled.clear()
+        self._tl_tracks_by_tlid = {}
+        self._tlids_by_uri = {}
+        self._insert(tl_tracks, None)
+
+    def _insert(self, tl_tracks: list[TlTrack], at_position: int | None) -> None:
+        if not tl_tracks:
+            return
+        if at_position is None:
+            at_position = len(self._tl_tracks)
+        elif at_position < 0:
+            at_position = max(0, at_position + len(self._tl_tracks))
+        at_position = min(at_position, len(self._tl_tracks))
+        self._tl_tracks.insert(at_position, tl_tracks)
+        self._record_change(inserted=tl_tracks, position=at_position)
+        if self.get_random():
+            self._add_to_shuffled(tl_tracks)
+        for tl_track in tl_tracks:
+            self._tl_tracks_by_tlid[tl_track.tlid] = tl_track
+            self._tlids_by_uri.setdefault(tl_track.track.uri, set()).add(tl_track.tlid)
+
+    def _discard(self, tl_tracks: list[TlTrack]) -> None:
+        if not tl_tracks:
+            return
+        for tl_track in tl_tracks:
+            del self._tl_tracks_by_tlid[tl_track.tlid]
+            tlids = self._tlids_by_uri[tl_track.track.uri]
+            tlids.discard(tl_track.tlid)
+            if not tlids:
+                del self._tlids_by_uri[tl_track.track.uri]
+        self._tl_tracks.remove_keys(tl_track.tlid for tl_track in tl_tracks)
+        self._shuffled.remove_keys(tl_track.tlid for tl_track in tl_tracks)
+        self._record_change(removed=tl_tracks)
+
+    def _update(self, tl_tracks: list[TlTrack]) -> None:
+        # Replaces the tracks with the same TLIDs, without recording a change
+        for tl_track in tl_tracks:
+            old_uri = self._tl_tracks_by_tlid[tl_track.tlid].track.uri
+            tlids = self._tlids_by_uri[old_uri]
+            tlids.discard(tl_track.tlid)
+            if not tlids:
+                del self._tlids_by_uri[old_uri]
+            self._tl_tracks_by_tlid[tl_track.tlid] = tl_track
+            self._tlids_by_uri.setdefault(tl_track.track.uri, set()).add(tl_track.tlid)
+        self._tl_tracks.replace(tl_tracks)
+        self._shuffled.replace(tl_tracks)
+
+    def _record_change(
+        self,
+        *,
+        inserted: list[TlTrack] | None = None,
+        removed: list[TlTrack] | None = None,
+        moved: list[TlTrack] | None = None,
+        updated: list[TlTrack] | None = None,
+        position: int | None = None,
+    ) -> None:
+        # Changes are recorded before the version is increased, so they are
+        # tagged with the version they will be part of.
+        self._changes.append(
+            TracklistChange(
+                version=self._version + 1,
+                inserted=list(inserted or []),
+                removed=[tl_track.tlid for tl_track in removed or []],
+                moved=[tl_track.tlid for tl_track in moved or []],
+                updated=list(updated or []),
+                position=position,
+            )
+        )
+        while len(self._changes) > _CHANGE_JOURNAL_SIZE:
+            # The changes of the dropped version may be incomplete now
+            self._changes_since = self._changes.popleft()["version"]
+
+    def _reshuffle(self) -> None:
+        tl_tracks = list(self._tl_tracks)
+        random.shuffle(tl_tracks)
+        self._shuffled.clear()
+        self._shuffled.insert(0, tl_tracks)
+
+    def _add_to_shuffled(self, tl_tracks: list[TlTrack]) -> None:
+        # Inserting each track at a random position keeps the order random.
+        # When adding more tracks than are left to play, it is cheaper to
+        # shuffle them all together.
+        if len(tl_tracks) > len(self._shuffled):
+            tl_tracks = [*self._shuffled, *tl_tracks]
+            random.shuffle(tl_tracks)
+            self._shuffled.clear()
+            self._shuffled.insert(0, tl_tracks)
+            return
+        for tl_track in tl_tracks:
+            position = random.randint(0, len(self._shuffled))  # noqa: S311
+            self._shuffled.insert(position, [tl_track])
+
+    def _lookup_tracks(self, uris: Iterable[Uri], *, lazy: bool) -> list[Track]:
+        if lazy:
+            return [Track(uri=uri) for uri in uris]
+        track_map = self.core.library.lookup(uris=uris)
+        return [track for uri in uris for track in track_map[uri]]
+
+    def _add_unresolved(self, tl_tracks: list[TlTrack]) -> None:
+        if tl_tracks:
+            self._unresolved.extend(tl_track.tlid for tl_track in tl_tracks)
+            self._schedule_resolve()
+
+    def _schedule_resolve(self) -> None:
+        if self._resolving:
+            return
+        if pykka.ActorRegistry.get_by_urn(self.core.actor_urn) is None:
+            # Core is not running as an actor, e.g. in tests
+            while self._unresolved:
+                self._resolve_batch()
+            return
+        self._resolving = True
+        self.core.actor_ref.tell(ResolveTracksMessage())
+
+    def _resolve_tracks(self) -> None:
+        """Internal method for [Core][mopidy.core.Core]."""
+        self._resolving = False
+        self._resolve_batch()
+        if self._unresolved:
+            self._schedule_resolve()
+
+    def _resolve_batch(self) -> None:
+        batch: list[TlTrack] = []
+        while self._unresolved and len(batch) < _RESOLVE_BATCH_SIZE:
+            tlid = self._unresolved.popleft()
+            if (tl_track := self._tl_tracks_by_tlid.get(tlid)) is not None:
+                batch.append(tl_track)
+        if not batch:
+            return
+
+        uris = list(dict.fromkeys(tl_track.track.uri for tl_track in batch))
+        track_map = self.core.library.lookup(uris=uris)
+        max_length = self.core._config["core"]["max_tracklist_length"]
+        current_tl_track = self.core.playback.get_current_tl_track()
+
+        updated: list[TlTrack] = []
+        unresolvable: list[TlTrack] = []
+        for tl_track in batch:
+            tracks = track_map.get(tl_track.track.uri, [])
+            if not tracks:
+                unresolvable.append(tl_track)
+                continue
+
+            # The first track keeps the TLID, and any extra tracks get new ones
+            room = max(0, max_length - len(self._tl_tracks))
+            first = TlTrack(tl_track.tlid, interning.intern_track(tracks[0]))
+            extra = []
+            for track in tracks[1 : room + 1]:
+                extra.append(TlTrack(self._next_tlid, interning.intern_track(track)))
+                self._next_tlid = TracklistId(self._next_tlid + 1)
+
+            self._update([first])
+            updated.append(first)
+            position = self._tl_tracks.index_of_key(tl_track.tlid)
+            self._insert(extra, None if position is None else position + 1)
+            if current_tl_track == tl_track:
+                self.core.playback._set_current_tl_track(first)
+
+        # Clients get a single change for all the tracks looked up in the
+        # batch, instead of a removal and an insertion for each of them.
+        if updated:
+            self._record_change(updated=updated)
+        self._discard(unresolvable)
+        self._increase_version()
+
     def _mark_playing(self, tl_track: TlTrack) -> None:
         """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
-        if self.get_random() and tl_track in self._shuffled:
-            self._shuffled.remove(tl_track)
+        if self.get_random():
+            self._shuffled.remove_keys([tl_track.tlid])
 
     def _mark_unplayable(self, tl_track: TlTrack | None) -> None:
         """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
@@ -584,8 +962,8 @@ class TracklistController:
         )
         if self.get_consume() and tl_track is not None:
             self.remove({"tlid": [tl_track.tlid]})
-        if self.get_random() and tl_track in self._shuffled:
-            self._shuffled.remove(tl_track)
+        if self.get_random() and tl_track is not None:
+            self._shuffled.remove_keys([tl_track.tlid])
 
     def _mark_played(self, tl_track: TlTrack | None) -> bool:
         """Internal method for [PlaybackController][mopidy.core.PlaybackController]."""
@@ -595,16 +973,11 @@ class TracklistController:
         return False
 
     def _trigger_tracklist_changed(self) -> None:
-        if self.get_random():
-            self._shuffled = self._tl_tracks[:]
-            random.shuffle(self._shuffled)
-        else:
-            self._shuffled = []
-
         logger.debug("Triggering event: tracklist_changed()")
         CoreListener.send("tracklist_changed")
 
     def _trigger_options_changed(self) -> None:
+        self.core.playback._on_options_change()
         logger.debug("Triggering options changed event")
         CoreListener.send("options_changed")
 
@@ -631,7 +1004,7 @@ class TracklistController:
                 self.set_single(state.single)
             if "tracklist" in coverage:
                 self._next_tlid = max(TracklistId(state.next_tlid), self._next_tlid)
-                self._tl_tracks = list(state.tl_tracks)
+                self._set_tl_tracks(list(state.tl_tracks))
                 self._increase_version()
 
 
@@ -640,6 +1013,7 @@ class TracklistControllerProxy:
     get_tracks = proxy_method(TracklistController.get_tracks)
     get_length = proxy_method(TracklistController.get_length)
     get_version = proxy_method(TracklistController.get_version)
+    get_changes = proxy_method(TracklistController.get_changes)
     get_consume = proxy_method(TracklistController.get_consume)
     set_consume = proxy_method(TracklistController.set_consume)
     get_random = proxy_method(TracklistController.get_random)
@@ -659,6 +1033,7 @@ class TracklistControllerProxy:
     clear = proxy_method(TracklistController.clear)
     filter = proxy_method(TracklistController.filter)
     move = proxy_method(TracklistController.move)
+    apply = proxy_method(TracklistController.apply)
     remove = proxy_method(TracklistController.remove)
     shuffle = proxy_method(TracklistController.shuffle)
     slice = proxy_method(TracklistController.slice)
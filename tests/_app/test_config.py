@@ -22,7 +22,10 @@ def test_load_raw_config():
             "config_dir": "$XDG_CONFIG_DIR/mopidy",
             "data_dir": "$XDG_DATA_DIR/mopidy",
             "max_tracklist_length": "10000",
+            "lookup_cache_size": "0",
+            "library_timeout": "",
             "restore_state": "false",
+            "actor_stats": "false",
         },
         "logging": {
             "color": "true",
@@ -59,7 +62,10 @@ def test_validate_config():
             "config_dir": str(Path("~/.config/mopidy").expanduser()),
             "data_dir": str(Path("~/.local/share/mopidy").expanduser()),
             "max_tracklist_length": 10000,
+            "lookup_cache_size": 0,
+            "library_timeout": None,
             "restore_state": False,
+            "actor_stats": False,
         },
         "logging": {
             "color": True,
@@ -104,7 +110,10 @@ def test_format_config():
         "#config_dir = $XDG_CONFIG_DIR/mopidy",
         "#data_dir = $XDG_DATA_DIR/mopidy",
         "#max_tracklist_length = 10000",
+        "#lookup_cache_size = 0",
+        "#library_timeout = ",
         "#restore_state = false",
+        "#actor_stats = false",
         "",
         "[logging]",
         "#verbosity = 0",
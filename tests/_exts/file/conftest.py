@@ -18,9 +18,13 @@ def follow_symlinks():
 
 
 @pytest.fixture
-def config(media_dirs, follow_symlinks) -> Config:
+def config(tmp_path, media_dirs, follow_symlinks) -> Config:
     return Config(
         {
+            "core": {
+                "cache_dir": str(tmp_path / "cache"),
+                "data_dir": str(tmp_path / "data"),
+            },
             "proxy": {},
             "file": {
                 "show_dotfiles": False,
@@ -28,6 +32,7 @@ def config(media_dirs, follow_symlinks) -> Config:
                 "excluded_file_extensions": [".conf"],
                 "follow_symlinks": follow_symlinks,
                 "metadata_timeout": 1000,
+                "watch": False,
             },
         }
     )
@@ -35,4 +40,6 @@ def config(media_dirs, follow_symlinks) -> Config:
 
 @pytest.fixture
 def provider(config):
-    return backend.FileBackend(audio=mock.Mock(), config=config).library
+    library = backend.FileBackend(audio=mock.Mock(), config=config).library
+    yield library
+    library.stop_updating()
@@ -0,0 +1,141 @@
+import shutil
+import struct
+from unittest import mock
+
+import pytest
+
+from mopidy._exts.file.images import ImageCache, ImageInfo, get_image_info
+from mopidy._lib import paths
+from mopidy.audio.scan import _Result
+from mopidy.models import Image
+from tests import path_to_data_dir
+
+PNG_DATA = path_to_data_dir("scanner/image/test.png").read_bytes()
+
+# A JPEG header with an APP0 segment followed by a 640x480 start of frame
+JPEG_DATA = (
+    b"\xff\xd8\xff\xe0"
+    + struct.pack(">H", 16)
+    + b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    + b"\xff\xc0"
+    + struct.pack(">HBHH", 17, 8, 480, 640)
+)
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (PNG_DATA, ImageInfo("png", 20, 20)),
+        (JPEG_DATA, ImageInfo("jpg", 640, 480)),
+        (b"\xff\xd8\xff", ImageInfo("jpg", None, None)),
+        (b"GIF89a" + struct.pack("<HH", 32, 16), ImageInfo("gif", 32, 16)),
+        (b"not an image", None),
+    ],
+)
+def test_get_image_info(data, expected):
+    assert get_image_info(data) == expected
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ImageCache(tmp_path / "images")
+
+
+def test_store_is_content_addressed(cache):
+    image = cache.store(JPEG_DATA)
+
+    assert image is not None
+    assert image.uri.startswith("/file/images/")
+    assert image.uri.endswith(".jpg")
+    assert (image.width, image.height) == (640, 480)
+    assert cache.contains(image)
+    assert cache.store(JPEG_DATA) == image
+    assert len(list(cache.path.iterdir())) == 1
+
+
+def test_store_ignores_unknown_data(cache):
+    assert cache.store(b"not an image") is None
+
+
+def test_with_thumbnails(cache):
+    image = cache.store(JPEG_DATA)
+    digest = image.uri.removeprefix("/file/images/").removesuffix(".jpg")
+
+    result = cache.with_thumbnails(image)
+
+    assert result == [
+        image,
+        Image(uri=f"/file/images/{digest}-64.jpg", width=64, height=48),
+        Image(uri=f"/file/images/{digest}-300.jpg", width=300, height=225),
+    ]
+
+
+def test_with_thumbnails_skips_larger_widths(cache):
+    image = cache.store(PNG_DATA)
+
+    assert cache.with_thumbnails(image) == [image]
+
+
+def test_ensure(cache):
+    image = cache.store(JPEG_DATA)
+    name = image.uri.removeprefix("/file/images/")
+    digest = name.removesuffix(".jpg")
+
+    assert cache.ensure(name)
+    assert not cache.ensure("../tracks.db")
+    assert not cache.ensure(f"{digest}-123.jpg")
+    assert not cache.ensure(f"{'0' * 64}-64.jpg")
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    path = tmp_path / "media"
+    path.mkdir()
+    shutil.copy(path_to_data_dir("song1.wav"), path / "song1.wav")
+    return path
+
+
+@pytest.fixture
+def media_dirs(media_dir):
+    return [str(media_dir)]
+
+
+def test_get_images_from_folder(provider, media_dir):
+    shutil.copy(path_to_data_dir("scanner/image/test.png"), media_dir / "Cover.png")
+    track_uri = paths.path_to_uri(media_dir / "song1.wav")
+    dir_uri = paths.path_to_uri(media_dir)
+
+    result = provider.get_images([track_uri, dir_uri])
+
+    assert result[track_uri] == result[dir_uri]
+    assert len(result[track_uri]) == 1
+    assert (result[track_uri][0].width, result[track_uri][0].height) == (20, 20)
+
+
+def test_get_images_from_embedded_tags(provider, media_dir):
+    track_uri = paths.path_to_uri(media_dir / "song1.wav")
+    scan_result = _Result(
+        uri=track_uri,
+        tags={"image": [JPEG_DATA], "preview-image": [JPEG_DATA]},
+        duration=None,
+        seekable=True,
+        mime=None,
+        playable=True,
+    )
+
+    with mock.patch.object(
+        provider._scanner, "scan_many", return_value={track_uri: scan_result}
+    ):
+        first = provider.get_images([track_uri])
+    with mock.patch.object(provider._scanner, "scan_many") as scan_many_mock:
+        second = provider.get_images([track_uri])
+
+    assert [image.width for image in first[track_uri]] == [640, 64, 300]
+    scan_many_mock.assert_called_once_with({})
+    assert second == first
+
+
+def test_get_images_outside_media_dirs(provider):
+    uri = paths.path_to_uri(path_to_data_dir("song1.wav"))
+
+    assert provider.get_images([uri]) == {}
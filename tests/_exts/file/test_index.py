@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from mopidy._exts.file.index import TrackIndex
+from mopidy.models import Track
+from mopidy.types import Uri
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = TrackIndex(tmp_path / "tracks.db")
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def song(tmp_path):
+    path = tmp_path / "song.mp3"
+    path.write_bytes(b"data")
+    return path
+
+
+def test_get_returns_none_for_unknown_uri(index, song):
+    assert index.get(Uri("file:///unknown.mp3"), song.stat()) is None
+
+
+def test_get_returns_track_for_unchanged_file(index, song):
+    track = Track(uri=Uri(song.as_uri()), name="Song", length=1000)
+
+    index.put(track.uri, song.stat(), track)
+
+    assert index.get(track.uri, song.stat()) == track
+    assert len(index) == 1
+
+
+def test_get_returns_none_if_mtime_changed(index, song):
+    track = Track(uri=Uri(song.as_uri()), name="Song")
+    index.put(track.uri, song.stat(), track)
+
+    stat = song.stat()
+    os.utime(song, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert index.get(track.uri, song.stat()) is None
+
+
+def test_get_returns_none_if_size_changed(index, song):
+    track = Track(uri=Uri(song.as_uri()), name="Song")
+    index.put(track.uri, song.stat(), track)
+
+    stat = song.stat()
+    song.write_bytes(b"more data")
+    os.utime(song, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert index.get(track.uri, song.stat()) is None
+
+
+def test_get_returns_none_for_failed_scan(index, song):
+    uri = Uri(song.as_uri())
+
+    index.put(uri, song.stat(), None)
+
+    assert index.get(uri, song.stat()) is None
+    assert len(index) == 1
+
+
+def test_get_file_stats(index, tmp_path, song):
+    other = tmp_path.parent / "other.mp3"
+    index.put(Uri(song.as_uri()), song.stat(), Track(uri=Uri(song.as_uri())))
+    index.put(Uri(other.as_uri()), song.stat(), None)
+
+    result = index.get_file_stats(tmp_path.as_uri() + "/")
+
+    stat = song.stat()
+    assert result == {song.as_uri(): (stat.st_mtime_ns, stat.st_size)}
+    assert len(index.get_file_stats()) == 2
+
+
+def test_remove(index, song):
+    track = Track(uri=Uri(song.as_uri()))
+    index.put(track.uri, song.stat(), track)
+
+    index.remove([track.uri])
+
+    assert index.get(track.uri, song.stat()) is None
+    assert len(index) == 0
+
+
+def test_index_is_persistent(tmp_path, song):
+    track = Track(uri=Uri(song.as_uri()), name="Song")
+    index = TrackIndex(tmp_path / "tracks.db")
+    index.put(track.uri, song.stat(), track)
+    index.close()
+
+    index = TrackIndex(tmp_path / "tracks.db")
+
+    assert index.get(track.uri, song.stat()) == track
+    index.close()
+
+
+def test_broken_index_is_recreated(tmp_path, song):
+    path = tmp_path / "tracks.db"
+    path.write_bytes(b"not a database" * 100)
+
+    index = TrackIndex(path)
+
+    assert len(index) == 0
+    index.close()
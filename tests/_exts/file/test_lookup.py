@@ -31,3 +31,66 @@ def test_lookup(provider, track_uri):
         track = result[0]
         assert track.uri == track_uri
         assert track.name == "song1.wav"
+
+
+def test_lookup_uses_index_for_unchanged_file(provider):
+    track_uri = paths.path_to_uri(path_to_data_dir("song1.wav"))
+    first = provider.lookup(track_uri)
+
+    with mock.patch.object(provider._scanner, "scan") as scan_mock:
+        second = provider.lookup(track_uri)
+
+    scan_mock.assert_not_called()
+    assert second == first
+    assert second[0].last_modified is not None
+
+
+def test_lookup_rescans_changed_file(provider, tmp_path):
+    path = tmp_path / "song.wav"
+    path.write_bytes(path_to_data_dir("song1.wav").read_bytes())
+    track_uri = paths.path_to_uri(path)
+    provider.lookup(track_uri)
+
+    with path.open("ab") as fh:
+        fh.write(b"\0" * 16)
+
+    with mock.patch.object(
+        provider._scanner,
+        "scan",
+        side_effect=exceptions.ScannerError("test"),
+    ) as scan_mock:
+        result = provider.lookup(track_uri)
+
+    scan_mock.assert_called_once()
+    assert result[0].length is None
+
+
+def test_lookup_many(provider):
+    track_uris = [
+        paths.path_to_uri(path_to_data_dir(name))
+        for name in ("song1.wav", "song2.wav", "song3.wav")
+    ]
+
+    result = provider.lookup_many(track_uris)
+
+    assert set(result) == set(track_uris)
+    for uri in track_uris:
+        assert len(result[uri]) == 1
+        assert result[uri][0].uri == uri
+        assert result[uri][0].length is not None
+
+
+def test_lookup_many_only_scans_unindexed_files(provider):
+    indexed_uri = paths.path_to_uri(path_to_data_dir("song1.wav"))
+    new_uri = paths.path_to_uri(path_to_data_dir("song2.wav"))
+    provider.lookup(indexed_uri)
+
+    with mock.patch.object(
+        provider._scanner,
+        "scan_many",
+        wraps=provider._scanner.scan_many,
+    ) as scan_many_mock:
+        result = provider.lookup_many([indexed_uri, new_uri])
+
+    scan_many_mock.assert_called_once_with({new_uri: mock.ANY})
+    assert result[indexed_uri][0].length == 4406
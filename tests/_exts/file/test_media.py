@@ -0,0 +1,121 @@
+import os
+from unittest import mock
+
+import pytest
+
+from mopidy._exts.file.media import MediaEntry, MediaTree
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    path = tmp_path / "media"
+    (path / "b").mkdir(parents=True)
+    (path / "a.mp3").write_bytes(b"a")
+    (path / "b" / "c.mp3").write_bytes(b"c")
+    (path / "b" / "d.conf").write_bytes(b"d")
+    (path / ".hidden.mp3").write_bytes(b"e")
+    return path
+
+
+@pytest.fixture
+def media_dirs(media_dir):
+    return [str(media_dir)]
+
+
+def test_walk(config, media_dir):
+    tree = MediaTree(config)
+
+    result = [(path, stat.st_size) for path, stat in tree.walk()]
+
+    assert result == [
+        (media_dir / "a.mp3", 1),
+        (media_dir / "b" / "c.mp3", 1),
+    ]
+
+
+def test_walk_subdir(config, media_dir):
+    tree = MediaTree(config)
+
+    result = [path for path, _ in tree.walk([media_dir / "b"])]
+
+    assert result == [media_dir / "b" / "c.mp3"]
+
+
+@pytest.mark.parametrize("follow_symlinks", [True])
+def test_walk_visits_each_dir_once(config, media_dir):
+    (media_dir / "b" / "loop").symlink_to(media_dir)
+    tree = MediaTree(config)
+
+    result = [path for path, _ in tree.walk()]
+
+    assert result == [
+        media_dir / "a.mp3",
+        media_dir / "b" / "c.mp3",
+    ]
+
+
+def test_walk_skips_symlinks(config, media_dir):
+    (media_dir / "link.mp3").symlink_to(media_dir / "a.mp3")
+    tree = MediaTree(config)
+
+    result = [path for path, _ in tree.walk()]
+
+    assert media_dir / "link.mp3" not in result
+
+
+def test_walk_files(config, media_dir):
+    tree = MediaTree(config)
+
+    result = [
+        path
+        for path, _ in tree.walk(
+            [media_dir / "a.mp3", media_dir / ".hidden.mp3", media_dir / "gone.mp3"]
+        )
+    ]
+
+    assert result == [media_dir / "a.mp3"]
+
+
+def test_walk_dirs(config, media_dir):
+    tree = MediaTree(config)
+
+    assert list(tree.walk_dirs()) == [media_dir, media_dir / "b"]
+
+
+def test_iterdir(config, media_dir):
+    tree = MediaTree(config)
+
+    result = sorted(tree.iterdir(media_dir))
+
+    assert result == [
+        MediaEntry("a.mp3", media_dir / "a.mp3", is_dir=False),
+        MediaEntry("b", media_dir / "b", is_dir=True),
+    ]
+
+
+def test_iterdir_caches_listing_until_dir_changes(config, media_dir):
+    tree = MediaTree(config)
+    first = tree.iterdir(media_dir)
+
+    with mock.patch.object(tree, "_scandir") as scandir_mock:
+        assert tree.iterdir(media_dir) == first
+    scandir_mock.assert_not_called()
+
+    (media_dir / "new.mp3").write_bytes(b"new")
+    stat = media_dir.stat()
+    os.utime(media_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert len(tree.iterdir(media_dir)) == 3
+
+
+@pytest.mark.parametrize("follow_symlinks", [True])
+def test_iterdir_resolves_symlinks(config, media_dir, tmp_path):
+    (media_dir / "link.mp3").symlink_to(media_dir / "b" / "c.mp3")
+    (media_dir / "outside.mp3").symlink_to(tmp_path / "outside.mp3")
+    (tmp_path / "outside.mp3").write_bytes(b"outside")
+    tree = MediaTree(config)
+
+    result = sorted(tree.iterdir(media_dir))
+
+    assert MediaEntry("link.mp3", media_dir / "b" / "c.mp3", is_dir=False) in result
+    assert "outside.mp3" not in {entry.name for entry in result}
@@ -0,0 +1,154 @@
+import shutil
+import threading
+from unittest import mock
+
+import pytest
+
+from mopidy._exts.file.library import IndexStats, update_index
+from mopidy._lib import paths
+from tests import path_to_data_dir
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    path = tmp_path / "media"
+    (path / "album").mkdir(parents=True)
+    for name in ("song1.wav", "song2.wav"):
+        shutil.copy(path_to_data_dir(name), path / name)
+    shutil.copy(path_to_data_dir("song3.wav"), path / "album" / "song3.wav")
+    (path / "notes.txt").write_text("Not audio")
+    return path
+
+
+@pytest.fixture
+def media_dirs(media_dir):
+    return [str(media_dir)]
+
+
+def update(provider, local_path=None) -> IndexStats:
+    return update_index(
+        provider._tree,
+        provider._index,
+        provider._scanner,
+        None if local_path is None else [local_path],
+    )
+
+
+def test_update_index_scans_all_files(provider):
+    stats = update(provider)
+
+    assert stats.files == 4
+    assert stats.scanned == 4
+    assert stats.failed == 1
+    assert stats.removed == 0
+    assert len(provider._index) == 4
+
+
+def test_update_index_only_scans_changed_files(provider, media_dir):
+    update(provider)
+    with (media_dir / "song2.wav").open("ab") as fh:
+        fh.write(b"\0" * 16)
+
+    with mock.patch.object(
+        provider._scanner,
+        "scan_many",
+        wraps=provider._scanner.scan_many,
+    ) as scan_many_mock:
+        stats = update(provider)
+
+    scan_many_mock.assert_called_once_with(
+        {paths.path_to_uri(media_dir / "song2.wav"): mock.ANY}
+    )
+    assert stats.files == 4
+    assert stats.scanned == 1
+    assert stats.failed == 0
+
+
+def test_update_index_removes_deleted_files(provider, media_dir):
+    update(provider)
+    (media_dir / "album" / "song3.wav").unlink()
+
+    stats = update(provider)
+
+    assert stats.scanned == 0
+    assert stats.removed == 1
+    assert len(provider._index) == 3
+
+
+def test_update_index_of_subdir_keeps_other_files(provider, media_dir):
+    update(provider)
+
+    stats = update(provider, media_dir / "album")
+
+    assert stats.files == 1
+    assert stats.removed == 0
+    assert len(provider._index) == 4
+
+
+def test_refresh_populates_index_used_by_lookup(provider, media_dir):
+    track_uri = paths.path_to_uri(media_dir / "song1.wav")
+
+    provider.refresh()
+    provider._wait_for_updates()
+
+    with mock.patch.object(provider._scanner, "scan_many") as scan_many_mock:
+        result = provider.lookup(track_uri)
+
+    scan_many_mock.assert_called_once_with({})
+    assert result[0].length == 4406
+
+
+def test_refresh_scans_in_background(provider):
+    threads = []
+
+    def scan_many(files):
+        threads.append(threading.current_thread().name)
+        return {}
+
+    with mock.patch.object(provider._scanner, "scan_many", side_effect=scan_many):
+        provider.refresh()
+        provider._wait_for_updates()
+
+    assert threads == ["FileIndexUpdater"]
+
+
+def test_refresh_rejects_uri_outside_media_dirs(provider, caplog):
+    provider.refresh(paths.path_to_uri(path_to_data_dir("")))
+
+    assert "Rejected attempt to refresh" in caplog.text
+    assert len(provider._index) == 0
+
+
+def test_refresh_paths_updates_changed_files(provider, media_dir):
+    update(provider)
+    (media_dir / "album" / "song3.wav").unlink()
+    shutil.copy(path_to_data_dir("song4.wav"), media_dir / "album" / "song4.wav")
+
+    provider.refresh_paths(
+        [media_dir / "album" / "song3.wav", media_dir / "album" / "song4.wav"]
+    )
+    provider._wait_for_updates()
+
+    assert set(provider._index.get_file_stats()) == {
+        paths.path_to_uri(media_dir / name)
+        for name in ("song1.wav", "song2.wav", "notes.txt", "album/song4.wav")
+    }
+
+
+def test_refresh_paths_of_deleted_dir(provider, media_dir):
+    update(provider)
+    shutil.rmtree(media_dir / "album")
+
+    provider.refresh_paths([media_dir / "album"])
+    provider._wait_for_updates()
+
+    assert len(provider._index) == 3
+
+
+def test_refresh_changes_library_version(provider, media_dir):
+    version = provider.get_version()
+
+    provider.refresh_paths([media_dir / "notes.txt"])
+    provider._wait_for_updates()
+
+    assert provider.get_version() != version
@@ -0,0 +1,164 @@
+import shutil
+
+import pytest
+
+from mopidy._exts.file.search import SearchIndex
+from mopidy._lib import paths
+from mopidy.models import Album, Artist, SearchResult, Track
+from mopidy.types import Uri
+from tests import path_to_data_dir
+
+track1 = Track(
+    uri=Uri("file:///music/a/1.mp3"),
+    name="Intro",
+    artists=frozenset({Artist(name="ABBA")}),
+    album=Album(name="Arrival", artists=frozenset({Artist(name="ABBA")})),
+    genre="Pop",
+    date="1976",
+    track_no=1,
+)
+track2 = Track(
+    uri=Uri("file:///music/a/2.mp3"),
+    name="Dancing Queen",
+    artists=frozenset({Artist(name="ABBA")}),
+    album=Album(name="Arrival", artists=frozenset({Artist(name="ABBA")})),
+    genre="Pop",
+    date="1976",
+    track_no=2,
+)
+track3 = Track(
+    uri=Uri("file:///music/b/1.mp3"),
+    name="Queen Bee",
+    artists=frozenset({Artist(name="Queens of the Stone Age")}),
+    composers=frozenset({Artist(name="Josh Homme")}),
+    genre="Rock",
+    track_no=1,
+)
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([track1, track2, track3])
+
+
+def test_search_exact(index):
+    assert index.search({"artist": ["ABBA"]}, exact=True) == {track1.uri, track2.uri}
+    assert index.search({"artist": ["abba"]}, exact=True) == set()
+
+
+def test_search_substring_ignores_case(index):
+    assert index.search({"track_name": ["queen"]}) == {track2.uri, track3.uri}
+
+
+def test_search_requires_all_values_to_match(index):
+    assert index.search({"any": ["queen"], "genre": ["pop"]}) == {track2.uri}
+    assert index.search({"any": ["queen", "bee"]}) == {track3.uri}
+
+
+def test_search_any_includes_uri(index):
+    assert index.search({"any": ["/b/"]}) == {track3.uri}
+
+
+def test_search_int_field(index):
+    assert index.search({"track_no": [1]}) == {track1.uri, track3.uri}
+    assert index.search({"track_no": ["2"]}, exact=True) == {track2.uri}
+    assert index.search({"track_no": ["x"]}) == set()
+
+
+def test_search_unknown_field(index):
+    assert index.search({"foo": ["bar"]}) == set()
+
+
+def test_get_distinct(index):
+    assert index.get_distinct("artist") == {"ABBA", "Queens of the Stone Age"}
+    assert index.get_distinct("track_no") == {1, 2}
+    assert index.get_distinct("album") == {"Arrival"}
+
+
+def test_get_distinct_of_matching_tracks(index):
+    uris = index.search({"genre": ["Rock"]}, exact=True)
+
+    assert index.get_distinct("composer", uris) == {"Josh Homme"}
+    assert index.get_distinct("track", uris) == {"Queen Bee"}
+
+
+def test_add_replaces_track(index):
+    index.add([track3.replace(genre="Stoner Rock")])
+
+    assert len(index) == 3
+    assert index.get_distinct("genre") == {"Pop", "Stoner Rock"}
+
+
+def test_remove(index):
+    index.remove([track3.uri, Uri("file:///unknown.mp3")])
+
+    assert track3.uri not in index
+    assert index.search({"track_name": ["queen"]}) == {track2.uri}
+    assert index.get_distinct("genre") == {"Pop"}
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    path = tmp_path / "media"
+    path.mkdir()
+    for name in ("song1.wav", "song2.wav"):
+        shutil.copy(path_to_data_dir(name), path / name)
+    return path
+
+
+@pytest.fixture
+def media_dirs(media_dir):
+    return [str(media_dir)]
+
+
+def test_provider_search(provider, media_dir):
+    provider.refresh()
+    provider._wait_for_updates()
+
+    result = provider.search({"any": ["song1"]})
+
+    assert result == SearchResult(
+        tracks=tuple(provider.lookup(paths.path_to_uri(media_dir / "song1.wav")))
+    )
+
+
+def test_provider_search_limited_to_uris(provider, media_dir, tmp_path):
+    provider.refresh()
+    provider._wait_for_updates()
+
+    assert len(provider.search({"any": ["song"]}, uris=["file:"]).tracks) == 2
+    result = provider.search(
+        {"any": ["song"]},
+        uris=[paths.path_to_uri(tmp_path / "other")],
+    )
+    assert result.tracks == ()
+
+
+def test_provider_search_page(provider, media_dir):
+    provider.refresh()
+    provider._wait_for_updates()
+    tracks = provider.search({"any": ["song"]}).tracks
+
+    first = provider.search_page({"any": ["song"]}, offset=0, limit=1)
+    second = provider.search_page({"any": ["song"]}, offset=1, limit=1)
+
+    assert first.tracks + second.tracks == tracks
+    assert provider.search_page({"any": ["song"]}, offset=2).tracks == ()
+
+
+def test_provider_search_includes_looked_up_tracks(provider, media_dir):
+    provider.search({"any": ["song"]})
+
+    provider.lookup(paths.path_to_uri(media_dir / "song2.wav"))
+
+    assert len(provider.search({"any": ["song"]}).tracks) == 1
+
+
+def test_provider_get_distinct(provider, media_dir):
+    song1_uri = paths.path_to_uri(media_dir / "song1.wav")
+    song2_uri = paths.path_to_uri(media_dir / "song2.wav")
+    provider.refresh()
+    provider._wait_for_updates()
+
+    assert provider.get_distinct("uri") == {song1_uri, song2_uri}
+    assert provider.get_distinct("track", {"uri": [song1_uri]}) == {"song1.wav"}
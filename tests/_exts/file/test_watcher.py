@@ -0,0 +1,79 @@
+import queue
+import sys
+import time
+
+import pytest
+
+from mopidy._exts.file import watcher
+from mopidy._exts.file.media import MediaTree
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"),
+    reason="inotify is only available on Linux",
+)
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    path = tmp_path / "media"
+    (path / "album").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def media_dirs(media_dir):
+    return [str(media_dir)]
+
+
+@pytest.fixture
+def changes(config, monkeypatch):
+    monkeypatch.setattr(watcher, "DEBOUNCE_DELAY", 0.2)
+    result = queue.Queue()
+    media_watcher = watcher.MediaWatcher(MediaTree(config), result.put)
+    media_watcher.start()
+    # Wait for the watcher to set up its watches
+    while not media_watcher._watches:
+        time.sleep(0.01)
+    yield result
+    media_watcher.stop()
+    media_watcher.join()
+
+
+def test_reports_new_file(changes, media_dir):
+    (media_dir / "album" / "song.mp3").write_bytes(b"data")
+
+    assert changes.get(timeout=5) == {media_dir / "album" / "song.mp3"}
+
+
+def test_batches_bursts_of_changes(changes, media_dir):
+    for i in range(20):
+        (media_dir / "album" / f"song{i}.mp3").write_bytes(b"data")
+
+    assert len(changes.get(timeout=5)) == 20
+    assert changes.empty()
+
+
+def test_reports_deleted_file(changes, media_dir):
+    path = media_dir / "album" / "song.mp3"
+    path.write_bytes(b"data")
+    changes.get(timeout=5)
+
+    path.unlink()
+
+    assert changes.get(timeout=5) == {path}
+
+
+def test_watches_new_directories(changes, media_dir):
+    new_dir = media_dir / "new"
+    new_dir.mkdir()
+    assert changes.get(timeout=5) == {new_dir}
+
+    (new_dir / "song.mp3").write_bytes(b"data")
+
+    assert changes.get(timeout=5) == {new_dir / "song.mp3"}
+
+
+def test_remove_nested(tmp_path):
+    assert watcher._remove_nested(
+        {tmp_path / "a", tmp_path / "a" / "b", tmp_path / "c"}
+    ) == {tmp_path / "a", tmp_path / "c"}
@@ -9,7 +9,8 @@ import tornado.web
 import tornado.websocket
 
 import mopidy
-from mopidy._exts.http import handlers
+from mopidy._exts.http import handlers, metrics
+from mopidy._lib.metrics import Gauge
 
 
 class StaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
@@ -113,6 +114,23 @@ class WebSocketHandlerTest(tornado.testing.AsyncHTTPTestCase):
         assert exc_info.value.code == 403
 
 
+def test_broadcast_counts_pending_messages(mocker):
+    client = mock.Mock()
+    io_loop = mock.Mock()
+    mocker.patch.object(handlers.WebSocketHandler, "clients", {client})
+    mocker.patch.object(metrics, "pending_broadcasts", Gauge())
+
+    handlers.WebSocketHandler.broadcast("message", io_loop)
+
+    assert metrics.pending_broadcasts.get() == 1
+
+    send = io_loop.add_callback.call_args[0][0]
+    send()
+
+    client.write_message.assert_called_once_with("message")
+    assert metrics.pending_broadcasts.get() == 0
+
+
 class JsonRpcHandlerTestBase(tornado.testing.AsyncHTTPTestCase):
     csrf_protection = True
 
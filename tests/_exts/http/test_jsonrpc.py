@@ -8,6 +8,7 @@ import pytest
 
 from mopidy import core, models
 from mopidy._exts.http import jsonrpc
+from mopidy._lib.metrics import Summary
 from tests import dummy_backend
 
 
@@ -637,6 +638,31 @@ class JsonRpcBatchErrorTest(JsonRpcTestBase):
         assert response_9.result is False
 
 
+class JsonRpcRequestDurationsTest(JsonRpcTestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.durations = Summary()
+        self.wrapper.request_durations = self.durations
+
+    def test_calls_are_recorded_by_method(self) -> None:
+        for method in ["hello", "calc.model", "calc.fail", "calc.model"]:
+            self.wrapper.handle_data({"jsonrpc": "2.0", "method": method, "id": 1})
+
+        durations = self.durations.collect()
+
+        assert {method: count for method, (count, _) in durations.items()} == {
+            "hello": 1,
+            "calc.model": 2,
+            "calc.fail": 1,
+        }
+        assert all(total >= 0 for _, total in durations.values())
+
+    def test_calls_to_unknown_methods_are_not_recorded(self) -> None:
+        self.wrapper.handle_data({"jsonrpc": "2.0", "method": "calc.bogus", "id": 1})
+
+        assert self.durations.collect() == {}
+
+
 class JsonRpcInspectorTest(JsonRpcTestBase):
     def test_empty_object_mounts_is_not_allowed(self) -> None:
         with pytest.raises(AttributeError):
@@ -0,0 +1,162 @@
+import pytest
+
+from mopidy._exts.http import metrics
+from mopidy._lib.metrics import Gauge, Summary
+from mopidy.types import PlaybackState
+
+
+@pytest.fixture
+def durations(monkeypatch):
+    jsonrpc_durations = Summary()
+    scan_durations = Summary()
+    monkeypatch.setattr(metrics, "jsonrpc_request_durations", jsonrpc_durations)
+    monkeypatch.setattr(metrics, "scan_durations", scan_durations)
+    return jsonrpc_durations, scan_durations
+
+
+def test_format_metrics():
+    result = metrics.format_metrics(
+        [
+            metrics.Metric(
+                "foo_total",
+                "counter",
+                "Number of foos.",
+                [
+                    metrics.Sample("foo_total", {"name": 'a "b"\\c\n'}, 3),
+                    metrics.Sample("foo_total", {}, 1.5),
+                ],
+            ),
+            metrics.Metric("bar", "gauge", "Not shown without samples.", []),
+        ]
+    )
+
+    assert result == (
+        "# HELP foo_total Number of foos.\n"
+        "# TYPE foo_total counter\n"
+        'foo_total{name="a \\"b\\"\\\\c\\n"} 3\n'
+        "foo_total 1.5\n"
+    )
+
+
+def test_get_actor_metrics():
+    result = metrics.format_metrics(
+        metrics.get_actor_metrics(
+            [
+                {
+                    "actor": "Core",
+                    "mailbox_depth": 2,
+                    "max_mailbox_depth": 5,
+                    "methods": [
+                        {
+                            "method": "playback.play",
+                            "calls": 3,
+                            "wait_time": 0.25,
+                            "run_time": 0.5,
+                        },
+                    ],
+                },
+            ]
+        )
+    )
+
+    assert result.splitlines() == [
+        "# HELP mopidy_actor_calls_total Number of calls handled by the actor.",
+        "# TYPE mopidy_actor_calls_total counter",
+        'mopidy_actor_calls_total{actor="Core",method="playback.play"} 3',
+        "# HELP mopidy_actor_call_wait_seconds_total "
+        "Time calls spent waiting in the actor's inbox.",
+        "# TYPE mopidy_actor_call_wait_seconds_total counter",
+        'mopidy_actor_call_wait_seconds_total{actor="Core",method="playback.play"}'
+        " 0.25",
+        "# HELP mopidy_actor_call_run_seconds_total "
+        "Time the actor spent running calls.",
+        "# TYPE mopidy_actor_call_run_seconds_total counter",
+        'mopidy_actor_call_run_seconds_total{actor="Core",method="playback.play"} 0.5',
+        "# HELP mopidy_actor_mailbox_depth "
+        "Number of calls waiting in the actor's inbox.",
+        "# TYPE mopidy_actor_mailbox_depth gauge",
+        'mopidy_actor_mailbox_depth{actor="Core"} 2',
+        "# HELP mopidy_actor_mailbox_depth_max "
+        "Highest number of calls waiting in the actor's inbox.",
+        "# TYPE mopidy_actor_mailbox_depth_max gauge",
+        'mopidy_actor_mailbox_depth_max{actor="Core"} 5',
+    ]
+
+
+def test_get_actor_metrics_without_stats():
+    assert metrics.format_metrics(metrics.get_actor_metrics([])) == ""
+
+
+def test_get_core_metrics():
+    result = metrics.format_metrics(
+        metrics.get_core_metrics(
+            playback_state=PlaybackState.PLAYING,
+            tracklist_length=10,
+            tracklist_version=3,
+        )
+    )
+
+    assert result.splitlines() == [
+        "# HELP mopidy_playback_state Whether playback is in the given state.",
+        "# TYPE mopidy_playback_state gauge",
+        'mopidy_playback_state{state="paused"} 0',
+        'mopidy_playback_state{state="playing"} 1',
+        'mopidy_playback_state{state="stopped"} 0',
+        "# HELP mopidy_tracklist_length Number of tracks in the tracklist.",
+        "# TYPE mopidy_tracklist_length gauge",
+        "mopidy_tracklist_length 10",
+        "# HELP mopidy_tracklist_version "
+        "Version of the tracklist, increased on every change.",
+        "# TYPE mopidy_tracklist_version gauge",
+        "mopidy_tracklist_version 3",
+    ]
+
+
+def test_get_http_metrics(durations, monkeypatch):
+    jsonrpc_durations, _ = durations
+    jsonrpc_durations.observe("core.playback.play", 0.5)
+    jsonrpc_durations.observe("core.playback.play", 0.25)
+    monkeypatch.setattr(metrics, "pending_broadcasts", Gauge())
+
+    result = metrics.format_metrics(metrics.get_http_metrics(websocket_clients=2))
+
+    assert result.splitlines() == [
+        "# HELP mopidy_jsonrpc_request_duration_seconds Time taken by JSON-RPC calls.",
+        "# TYPE mopidy_jsonrpc_request_duration_seconds summary",
+        'mopidy_jsonrpc_request_duration_seconds_count{method="core.playback.play"} 2',
+        'mopidy_jsonrpc_request_duration_seconds_sum{method="core.playback.play"} 0.75',
+        "# HELP mopidy_websocket_clients Number of connected WebSocket clients.",
+        "# TYPE mopidy_websocket_clients gauge",
+        "mopidy_websocket_clients 2",
+        "# HELP mopidy_websocket_pending_broadcasts "
+        "Number of broadcast messages waiting to be sent to WebSocket clients.",
+        "# TYPE mopidy_websocket_pending_broadcasts gauge",
+        "mopidy_websocket_pending_broadcasts 0",
+    ]
+
+
+def test_get_audio_metrics(durations, monkeypatch):
+    _, scan_durations = durations
+    scan_durations.observe("file", 0.125)
+    buffering_percent = Gauge()
+    buffering_percent.set(42)
+    monkeypatch.setattr(metrics, "buffering_percent", buffering_percent)
+
+    result = metrics.format_metrics(metrics.get_audio_metrics())
+
+    assert result.splitlines() == [
+        "# HELP mopidy_scan_duration_seconds Time taken by audio scans of URIs.",
+        "# TYPE mopidy_scan_duration_seconds summary",
+        'mopidy_scan_duration_seconds_count{scheme="file"} 1',
+        'mopidy_scan_duration_seconds_sum{scheme="file"} 0.125',
+        "# HELP mopidy_audio_buffering_percent "
+        "Last buffering percentage reported by GStreamer.",
+        "# TYPE mopidy_audio_buffering_percent gauge",
+        "mopidy_audio_buffering_percent 42",
+    ]
+
+
+def test_get_audio_metrics_before_any_scans_or_buffering(durations, monkeypatch):
+    monkeypatch.setattr(metrics, "buffering_percent", Gauge())
+
+    assert metrics.format_metrics(metrics.get_audio_metrics()) == ""
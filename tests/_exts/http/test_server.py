@@ -28,6 +28,17 @@ class HttpServerTest(tornado.testing.AsyncHTTPTestCase):
         core = mock.Mock()
         core.get_version = mock.MagicMock(name="get_version")
         core.get_version.return_value = mopidy.__version__
+        core.get_actor_stats.return_value.get.return_value = [
+            {
+                "actor": "Core",
+                "mailbox_depth": 0,
+                "max_mailbox_depth": 1,
+                "methods": [],
+            },
+        ]
+        core.playback.get_state.return_value.get.return_value = "playing"
+        core.tracklist.get_length.return_value.get.return_value = 3
+        core.tracklist.get_version.return_value.get.return_value = 7
 
         testapps = [{"name": "testapp"}]
         teststatics = [{"name": "teststatic"}]
@@ -163,6 +174,22 @@ class MopidyRPCHandlerTest(HttpServerTest):
         }
 
 
+class MopidyMetricsHandlerTest(HttpServerTest):
+    @mock.patch.object(handlers.WebSocketHandler, "clients", set())
+    def test_should_return_metrics(self):
+        response = self.fetch("/mopidy/metrics", method="GET")
+
+        assert response.code == 200
+        assert response.headers["Content-Type"].startswith("text/plain")
+        assert response.headers["X-Mopidy-Version"] == mopidy.__version__
+        body = response.body.decode()
+        assert 'mopidy_playback_state{state="playing"} 1\n' in body
+        assert "mopidy_tracklist_length 3\n" in body
+        assert "mopidy_tracklist_version 7\n" in body
+        assert "mopidy_websocket_clients 0\n" in body
+        assert 'mopidy_actor_mailbox_depth_max{actor="Core"} 1\n' in body
+
+
 class MopidyRPCHandlerNoCSRFProtectionTest(HttpServerTest):
     def get_config(self):
         config = super().get_config()
@@ -2,6 +2,7 @@ from unittest import mock
 
 import pytest
 
+from mopidy import exceptions
 from mopidy._exts.stream import actor
 from mopidy._lib import paths
 from mopidy.models import Track
@@ -60,3 +61,42 @@ def test_lookup_converts_uri_metadata_to_track(audio, config, track_uri):
     track = result[0]
     assert track.uri == track_uri
     assert track.length == 4406
+
+
+def test_lookup_many_scans_all_uris(audio, config, track_uri):
+    other_uri = paths.path_to_uri(path_to_data_dir("song2.wav"))
+    backend = actor.StreamBackend(audio=audio, config=config)
+
+    result = backend.library.lookup_many([track_uri, other_uri, "http://example.com"])
+
+    assert result["http://example.com"] == []
+    assert result[track_uri][0].length == 4406
+    assert result[other_uri][0].uri == other_uri
+
+
+def test_lookup_many_respects_blacklist(audio, config, track_uri):
+    config["stream"]["metadata_blacklist"].append(track_uri)
+    backend = actor.StreamBackend(audio=audio, config=config)
+
+    with mock.patch.object(backend._scanner, "scan_many", return_value={}) as scan:
+        result = backend.library.lookup_many([track_uri])
+
+    scan.assert_called_once_with([], timeout=1000)
+    assert result == {track_uri: [Track(uri=track_uri)]}
+
+
+def test_lookup_many_does_not_rescan_failed_uris(audio, config, track_uri):
+    backend = actor.StreamBackend(audio=audio, config=config)
+    error = exceptions.ScannerError("timed out")
+
+    with (
+        mock.patch.object(
+            backend._scanner, "scan_many", return_value={track_uri: error}
+        ),
+        mock.patch.object(backend._scanner, "scan") as scan,
+        mock.patch.object(actor.http, "download", return_value=None),
+    ):
+        result = backend.library.lookup_many([track_uri])
+
+    scan.assert_not_called()
+    assert result == {track_uri: [Track(uri=track_uri)]}
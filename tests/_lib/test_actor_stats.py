@@ -0,0 +1,98 @@
+import threading
+
+import pykka
+import pytest
+
+from mopidy._lib import actor_stats
+
+
+class SlowActor(pykka.ThreadingActor):
+    def __init__(self, waiting, event):
+        super().__init__()
+        self.waiting = waiting
+        self.event = event
+
+    def wait(self):
+        self.waiting.set()
+        self.event.wait()
+
+    def noop(self):
+        pass
+
+
+@pytest.fixture
+def enabled():
+    actor_stats.enable()
+    yield
+    actor_stats.disable()
+
+
+@pytest.fixture
+def actor():
+    waiting, event = threading.Event(), threading.Event()
+    ref = SlowActor.start(waiting, event)
+    yield ref.proxy(), waiting, event
+    event.set()
+    ref.stop()
+
+
+def test_no_stats_when_disabled(actor):
+    proxy, _, event = actor
+    event.set()
+    proxy.noop().get()
+
+    assert actor_stats.get_stats() == []
+
+
+@pytest.mark.usefixtures("enabled")
+def test_records_calls_per_method(actor):
+    proxy, _, event = actor
+    event.set()
+    proxy.noop().get()
+    proxy.noop().get()
+    proxy.wait().get()
+    proxy.event.get()
+
+    [stats] = actor_stats.get_stats()
+
+    assert stats["actor"] == "SlowActor"
+    assert [(m["method"], m["calls"]) for m in stats["methods"]] == [
+        ("event", 1),
+        ("noop", 2),
+        ("wait", 1),
+    ]
+
+
+@pytest.mark.usefixtures("enabled")
+def test_records_mailbox_depth_and_times(actor):
+    proxy, waiting, event = actor
+    proxy.wait()
+    waiting.wait()
+    futures = [proxy.noop() for _ in range(3)]
+
+    [stats] = actor_stats.get_stats()
+    assert stats["mailbox_depth"] == 3
+    assert stats["max_mailbox_depth"] >= 3
+
+    event.set()
+    pykka.get_all(futures)
+    proxy.noop().get()
+
+    [stats] = actor_stats.get_stats()
+    methods = {m["method"]: m for m in stats["methods"]}
+    assert stats["mailbox_depth"] == 0
+    assert methods["noop"]["calls"] == 4
+    assert methods["noop"]["wait_time"] > 0
+    assert methods["wait"]["run_time"] > 0
+
+
+def test_no_stats_after_disable():
+    actor_stats.enable()
+    actor_stats.disable()
+    ref = SlowActor.start(threading.Event(), threading.Event())
+    try:
+        ref.proxy().noop().get()
+
+        assert actor_stats.get_stats() == []
+    finally:
+        ref.stop()
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from mopidy._lib.blocklist import BlockList
+
+
+def make(items, block_size=2):
+    return BlockList(items, key=lambda item: item, block_size=block_size)
+
+
+def check(blocklist, expected):
+    assert list(blocklist) == expected
+    assert len(blocklist) == len(expected)
+    for position, item in enumerate(expected):
+        assert blocklist[position] == item
+        assert blocklist.index_of_key(item) == position
+        assert blocklist.contains_key(item)
+
+
+def test_empty():
+    blocklist = make([])
+
+    check(blocklist, [])
+    assert blocklist[0:10] == []
+    assert blocklist.index_of_key(1) is None
+    assert not blocklist.contains_key(1)
+
+
+def test_index_out_of_range():
+    blocklist = make([1, 2, 3])
+
+    assert blocklist[-1] == 3
+    with pytest.raises(IndexError):
+        blocklist[3]
+    with pytest.raises(IndexError):
+        blocklist[-4]
+
+
+@pytest.mark.parametrize(
+    "index",
+    [slice(None), slice(2, 7), slice(-3, None), slice(5, 2), slice(None, None, 2)],
+)
+def test_slice(index):
+    items = list(range(10))
+
+    assert make(items)[index] == items[index]
+
+
+@pytest.mark.parametrize("position", [0, 3, 10, 20, -2, -20])
+def test_insert(position):
+    items = list(range(10))
+    blocklist = make(items)
+
+    blocklist.insert(position, [100, 101, 102])
+
+    expected = items[:]
+    expected[position:position] = [100, 101, 102]
+    check(blocklist, expected)
+
+
+def test_delete():
+    blocklist = make(range(10))
+
+    assert blocklist.delete(2, 7) == [2, 3, 4, 5, 6]
+    check(blocklist, [0, 1, 7, 8, 9])
+
+
+def test_delete_all():
+    blocklist = make(range(10))
+
+    assert blocklist.delete(None, None) == list(range(10))
+    check(blocklist, [])
+
+    blocklist.insert(0, [1])
+    check(blocklist, [1])
+
+
+def test_remove_keys():
+    blocklist = make(range(10))
+
+    blocklist.remove_keys([8, 1, 2, 42])
+
+    check(blocklist, [0, 3, 4, 5, 6, 7, 9])
+
+
+def test_replace():
+    blocklist = BlockList(
+        [(i, "old") for i in range(10)],
+        key=lambda item: item[0],
+        block_size=2,
+    )
+
+    blocklist.replace([(7, "new"), (2, "new"), (42, "new")])
+
+    assert [value for _, value in blocklist].count("new") == 2
+    assert blocklist[2] == (2, "new")
+    assert blocklist[7] == (7, "new")
+    assert blocklist.index_of_key(7) == 7
+    assert len(blocklist) == 10
+
+
+def test_clear():
+    blocklist = make(range(10))
+
+    blocklist.clear()
+
+    check(blocklist, [])
+
+
+def test_random_operations_match_list():
+    rng = random.Random(42)  # noqa: S311
+    blocklist = make([], block_size=4)
+    expected = []
+    next_item = 0
+
+    for _ in range(500):
+        operation = rng.choice(["insert", "delete", "remove_keys", "move"])
+        if operation == "insert" or not expected:
+            items = list(range(next_item, next_item + rng.randint(1, 20)))
+            next_item += len(items)
+            position = rng.randint(0, len(expected))
+            blocklist.insert(position, items)
+            expected[position:position] = items
+        elif operation == "delete":
+            start = rng.randint(0, len(expected))
+            stop = rng.randint(start, len(expected))
+            assert blocklist.delete(start, stop) == expected[start:stop]
+            del expected[start:stop]
+        elif operation == "remove_keys":
+            keys = rng.sample(expected, rng.randint(1, min(5, len(expected))))
+            blocklist.remove_keys(keys)
+            expected = [item for item in expected if item not in keys]
+        else:
+            start = rng.randint(0, len(expected) - 1)
+            stop = rng.randint(start + 1, len(expected))
+            position = rng.randint(0, len(expected) - (stop - start))
+            blocklist.insert(position, blocklist.delete(start, stop))
+            moved = expected[start:stop]
+            del expected[start:stop]
+            expected[position:position] = moved
+
+        check(blocklist, expected)
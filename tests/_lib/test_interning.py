@@ -0,0 +1,59 @@
+import gc
+
+from mopidy._lib import interning
+from mopidy.models import Album, Artist, TlTrack, Track
+from mopidy.types import TracklistId
+
+
+def make_track(uri, **kwargs):
+    return Track(
+        uri=uri,
+        artists=frozenset([Artist(name="Artist")]),
+        album=Album(name="Album", artists=frozenset([Artist(name="Artist")])),
+        **kwargs,
+    )
+
+
+def test_equal_tracks_are_shared():
+    track = interning.intern_track(make_track("dummy:a"))
+
+    assert interning.intern_track(make_track("dummy:a")) is track
+
+
+def test_interned_track_is_equal_to_original():
+    track = make_track("dummy:a", name="A", track_no=1)
+
+    assert interning.intern_track(track) == track
+
+
+def test_albums_and_artists_are_shared_between_tracks():
+    track_a = interning.intern_track(make_track("dummy:a"))
+    track_b = interning.intern_track(make_track("dummy:b"))
+
+    assert track_a is not track_b
+    assert track_a.album is track_b.album
+    (artist,) = track_a.artists
+    assert artist in track_b.artists
+    assert next(iter(track_b.artists)) is artist
+    assert next(iter(track_a.album.artists)) is artist
+    assert track_a.artists is track_a.album.artists
+
+
+def test_tl_track_keeps_tlid():
+    track = interning.intern_track(make_track("dummy:a"))
+
+    tl_track = interning.intern_tl_track(TlTrack(TracklistId(3), make_track("dummy:a")))
+
+    assert tl_track.tlid == 3
+    assert tl_track.track is track
+
+
+def test_unused_tracks_are_dropped():
+    size = len(interning._interned)
+    track = interning.intern_track(make_track("dummy:unused", name="Unused"))
+    assert len(interning._interned) > size
+
+    del track
+    gc.collect()
+
+    assert len(interning._interned) <= size
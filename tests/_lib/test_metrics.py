@@ -0,0 +1,41 @@
+import threading
+
+from mopidy._lib.metrics import Gauge, Summary
+
+
+def test_summary_counts_and_sums_by_label():
+    summary = Summary()
+
+    summary.observe("a", 1.5)
+    summary.observe("b", 2.0)
+    summary.observe("a", 0.5)
+
+    assert summary.collect() == {"a": (2, 2.0), "b": (1, 2.0)}
+
+
+def test_summary_from_many_threads():
+    summary = Summary()
+
+    def observe():
+        for _ in range(1000):
+            summary.observe("a", 1.0)
+
+    threads = [threading.Thread(target=observe) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert summary.collect() == {"a": (4000, 4000.0)}
+
+
+def test_gauge():
+    gauge = Gauge()
+    assert gauge.get() is None
+
+    gauge.add(2)
+    gauge.add(-1)
+    assert gauge.get() == 1
+
+    gauge.set(42)
+    assert gauge.get() == 42
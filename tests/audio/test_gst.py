@@ -6,7 +6,7 @@ from unittest import mock
 import pykka
 
 from mopidy import audio
-from mopidy._lib import paths
+from mopidy._lib import metrics, paths
 from mopidy._lib.gi import Gst
 from mopidy.types import PlaybackState
 from tests import dummy_audio, path_to_data_dir
@@ -453,6 +453,44 @@ class AudioEventTest(BaseTest):
 
         # TODO: test tag states within gaples
 
+    def test_gapless_with_next_uri(self):
+        event = self.listener.wait("reached_end_of_stream").get()
+        callback = mock.Mock()
+        self.audio.set_about_to_finish_callback(callback).get()
+
+        self.audio.prepare_change()
+        self.audio.set_uri(self.uris[0])
+        self.audio.set_next_uri(self.uris[1], track_uri="dummy:b").get()
+        self.audio.start_playback()
+
+        self.possibly_trigger_fake_about_to_finish()
+        self.audio.testing_gst__wait_for_state_change().get()
+
+        self.possibly_trigger_fake_about_to_finish()
+        self.audio.testing_gst__wait_for_state_change().get()
+        if not event.wait(timeout=1.0):
+            self.fail("EOS not received")
+
+        # The next URI is used once, without running the callback
+        self.assert_event("next_uri_used", uri=self.uris[1], track_uri="dummy:b")
+        self.assert_event("stream_changed", uri=self.uris[1])
+        callback.assert_called_once_with()
+
+    def test_prepare_change_clears_next_uri(self):
+        event = self.listener.wait("reached_end_of_stream").get()
+
+        self.audio.set_next_uri(self.uris[1]).get()
+        self.audio.prepare_change()
+        self.audio.set_uri(self.uris[0])
+        self.audio.start_playback()
+
+        self.possibly_trigger_fake_about_to_finish()
+        self.audio.testing_gst__wait_for_state_change().get()
+        if not event.wait(timeout=1.0):
+            self.fail("EOS not received")
+
+        self.assert_not_event("next_uri_used", uri=self.uris[1], track_uri=None)
+
     def test_source_setup(self):
         mock_callback = mock.Mock()
 
@@ -594,6 +632,13 @@ class AudioBufferingTest(unittest.TestCase):
         playbin.set_state.assert_called_with(Gst.State.PAUSED)
         assert self.audio._buffering
 
+    def test_buffering_percent_is_recorded(self):
+        self.audio.start_playback()
+
+        self.audio._handler.on_buffering(42)
+
+        assert metrics.buffering_percent.get() == 42
+
     def test_stay_paused_when_buffering_finished(self):
         playbin = self.audio._playbin
         self.audio.pause_playback()
@@ -1,6 +1,7 @@
 import unittest
 
 from mopidy import exceptions
+from mopidy._lib import metrics
 from mopidy._lib.paths import path_to_uri
 from mopidy.audio import scan
 from tests import path_to_data_dir
@@ -120,3 +121,36 @@ class ScannerTest(unittest.TestCase):
     @unittest.SkipTest
     def test_song_without_time_is_handeled(self):
         pass
+
+
+class ScanManyTest(unittest.TestCase):
+    def test_scan_many_returns_result_for_each_uri(self):
+        uris = [
+            path_to_uri(path_to_data_dir(f"scanner/simple/song1.{ext}"))
+            for ext in ("mp3", "ogg")
+        ]
+        scanner = scan.Scanner()
+
+        results = scanner.scan_many(uris, concurrency=2)
+
+        assert list(results) == uris
+        for uri in uris:
+            assert results[uri].uri == uri
+
+    def test_scan_durations_are_recorded(self):
+        uri = path_to_uri(path_to_data_dir("scanner/plain.txt"))
+        scanner = scan.Scanner()
+        count, _ = metrics.scan_durations.collect().get("file", (0, 0.0))
+
+        scanner.scan_many([uri])
+
+        assert metrics.scan_durations.collect()["file"][0] == count + 1
+
+    def test_scan_many_returns_errors(self):
+        uri = path_to_uri(path_to_data_dir("scanner/plain.txt"))
+        scanner = scan.Scanner()
+
+        results = scanner.scan_many([uri, uri])
+
+        assert list(results) == [uri]
+        assert isinstance(results[uri], exceptions.ScannerError)
@@ -4,6 +4,7 @@ from unittest import mock
 import pytest
 
 from mopidy import backend
+from mopidy.models import Album, Ref, SearchResult, Track
 from tests import dummy_backend
 
 
@@ -26,6 +27,115 @@ class LibraryTest(unittest.TestCase):
             ],
         )
 
+    def test_browse_page_slices_browse(self):
+        library = backend.LibraryProvider(backend=None)
+        refs = [Ref.track(uri=f"dummy1:{i}", name=str(i)) for i in range(5)]
+        library.browse = mock.Mock(return_value=refs)
+
+        assert library.browse_page("dummy1:", offset=1, limit=2) == refs[1:3]
+        assert library.browse_page("dummy1:", offset=3) == refs[3:]
+
+    def test_search_page_slices_search(self):
+        library = backend.LibraryProvider(backend=None)
+        tracks = tuple(Track(uri=f"dummy1:{i}") for i in range(5))
+        albums = (Album(name="a"), Album(name="b"))
+        library.search = mock.Mock(
+            return_value=SearchResult(tracks=tracks, albums=albums)
+        )
+
+        result = library.search_page({"any": ["a"]}, offset=1, limit=2)
+
+        library.search.assert_called_once_with(
+            query={"any": ["a"]}, uris=None, exact=False
+        )
+        assert result == SearchResult(tracks=tracks[1:3], albums=albums[1:])
+
+    def test_search_page_without_search_support(self):
+        library = backend.LibraryProvider(backend=None)
+
+        assert library.search_page({"any": ["a"]}, limit=2) is None
+
+
+class PlaybackTest(unittest.TestCase):
+    def setUp(self):
+        self.audio = mock.Mock()
+        self.provider = backend.PlaybackProvider(audio=self.audio, backend=None)
+        self.provider.prepare_next_uri = True
+        self.provider.translate_uri = mock.Mock(
+            side_effect=lambda uri: uri.replace("dummy1:", "http://example.com/")
+        )
+
+    def test_prepare_uri_translates_uri(self):
+        assert self.provider.prepare_uri("dummy1:a") == "http://example.com/a"
+
+    def test_prepare_uri_does_nothing_unless_enabled(self):
+        provider = backend.PlaybackProvider(audio=self.audio, backend=None)
+        provider.translate_uri = mock.Mock()
+
+        assert provider.prepare_uri("dummy1:a") is None
+
+        provider.translate_uri.assert_not_called()
+        self.audio.set_next_uri.assert_not_called()
+
+    def test_prepare_uri_gives_uri_to_audio(self):
+        self.provider.prepare_uri("dummy1:a")
+
+        self.audio.set_next_uri.assert_called_once_with(
+            "http://example.com/a",
+            live_stream=False,
+            download=False,
+            source_setup_callback=self.provider.on_source_setup,
+            track_uri="dummy1:a",
+        )
+
+    def test_forget_prepared_uri(self):
+        self.provider.prepare_uri("dummy1:a")
+        self.provider.forget_prepared_uri()
+
+        assert self.provider.change_track(Track(uri="dummy1:a"))
+
+        assert self.provider.translate_uri.call_count == 2
+        self.audio.set_next_uri.assert_called_with(None)
+
+    def test_prepare_uri_with_custom_change_track(self):
+        class MyPlaybackProvider(backend.PlaybackProvider):
+            prepare_next_uri = True
+
+            def change_track(self, track):
+                return True
+
+        provider = MyPlaybackProvider(audio=self.audio, backend=None)
+
+        assert provider.prepare_uri("dummy1:a") == "dummy1:a"
+        self.audio.set_next_uri.assert_not_called()
+
+    def test_change_track_uses_prepared_uri(self):
+        self.provider.prepare_uri("dummy1:a")
+
+        assert self.provider.change_track(Track(uri="dummy1:a"))
+
+        self.provider.translate_uri.assert_called_once_with("dummy1:a")
+        self.audio.set_uri.assert_called_once_with(
+            "http://example.com/a", live_stream=False, download=False
+        )
+
+    def test_change_track_translates_other_uri(self):
+        self.provider.prepare_uri("dummy1:a")
+
+        assert self.provider.change_track(Track(uri="dummy1:b"))
+
+        self.provider.translate_uri.assert_called_with("dummy1:b")
+        self.audio.set_uri.assert_called_once_with(
+            "http://example.com/b", live_stream=False, download=False
+        )
+
+    def test_prepared_uri_is_only_used_once(self):
+        self.provider.prepare_uri("dummy1:a")
+        self.provider.change_track(Track(uri="dummy1:a"))
+        self.provider.change_track(Track(uri="dummy1:a"))
+
+        assert self.provider.translate_uri.call_count == 2
+
 
 class PlaylistsTest(unittest.TestCase):
     def setUp(self):
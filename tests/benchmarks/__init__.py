@@ -0,0 +1,21 @@
+import gc
+import timeit
+import tracemalloc
+
+
+def measure(func, number):
+    """Get the best time per call in seconds, out of five runs."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def measure_memory(func):
+    """Get the memory in bytes allocated by a call and still in use after it."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
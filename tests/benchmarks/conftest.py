@@ -0,0 +1,38 @@
+import pytest
+
+results_key = pytest.StashKey[list]()
+
+
+def pytest_generate_tests(metafunc):
+    if "tracklist_size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--tracklist-sizes")
+        metafunc.parametrize(
+            "tracklist_size",
+            [int(size) for size in sizes.split(",")],
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(results_key, [])
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'operation':<24} {'size':>9} {'time/op':>12} {'memory':>12}"
+    )
+    for operation, size, seconds, memory in sorted(results):
+        memory_text = "" if memory is None else f"{memory / 1024 / 1024:.1f} MiB"
+        terminalreporter.write_line(
+            f"{operation:<24} {size:>9} {seconds * 1e6:>9.1f} us {memory_text:>12}"
+        )
+
+
+@pytest.fixture
+def report(request):
+    """Record a benchmark result for the summary at the end of the run."""
+    results = request.config.stash.setdefault(results_key, [])
+
+    def record(operation, size, seconds, memory=None):
+        results.append((operation, size, seconds, memory))
+
+    return record
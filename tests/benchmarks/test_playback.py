@@ -0,0 +1,39 @@
+from unittest import mock
+
+import pykka
+import pytest
+
+from mopidy import core
+from mopidy.models import Track
+from tests import dummy_audio, dummy_backend
+from tests.benchmarks import measure
+
+
+@pytest.fixture
+def core_proxy():
+    audio = dummy_audio.create_proxy()
+    backend = dummy_backend.create_proxy(audio=audio)
+    backend.library.dummy_library = [Track(uri="dummy:a", length=60_000)]
+    config = {"core": {"max_tracklist_length": 10000}}
+    proxy = core.Core.start(config, backends=[backend], audio=audio).proxy()
+    proxy.tracklist.add(uris=["dummy:a"]).get()
+    proxy.playback.play().get()
+    yield proxy
+    pykka.ActorRegistry.stop_all()
+
+
+@pytest.mark.benchmark_check
+def test_time_position_poll_throughput(core_proxy, report):
+    def poll():
+        core_proxy.playback.get_time_position().get()
+
+    interpolated = measure(poll, 1000)
+    # Asking the backend on every poll, like before interpolation
+    with mock.patch("mopidy.core._playback._POSITION_RESYNC_INTERVAL", 0):
+        queried = measure(poll, 1000)
+
+    report("poll position", 1, interpolated)
+    report("poll position (queried)", 1, queried)
+
+    # Each query crosses the backend and audio actors' mailboxes too.
+    assert interpolated < queried / 1.5
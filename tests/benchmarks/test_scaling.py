@@ -0,0 +1,138 @@
+"""Benchmarks of tracklist and playback operations on large tracklists.
+
+Run with e.g. `pytest tests/benchmarks --tracklist-sizes=10000,100000,1000000`
+to see how the operations scale. The results are reported at the end of the
+test run.
+"""
+
+import time
+
+import pykka
+import pytest
+
+import mopidy
+from mopidy import core
+from mopidy.core._state_storage import CoreControllersState, StoredState
+from mopidy.models import Album, Artist, Track
+from tests import dummy_backend
+from tests.benchmarks import measure, measure_memory
+
+
+@pytest.fixture
+def backend(tracklist_size):
+    backend = dummy_backend.create_proxy()
+    backend.library.dummy_library = [
+        Track(
+            uri=f"dummy:{i}",
+            name=f"Track {i}",
+            artists=frozenset([Artist(name=f"Artist {i // 100}")]),
+            album=Album(name=f"Album {i // 10}"),
+            track_no=i % 10 + 1,
+            length=200_000,
+        )
+        for i in range(tracklist_size)
+    ]
+    yield backend
+    pykka.ActorRegistry.stop_all()
+
+
+@pytest.fixture
+def uris(tracklist_size):
+    return [f"dummy:{i}" for i in range(tracklist_size)]
+
+
+def make_core(backend, tracklist_size):
+    config = {"core": {"max_tracklist_length": tracklist_size * 2}}
+    return core.Core(config, mixer=None, backends=[backend])
+
+
+@pytest.fixture
+def full_core(backend, uris, tracklist_size):
+    c = make_core(backend, tracklist_size)
+    c.tracklist.add(uris=uris)
+    # Keep the dummy backend's lookups out of the measurements
+    backend.library.dummy_library = backend.library.dummy_library.get()[:1]
+    return c
+
+
+def test_add(backend, uris, tracklist_size, report):
+    c = make_core(backend, tracklist_size)
+    start = time.perf_counter()
+    c.tracklist.add(uris=uris)
+    seconds = time.perf_counter() - start
+
+    c = make_core(backend, tracklist_size)
+    _, memory = measure_memory(lambda: c.tracklist.add(uris=uris))
+
+    report("add all", tracklist_size, seconds / tracklist_size, memory)
+
+
+def test_add_one(full_core, tracklist_size, report):
+    seconds = measure(
+        lambda: full_core.tracklist.add(uris=["dummy:0"], at_position=0), 20
+    )
+
+    report("add one at start", tracklist_size, seconds)
+
+
+def test_remove_one(full_core, tracklist_size, report):
+    tlids = iter(range(1, tracklist_size + 1))
+
+    seconds = measure(lambda: full_core.tracklist.remove({"tlid": [next(tlids)]}), 20)
+
+    report("remove one", tracklist_size, seconds)
+
+
+def test_move(full_core, tracklist_size, report):
+    seconds = measure(lambda: full_core.tracklist.move(0, 1, tracklist_size - 1), 20)
+
+    report("move first to end", tracklist_size, seconds)
+
+
+def test_filter_by_uri(full_core, tracklist_size, report):
+    uri = f"dummy:{tracklist_size // 2}"
+
+    seconds = measure(lambda: full_core.tracklist.filter({"uri": [uri]}), 20)
+
+    report("filter by uri", tracklist_size, seconds)
+
+
+def test_filter_by_name(full_core, tracklist_size, report):
+    name = f"Track {tracklist_size // 2}"
+
+    seconds = measure(lambda: full_core.tracklist.filter({"name": [name]}), 5)
+
+    report("filter by name", tracklist_size, seconds)
+
+
+@pytest.mark.parametrize("random", [False, True])
+def test_next_track(full_core, tracklist_size, report, random):
+    full_core.tracklist.set_random(random)
+    tl_track = full_core.tracklist.slice(tracklist_size // 2, tracklist_size)[0]
+    full_core.playback._set_current_tl_track(tl_track)
+
+    seconds = measure(full_core.tracklist.get_next_tlid, 20)
+
+    report(f"next track{' random' if random else ''}", tracklist_size, seconds)
+
+
+def test_playback_next(full_core, tracklist_size, report):
+    full_core.playback.play()
+
+    seconds = measure(full_core.playback.next, 20)
+
+    report("playback next", tracklist_size, seconds)
+
+
+def test_save_and_load_state(full_core, tracklist_size, report, tmp_path):
+    path = tmp_path / "state.json.gz"
+    state = StoredState(
+        version=mopidy.__version__,
+        state=CoreControllersState(tracklist=full_core.tracklist._save_state()),
+    )
+
+    save_seconds = measure(lambda: state.dump(path), 1)
+    load_seconds = measure(lambda: StoredState.load(path), 1)
+
+    report("save state", tracklist_size, save_seconds)
+    report("load state", tracklist_size, load_seconds)
@@ -0,0 +1,88 @@
+from unittest import mock
+
+import pytest
+
+from mopidy import core
+from mopidy.models import Album, Artist, Track
+from tests.benchmarks import measure, measure_memory
+
+SMALL = 1_000
+LARGE = 50_000
+
+
+def make_core(length):
+    tracks = {f"dummy:{i}": [Track(uri=f"dummy:{i}")] for i in range(length)}
+    config = {"core": {"max_tracklist_length": LARGE}}
+    c = core.Core(config, mixer=None, backends=[])
+    c.library = mock.Mock(spec=core.LibraryController)
+    c.library.lookup.side_effect = lambda uris: {uri: tracks[uri] for uri in uris}
+    tl_tracks = c.tracklist.add(uris=list(tracks))
+    if tl_tracks:
+        c.playback._set_current_tl_track(tl_tracks[-1])
+    return c, tl_tracks
+
+
+@pytest.mark.benchmark_check
+@pytest.mark.parametrize("consume", [False, True])
+def test_tracklist_change_cost_is_flat(consume):
+    def cost(length):
+        c, tl_tracks = make_core(length)
+        c.tracklist.set_consume(consume)
+        tlids = iter(tl_track.tlid for tl_track in tl_tracks)
+
+        if consume:
+            return measure(lambda: c.tracklist.remove({"tlid": [next(tlids)]}), 20)
+        return measure(c.playback._on_tracklist_change, 100)
+
+    # Copying the tracklist on every change would make the large tracklist
+    # about 50 times slower.
+    assert cost(LARGE) < 5 * cost(SMALL)
+
+
+@pytest.mark.benchmark_check
+def test_random_mode_change_cost_is_flat():
+    def cost(length):
+        c, tl_tracks = make_core(length)
+        c.tracklist.set_random(True)
+        tlids = iter(tl_track.tlid for tl_track in tl_tracks)
+
+        return measure(lambda: c.tracklist.remove({"tlid": [next(tlids)]}), 20)
+
+    # Reshuffling the tracklist on every change would make the large
+    # tracklist about 50 times slower.
+    assert cost(LARGE) < 5 * cost(SMALL)
+
+
+@pytest.mark.benchmark_check
+def test_memory_grows_with_unique_metadata():
+    def make_track(i, album_count):
+        if album_count is None:
+            return Track(uri=f"dummy:{i}", name=f"Track {i}")
+        # Like backends, create new album and artist objects for every track
+        artist = Artist(name=f"Artist {i % album_count}")
+        return Track(
+            uri=f"dummy:{i}",
+            name=f"Track {i}",
+            artists=frozenset([artist]),
+            album=Album(name=f"Album {i % album_count}", artists=frozenset([artist])),
+        )
+
+    def memory_per_track(album_count):
+        c, _ = make_core(0)
+        c.library.lookup.side_effect = lambda uris: {
+            uri: [make_track(int(uri.removeprefix("dummy:")), album_count)]
+            for uri in uris
+        }
+
+        _, size = measure_memory(
+            lambda: c.tracklist.add(uris=[f"dummy:{i}" for i in range(SMALL * 10)])
+        )
+        return size / (SMALL * 10)
+
+    bare = memory_per_track(album_count=None)
+    shared = memory_per_track(album_count=10)
+    unique = memory_per_track(album_count=SMALL * 10)
+
+    # Tracks from a few albums should cost about the same as tracks without
+    # any albums or artists, as the albums and artists are shared.
+    assert shared - bare < 0.1 * (unique - bare)
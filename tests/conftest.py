@@ -0,0 +1,38 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tracklist-sizes",
+        default="10000",
+        help=(
+            "Comma-separated tracklist sizes to run the benchmarks in "
+            "tests/benchmarks with. Defaults to 10000."
+        ),
+    )
+    parser.addoption(
+        "--benchmark-checks",
+        action="store_true",
+        default=False,
+        help=(
+            "Run the benchmarks in tests/benchmarks that assert on timing or "
+            "memory ratios. These depend on the machine and its load, so they "
+            "are skipped by default."
+        ),
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "benchmark_check: asserts on timing or memory, run with --benchmark-checks",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark-checks"):
+        return
+    skip = pytest.mark.skip(reason="needs --benchmark-checks to run")
+    for item in items:
+        if "benchmark_check" in item.keywords:
+            item.add_marker(skip)
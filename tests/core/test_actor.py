@@ -18,7 +18,7 @@ from mopidy.core._state_storage import (
     StoredState,
     TracklistControllerState,
 )
-from mopidy.models import Ref, TlTrack, Track
+from mopidy.models import Album, Artist, Ref, TlTrack, Track
 from mopidy.types import DurationMs, Percentage, PlaybackState, TracklistId, Uri
 from tests import dummy_mixer
 
@@ -163,6 +163,9 @@ class CoreActorTest(unittest.TestCase):
     def test_version(self):
         assert self.core.get_version() == mopidy.__version__
 
+    def test_actor_stats_are_empty_when_disabled(self):
+        assert self.core.get_actor_stats() == []
+
     @mock.patch.object(core._playback, "CoreListener", spec=core.CoreListener)
     def test_state_changed(self, listener_mock):
         self.core.state_changed(None, PlaybackState.PAUSED, None)
@@ -226,6 +229,31 @@ class CoreActorSaveLoadStateTest(unittest.TestCase):
         )
         assert data == reload_data
 
+    def test_load_state_shares_albums(self):
+        album = Album(name="a", artists=frozenset([Artist(name="b")]))
+        state = StoredState(
+            version=mopidy.__version__,
+            state=CoreControllersState(
+                tracklist=TracklistControllerState(
+                    tl_tracks=(
+                        TlTrack(
+                            tlid=TracklistId(1), track=Track(uri="a:a", album=album)
+                        ),
+                        TlTrack(
+                            tlid=TracklistId(2), track=Track(uri="a:b", album=album)
+                        ),
+                    ),
+                ),
+            ),
+        )
+        state.dump(self.state_file)
+
+        reload_data = StoredState.load(self.state_file)
+
+        assert reload_data == state
+        tl_tracks = reload_data.state.tracklist.tl_tracks
+        assert tl_tracks[0].track.album is tl_tracks[1].track.album
+
     def test_load_state_no_file(self):
         self.core._setup()
 
@@ -50,6 +50,18 @@ class BackendEventsTest(unittest.TestCase):
 
         assert send.call_args[0][0] == "tracklist_changed"
 
+    def test_tracklist_lazy_add_sends_tracklist_changed_events(self, send):
+        self.backend.library.dummy_library = [Track(uri="dummy:a", name="a")]
+
+        tl_tracks = self.core.tracklist.add(uris=["dummy:a"], lazy=True).get()
+
+        assert tl_tracks[0].track == Track(uri="dummy:a")
+        assert self.core.tracklist.get_tracks().get() == [
+            Track(uri="dummy:a", name="a")
+        ]
+        calls = [c for c in send.call_args_list if c[0][0] == "tracklist_changed"]
+        assert len(calls) == 2
+
     def test_tracklist_clear_sends_tracklist_changed_event(self, send):
         self.core.tracklist.add(uris=["dummy:a"]).get()
 
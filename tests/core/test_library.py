@@ -1,6 +1,7 @@
 import unittest
 from unittest import mock
 
+import pykka
 import pytest
 
 from mopidy import backend, core
@@ -155,6 +156,53 @@ class CoreLibraryTest(BaseCoreLibraryTest):
             Ref.track(uri="dummy1:track:/foo/baz.mp3", name="Baz"),
         ]
 
+    def test_browse_with_offset_and_limit_uses_browse_page(self):
+        refs = [Ref.track(uri="dummy1:track:/foo/baz.mp3", name="Baz")]
+        self.library1.browse_page.return_value.get.return_value = refs
+
+        result = self.core.library.browse("dummy1:directory:/foo", 10, 1)
+
+        assert result == refs
+        self.library1.browse_page.assert_called_once_with(
+            "dummy1:directory:/foo", 10, 1
+        )
+        assert not self.library1.browse.called
+
+    def test_browse_root_with_offset_and_limit(self):
+        result = self.core.library.browse(None, offset=1, limit=1)
+
+        assert result == [Ref.directory(uri="dummy2:directory", name="dummy2")]
+
+    def test_browse_with_negative_offset_fails(self):
+        with pytest.raises(ValueError, match="larger or equal to 0"):
+            self.core.library.browse("dummy1:directory:/foo", offset=-1)
+
+    def test_browse_page_returns_continuation_token(self):
+        refs = [Ref.track(uri=f"dummy1:track:{i}", name=str(i)) for i in range(5)]
+        self.library1.browse_page.side_effect = lambda uri, offset, limit: mock.Mock(
+            get=mock.Mock(return_value=refs[offset : offset + limit])
+        )
+
+        page1 = self.core.library.browse_page("dummy1:directory", limit=3)
+        page2 = self.core.library.browse_page(
+            "dummy1:directory", limit=3, token=page1["next_token"]
+        )
+
+        assert page1["refs"] == refs[:3]
+        assert page1["next_token"] is not None
+        assert page2 == {"refs": refs[3:], "next_token": None}
+
+    def test_browse_page_rejects_token_for_other_uri(self):
+        self.library1.browse_page.return_value.get.return_value = [
+            Ref.track(uri=f"dummy1:track:{i}", name=str(i)) for i in range(3)
+        ]
+        page = self.core.library.browse_page("dummy1:directory", limit=2)
+
+        with pytest.raises(ValueError, match="Invalid page token"):
+            self.core.library.browse_page(
+                "dummy1:other", limit=2, token=page["next_token"]
+            )
+
     def test_lookup_returns_empty_dict_for_no_uris(self):
         assert self.core.library.lookup(uris=[]) == {}
 
@@ -338,6 +386,37 @@ class CoreLibraryTest(BaseCoreLibraryTest):
             exact=False,
         )
 
+    def test_search_with_offset_and_limit_uses_search_page(self):
+        self.core.library.search({"any": ["a"]}, offset=5, limit=10)
+
+        self.library1.search_page.assert_called_once_with(
+            query={"any": ["a"]}, uris=None, exact=False, offset=5, limit=10
+        )
+        assert not self.library1.search.called
+
+    def test_search_page_returns_continuation_token(self):
+        tracks = tuple(Track(uri=f"dummy1:{i}") for i in range(3))
+        self.library1.search_page.side_effect = (
+            lambda query, uris, exact, offset, limit: mock.Mock(
+                get=mock.Mock(
+                    return_value=SearchResult(tracks=tracks[offset : offset + limit])
+                )
+            )
+        )
+        self.library2.search_page.return_value.get.return_value = None
+
+        page1 = self.core.library.search_page({"any": ["a"]}, limit=2)
+        page2 = self.core.library.search_page(
+            {"any": ["a"]}, limit=2, token=page1["next_token"]
+        )
+
+        assert page1["results"] == [SearchResult(tracks=tracks[:2])]
+        assert page1["next_token"] is not None
+        assert page2 == {
+            "results": [SearchResult(tracks=tracks[2:])],
+            "next_token": None,
+        }
+
     def test_search_normalises_bad_queries(self):
         self.core.library.search({"any": "foobar"})
         self.library1.search.assert_called_once_with(
@@ -347,6 +426,163 @@ class CoreLibraryTest(BaseCoreLibraryTest):
         )
 
 
+class LookupCacheTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        self.core = core.Core(
+            config={"core": {"lookup_cache_size": 2}},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+        self.library1.get_version.return_value.get.return_value = 1
+        self.library2.get_version.return_value.get.return_value = None
+        self.track1 = Track(uri="dummy1:a", name="abc")
+        self.track2 = Track(uri="dummy2:a", name="def")
+        self.library1.lookup_many.return_value.get.return_value = {
+            "dummy1:a": [self.track1],
+        }
+        self.library2.lookup_many.return_value.get.return_value = {
+            "dummy2:a": [self.track2],
+        }
+
+    def test_repeated_lookup_is_served_from_cache(self):
+        self.core.library.lookup(uris=["dummy1:a", "dummy2:a"])
+        result = self.core.library.lookup(uris=["dummy1:a", "dummy2:a"])
+
+        assert result == {"dummy1:a": [self.track1], "dummy2:a": [self.track2]}
+        self.library1.lookup_many.assert_called_once_with(["dummy1:a"])
+        self.library2.lookup_many.assert_called_once_with(["dummy2:a"])
+        assert self.core.library.get_lookup_cache_stats() == {
+            "hits": 2,
+            "misses": 2,
+            "size": 2,
+            "max_size": 2,
+        }
+
+    def test_only_misses_are_looked_up(self):
+        self.core.library.lookup(uris=["dummy1:a"])
+        self.library1.lookup_many.return_value.get.return_value = {
+            "dummy1:b": [Track(uri="dummy1:b")],
+        }
+
+        self.core.library.lookup(uris=["dummy1:a", "dummy1:b"])
+
+        self.library1.lookup_many.assert_called_with(["dummy1:b"])
+
+    def test_changed_backend_version_invalidates_cache(self):
+        self.core.library.lookup(uris=["dummy1:a"])
+        self.library1.get_version.return_value.get.return_value = 2
+
+        self.core.library.lookup(uris=["dummy1:a"])
+
+        assert self.library1.lookup_many.call_count == 2
+
+    def test_refresh_invalidates_cache_for_the_refreshed_scheme(self):
+        self.core.library.lookup(uris=["dummy1:a", "dummy2:a"])
+
+        self.core.library.refresh("dummy2:a")
+        self.core.library.lookup(uris=["dummy1:a", "dummy2:a"])
+
+        assert self.library1.lookup_many.call_count == 1
+        assert self.library2.lookup_many.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.library1.lookup_many.return_value.get.return_value = {
+            "dummy1:a": [self.track1],
+            "dummy1:b": [Track(uri="dummy1:b")],
+            "dummy1:c": [Track(uri="dummy1:c")],
+        }
+        self.core.library.lookup(uris=["dummy1:a", "dummy1:b", "dummy1:c"])
+
+        self.core.library.lookup(uris=["dummy1:a", "dummy1:b", "dummy1:c"])
+
+        self.library1.lookup_many.assert_called_with(["dummy1:a"])
+
+    def test_empty_results_are_not_cached(self):
+        self.library1.lookup_many.return_value.get.return_value = {"dummy1:a": []}
+
+        self.core.library.lookup(uris=["dummy1:a"])
+        self.core.library.lookup(uris=["dummy1:a"])
+
+        assert self.library1.lookup_many.call_count == 2
+
+    def test_cache_is_disabled_by_default(self):
+        self.core = core.Core(
+            config={},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+        self.core.library.lookup(uris=["dummy1:a"])
+        self.core.library.lookup(uris=["dummy1:a"])
+
+        assert self.library1.lookup_many.call_count == 2
+        assert not self.library1.get_version.called
+        assert self.core.library.get_lookup_cache_stats()["max_size"] == 0
+
+
+class LibraryTimeoutTest(BaseCoreLibraryTest):
+    def setUp(self):
+        super().setUp()
+        self.core = core.Core(
+            config={"core": {"library_timeout": 500}},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+
+    def test_backends_are_given_the_remaining_time(self):
+        self.library1.get_distinct.return_value.get.return_value = {"a"}
+        self.library2.get_distinct.return_value.get.return_value = {"b"}
+
+        self.core.library.get_distinct("artist")
+
+        for library in (self.library1, self.library2):
+            call = library.get_distinct.return_value.get.call_args
+            assert 0 <= call.kwargs["timeout"] <= 0.5
+
+    @mock.patch.object(core._library, "logger")
+    def test_late_backend_is_dropped(self, logger):
+        track = Track(uri="dummy2:a")
+        self.library1.search.return_value.get.side_effect = pykka.Timeout
+        self.library2.search.return_value.get.return_value = SearchResult(
+            tracks=[track]
+        )
+
+        result = self.core.library.search({"any": ["a"]})
+
+        assert result == [SearchResult(tracks=[track])]
+        logger.warning.assert_called_once_with(
+            "%s backend did not respond in time. Ignoring its result.",
+            "DummyBackend1",
+        )
+
+    def test_late_backend_is_dropped_from_roots(self):
+        self.library1.root_directory.get.side_effect = pykka.Timeout
+
+        result = self.core.library.browse(None)
+
+        assert result == [Ref.directory(uri="dummy2:directory", name="dummy2")]
+
+    def test_late_backend_is_dropped_from_lookup(self):
+        self.library1.lookup_many.return_value.get.side_effect = pykka.Timeout
+
+        result = self.core.library.lookup(["dummy1:a"])
+
+        assert result == {"dummy1:a": []}
+
+    def test_no_timeout_by_default(self):
+        self.core = core.Core(
+            config={},
+            mixer=None,
+            backends=[self.backend1, self.backend2, self.backend3],
+        )
+        self.library1.get_distinct.return_value.get.return_value = {"a"}
+
+        self.core.library.get_distinct("artist")
+
+        self.library1.get_distinct.return_value.get.assert_called_once_with()
+
+
 class GetDistinctTest(BaseCoreLibraryTest):
     def test_with_query(self):
         self.library1.get_distinct.return_value.get.return_value = {}
@@ -12,11 +12,17 @@ from tests import dummy_audio, dummy_backend
 
 
 class MyTestPlaybackProvider(backend.PlaybackProvider):
+    prepare_next_uri = True
+
     def __init__(self, audio, backend):
         super().__init__(audio, backend)
         self._call_limit = 10
         self._call_count = 0
         self._call_onetime = False
+        self.translated_uris = []
+
+    def get_translated_uris(self):
+        return self.translated_uris
 
     def reset_call_limit(self):
         self._call_count = 0
@@ -41,6 +47,7 @@ class MyTestPlaybackProvider(backend.PlaybackProvider):
         return uri
 
     def translate_uri(self, uri):
+        self.translated_uris.append(uri)
         if "error" in uri:
             raise Exception(uri)
         if "unplayable" in uri:
@@ -102,6 +109,11 @@ class BaseTest:
             event, kwargs = self.events.pop(0)
             self.core.on_event(event, **kwargs)
 
+    def wait_for_backend(self):
+        # Backends prepare the next track in the background. Any call to the
+        # backend is handled after that is done.
+        self.backend.uri_schemes.get()
+
     def trigger_about_to_finish(self, replay_until=None):
         self.replay_events()
         callback = self.audio.get_about_to_finish_callback().get()
@@ -432,6 +444,165 @@ class TestOnAboutToFinish(BaseTest):
 
         assert self.core.playback.get_current_tl_track() == tl_tracks[2]
 
+    def test_on_about_to_finish_uses_prepared_uri(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+
+        assert self.backend.playback.get_translated_uris().get() == [
+            "dummy:a",
+            "dummy:b",
+        ]
+
+        self.trigger_about_to_finish()
+
+        assert self.core.playback.get_current_tl_track() == tl_tracks[1]
+        assert self.backend.playback.get_translated_uris().get() == [
+            "dummy:a",
+            "dummy:b",
+            "dummy:c",
+        ]
+
+    def test_on_about_to_finish_uses_next_uri(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        callback = mock.Mock()
+        self.audio.set_about_to_finish_callback(callback).get()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.wait_for_backend()
+        self.trigger_about_to_finish()
+
+        callback.assert_not_called()
+        assert self.core.playback.get_current_tl_track() == tl_tracks[1]
+
+    def test_on_about_to_finish_ends_previous_track_with_next_uri(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        with mock.patch("mopidy.core.CoreListener.send") as send_mock:
+            self.trigger_about_to_finish()
+
+        send_mock.assert_any_call(
+            "track_playback_ended", tl_track=tl_tracks[0], time_position=1234
+        )
+        send_mock.assert_any_call("track_playback_started", tl_track=tl_tracks[1])
+
+    def test_next_uri_follows_tracklist_changes(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        callback = mock.Mock()
+        self.audio.set_about_to_finish_callback(callback).get()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.core.tracklist.move(2, 3, 1)
+        self.wait_for_backend()
+        self.trigger_about_to_finish()
+
+        callback.assert_not_called()
+        assert self.core.playback.get_current_tl_track() == tl_tracks[2]
+
+    def test_next_uri_follows_option_changes(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.core.tracklist.set_single(True)
+        self.wait_for_backend()
+        self.trigger_about_to_finish()
+
+        assert self.core.playback.get_state() == PlaybackState.STOPPED
+        assert self.core.playback.get_current_tl_track() is None
+
+    def test_on_about_to_finish_ignores_outdated_prepared_uri(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.core.tracklist.remove({"tlid": [tl_tracks[1].tlid]})
+        self.wait_for_backend()
+
+        self.trigger_about_to_finish()
+
+        assert self.core.playback.get_current_tl_track() == tl_tracks[2]
+        assert self.backend.playback.get_translated_uris().get() == [
+            "dummy:a",
+            "dummy:b",
+            "dummy:c",
+        ]
+
+    def test_next_uri_used_after_play_is_ignored(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.wait_for_backend()
+        self.core.playback.play(tl_tracks[2].tlid)
+        # Audio switched to the next URI before the play() call got to it
+        self.core.on_event("next_uri_used", uri="dummy:b", track_uri="dummy:b")
+        self.replay_events()
+
+        assert self.core.playback.get_current_tl_track() == tl_tracks[2]
+
+    def test_next_uri_used_after_stop_is_ignored(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.wait_for_backend()
+        self.core.playback.stop()
+        self.core.on_event("next_uri_used", uri="dummy:b", track_uri="dummy:b")
+        self.replay_events()
+
+        assert self.core.playback.get_state() == PlaybackState.STOPPED
+        assert self.core.playback.get_current_tl_track() == tl_tracks[0]
+
+    def test_next_uri_used_for_removed_track_picks_next_track(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.wait_for_backend()
+        # Audio switched to the next URI before the track was removed
+        self.audio.prepare_change().get()
+        self.core.tracklist.remove({"tlid": [tl_tracks[1].tlid]})
+        self.core.on_event("next_uri_used", uri="dummy:b", track_uri="dummy:b")
+        self.core.on_event("stream_changed", uri="dummy:c")
+
+        assert self.core.playback.get_current_tl_track() == tl_tracks[2]
+
+    def test_next_track_is_only_prepared_when_changed(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        with pytest.deprecated_call():
+            self.core.tracklist.add(tracks=[Track(uri="dummy:d", length=1234)])
+        self.core.tracklist.set_consume(True)
+        self.wait_for_backend()
+
+        assert self.backend.playback.get_translated_uris().get() == [
+            "dummy:a",
+            "dummy:b",
+        ]
+
+    def test_next_track_is_not_prepared_when_stopped(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.core.playback.stop()
+        self.replay_events()
+        self.core.tracklist.move(2, 3, 1)
+        self.wait_for_backend()
+
+        assert self.backend.playback.get_translated_uris().get() == [
+            "dummy:a",
+            "dummy:b",
+        ]
+
 
 class TestConsumeHandling(BaseTest):
     def test_next_in_consume_mode_removes_finished_track(self):
@@ -941,6 +1112,74 @@ class TestSeek(BaseTest):
         assert self.core.playback.get_state() == PlaybackState.PLAYING
 
 
+class TestTimePosition(BaseTest):
+    def setup_method(self, method):
+        super().setup_method(method)
+        self.now = 100.0
+        self.time_patcher = mock.patch(
+            "mopidy.core._playback.time.monotonic", side_effect=lambda: self.now
+        )
+        self.time_patcher.start()
+
+    def teardown_method(self):
+        self.time_patcher.stop()
+        super().teardown_method()
+
+    def test_time_position_is_interpolated_while_playing(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+
+        assert self.core.playback.get_time_position() == 0
+        self.now += 0.5
+        # Dummy audio doesn't progress time.
+        assert self.core.playback.get_time_position() == 500
+
+    def test_time_position_is_resynced_with_backend(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+
+        assert self.core.playback.get_time_position() == 0
+        self.now += 1.0
+        assert self.core.playback.get_time_position() == 0
+
+    def test_time_position_is_not_interpolated_past_track_length(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+
+        self.core.playback.get_time_position()
+        self.now += 0.9
+        self.core.playback._on_position_changed(1000)
+        self.now += 0.5
+
+        assert self.core.playback.get_time_position() == 1234
+
+    def test_time_position_is_not_interpolated_while_paused(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.core.playback.pause()
+        self.replay_events()
+
+        assert self.core.playback.get_time_position() == 0
+        self.now += 0.5
+        assert self.core.playback.get_time_position() == 0
+
+    def test_time_position_is_anchored_on_seek(self):
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        self.core.playback.play(tl_tracks[0].tlid)
+        self.replay_events()
+        self.core.playback.get_time_position()
+
+        self.core.playback.seek(1000)
+        self.replay_events()
+        self.now += 0.1
+
+        assert self.core.playback.get_time_position() == 1100
+
+
 class TestStream(BaseTest):
     def test_get_stream_title_before_playback(self):
         assert self.playback.get_stream_title() is None
@@ -3,9 +3,9 @@ from unittest import mock
 
 import pytest
 
-from mopidy import backend, core
+from mopidy import backend, core, exceptions
 from mopidy.core._state_storage import TracklistControllerState
-from mopidy.models import TlTrack, Track
+from mopidy.models import Album, Artist, TlTrack, Track
 from mopidy.types import TracklistId
 from tests.factories import TrackFactory
 
@@ -105,6 +105,49 @@ class TracklistTest(unittest.TestCase):
         with pytest.raises(ValueError):
             self.core.tracklist.filter({"uri": "a"})
 
+    def test_filter_by_uri_returns_all_tl_tracks_with_uri(self):
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:a"])
+
+        result = self.core.tracklist.filter({"uri": ["dummy1:a", "dummy1:x"]})
+
+        assert result == [self.tl_tracks[0], tl_tracks[0]]
+
+    def test_filter_by_uri_and_other_fields(self):
+        result = self.core.tracklist.filter(
+            {"uri": ["dummy1:a", "dummy1:c"], "name": ["bar"]}
+        )
+
+        assert result == [self.tl_tracks[2]]
+
+    def test_filter_by_uri_and_tlid(self):
+        result = self.core.tracklist.filter(
+            {"uri": ["dummy1:a", "dummy1:b"], "tlid": [self.tl_tracks[1].tlid]}
+        )
+
+        assert result == [self.tl_tracks[1]]
+
+    def test_filter_by_uri_after_remove(self):
+        self.core.tracklist.remove({"uri": ["dummy1:a"]})
+
+        assert self.core.tracklist.filter({"uri": ["dummy1:a"]}) == []
+        assert self.core.tracklist.filter({"uri": ["dummy1:b"]}) == [self.tl_tracks[1]]
+
+    def test_add_shares_equal_albums_and_artists(self):
+        self.tracks = [
+            Track(
+                uri=f"dummy1:{name}",
+                artists=frozenset([Artist(name="artist")]),
+                album=Album(name="album", artists=frozenset([Artist(name="artist")])),
+            )
+            for name in ["x", "y"]
+        ]
+
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:x", "dummy1:y"])
+
+        track_x, track_y = (tl_track.track for tl_track in tl_tracks)
+        assert track_x.album is track_y.album
+        assert track_x.artists is track_y.artists
+
     # TODO: Extract tracklist tests from the local backend tests
 
 
@@ -174,6 +217,463 @@ class TracklistIndexTest(unittest.TestCase):
         assert self.core.tracklist.index() == 1
         assert self.core.tracklist.index() == 2
 
+    def test_index_follows_moved_tracks(self):
+        self.core.tracklist.move(0, 1, 2)
+
+        assert self.core.tracklist.index(tlid=self.tl_tracks[0].tlid) == 2
+        assert self.core.tracklist.index(tlid=self.tl_tracks[1].tlid) == 0
+        assert self.core.tracklist.index(self.tl_tracks[2]) == 1
+
+    def test_index_follows_inserted_tracks(self):
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:c"], at_position=1)
+
+        assert self.core.tracklist.index(tl_tracks[0]) == 1
+        assert self.core.tracklist.index(self.tl_tracks[1]) == 2
+        assert self.core.tracklist.index(self.tl_tracks[2]) == 3
+
+    def test_index_follows_removed_tracks(self):
+        self.core.tracklist.remove({"tlid": [self.tl_tracks[0].tlid]})
+
+        assert self.core.tracklist.index(self.tl_tracks[0]) is None
+        assert self.core.tracklist.index(tlid=self.tl_tracks[1].tlid) == 0
+        assert self.core.tracklist.index(tlid=self.tl_tracks[2].tlid) == 1
+
+    def test_index_follows_shuffled_tracks(self):
+        self.core.tracklist.shuffle()
+
+        tl_tracks = self.core.tracklist.get_tl_tracks()
+        for position, tl_track in enumerate(tl_tracks):
+            assert self.core.tracklist.index(tlid=tl_track.tlid) == position
+
+    def test_filter_by_tlids_keeps_tracklist_order(self):
+        tlids = [self.tl_tracks[2].tlid, self.tl_tracks[0].tlid, 123]
+
+        assert self.core.tracklist.filter({"tlid": tlids}) == [
+            self.tl_tracks[0],
+            self.tl_tracks[2],
+        ]
+
+    def test_remove_by_tlids(self):
+        tlids = [self.tl_tracks[2].tlid, self.tl_tracks[0].tlid]
+
+        removed = self.core.tracklist.remove({"tlid": tlids})
+
+        assert removed == [self.tl_tracks[0], self.tl_tracks[2]]
+        assert self.core.tracklist.get_tl_tracks() == [self.tl_tracks[1]]
+
+
+class TracklistLazyAddTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = {
+            "dummy1:a": [Track(uri="dummy1:a", name="foo")],
+            "dummy1:album": [
+                Track(uri="dummy1:b", name="foo"),
+                Track(uri="dummy1:c", name="bar"),
+            ],
+        }
+
+        def lookup(uris):
+            return {u: self.tracks.get(u, []) for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+        self.core.playback.get_current_tl_track.return_value = None
+
+    def test_returns_tracks_with_only_uris(self):
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:a"], lazy=True)
+
+        assert tl_tracks == [TlTrack(TracklistId(1), Track(uri="dummy1:a"))]
+
+    def test_tracks_are_looked_up_after_adding(self):
+        self.core.tracklist.add(uris=["dummy1:a", "dummy1:b"], lazy=True)
+
+        assert self.core.tracklist.get_tl_tracks() == [
+            TlTrack(TracklistId(1), self.tracks["dummy1:a"][0]),
+        ]
+
+    def test_tracks_are_expanded_in_place(self):
+        self.core.tracklist.add(uris=["dummy1:a", "dummy1:a"])
+        tl_tracks = self.core.tracklist.add(
+            uris=["dummy1:album"], at_position=1, lazy=True
+        )
+
+        assert [t.tlid for t in self.core.tracklist.get_tl_tracks()] == [
+            1,
+            tl_tracks[0].tlid,
+            4,
+            2,
+        ]
+        assert self.core.tracklist.get_tracks() == [
+            self.tracks["dummy1:a"][0],
+            *self.tracks["dummy1:album"],
+            self.tracks["dummy1:a"][0],
+        ]
+
+    def test_current_track_is_updated(self):
+        def lookup(uris):
+            self.core.playback.get_current_tl_track.return_value = tl_tracks[0]
+            return {u: self.tracks.get(u, []) for u in uris}
+
+        self.core.library.lookup.side_effect = lookup
+        tl_tracks = [TlTrack(TracklistId(1), Track(uri="dummy1:a"))]
+
+        self.core.tracklist.add(uris=["dummy1:a"], lazy=True)
+
+        self.core.playback._set_current_tl_track.assert_called_once_with(
+            TlTrack(TracklistId(1), self.tracks["dummy1:a"][0])
+        )
+
+    def test_resolved_track_keeps_place_in_random_order(self):
+        self.core.tracklist.set_random(True)
+        self.core.tracklist.add(uris=["dummy1:a", "dummy1:a", "dummy1:a"])
+        with mock.patch.object(self.core.tracklist, "_schedule_resolve"):
+            (tl_track,) = self.core.tracklist.add(uris=["dummy1:a"], lazy=True)
+        position = self.core.tracklist._shuffled.index_of_key(tl_track.tlid)
+
+        self.core.tracklist._resolve_batch()
+
+        assert self.core.tracklist._shuffled.index_of_key(tl_track.tlid) == position
+
+    def test_played_track_stays_played_when_resolved_in_random_mode(self):
+        self.core.tracklist.set_random(True)
+        with mock.patch.object(self.core.tracklist, "_schedule_resolve"):
+            tl_tracks = self.core.tracklist.add(
+                uris=["dummy1:a", "dummy1:album"], lazy=True
+            )
+        self.core.tracklist._mark_playing(tl_tracks[0])
+
+        self.core.tracklist._resolve_batch()
+
+        assert sorted(t.tlid for t in self.core.tracklist._shuffled) == [2, 3]
+
+    def test_resolving_records_one_change_per_batch(self):
+        with mock.patch.object(self.core.tracklist, "_schedule_resolve"):
+            self.core.tracklist.add(
+                uris=["dummy1:a", "dummy1:a", "dummy1:unknown"], lazy=True
+            )
+        version = self.core.tracklist.get_version()
+
+        self.core.tracklist._resolve_batch()
+
+        changes = self.core.tracklist.get_changes(version)
+        assert [change["updated"] for change in changes] == [
+            [
+                TlTrack(TracklistId(1), self.tracks["dummy1:a"][0]),
+                TlTrack(TracklistId(2), self.tracks["dummy1:a"][0]),
+            ],
+            [],
+        ]
+        assert changes[1]["removed"] == [3]
+
+    def test_lazy_requires_uris(self):
+        with pytest.raises(ValueError):
+            self.core.tracklist.add(tracks=[Track(uri="dummy1:a")], lazy=True)
+
+
+class TracklistRandomTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = [
+            Track(uri="dummy1:a", name="foo"),
+            Track(uri="dummy1:b", name="foo"),
+            Track(uri="dummy1:c", name="bar"),
+        ]
+
+        def lookup(uris):
+            return {u: [t for t in self.tracks if t.uri == u] for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+
+        self.core.playback.get_current_tl_track.return_value = None
+
+        self.tl_tracks = self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+        self.core.tracklist.set_random(True)
+
+    def play_next(self):
+        tlid = self.core.tracklist.get_next_tlid()
+        if tlid is None:
+            return None
+        tl_track = self.core.tracklist._get_tl_track(tlid)
+        self.core.tracklist._mark_playing(tl_track)
+        self.core.playback.get_current_tl_track.return_value = tl_track
+        return tl_track
+
+    def tlids(self, tl_tracks):
+        return sorted(tl_track.tlid for tl_track in tl_tracks)
+
+    def test_plays_all_tracks_once(self):
+        played = [self.play_next() for _ in self.tl_tracks]
+
+        assert self.tlids(played) == self.tlids(self.tl_tracks)
+        assert self.play_next() is None
+
+    def test_added_tracks_are_played(self):
+        played = [self.play_next()]
+        tl_tracks = self.core.tracklist.add(uris=["dummy1:a", "dummy1:b"])
+
+        played.extend(self.play_next() for _ in range(4))
+
+        assert self.tlids(played) == self.tlids(self.tl_tracks + tl_tracks)
+        assert self.play_next() is None
+
+    def test_removed_tracks_are_not_played(self):
+        self.core.tracklist.remove({"tlid": [self.tl_tracks[1].tlid]})
+
+        played = [self.play_next() for _ in range(2)]
+
+        assert self.tlids(played) == self.tlids([self.tl_tracks[0], self.tl_tracks[2]])
+        assert self.play_next() is None
+
+    def test_played_tracks_are_not_replayed_after_changes(self):
+        played = [self.play_next()]
+        self.core.tracklist.move(0, 1, 2)
+        self.core.tracklist.shuffle()
+
+        played.extend(self.play_next() for _ in range(2))
+
+        assert self.tlids(played) == self.tlids(self.tl_tracks)
+        assert self.play_next() is None
+
+    def test_disabling_random_forgets_order(self):
+        self.core.tracklist.set_random(False)
+
+        assert len(self.core.tracklist._shuffled) == 0
+
+
+class TracklistChangesTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = [
+            Track(uri="dummy1:a", name="foo"),
+            Track(uri="dummy1:b", name="foo"),
+            Track(uri="dummy1:c", name="bar"),
+        ]
+
+        def lookup(uris):
+            return {u: [t for t in self.tracks if t.uri == u] for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+
+        self.tl_tracks = self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+
+    def apply(self, tl_tracks, changes):
+        tl_tracks = list(tl_tracks)
+        for change in changes:
+            if change["inserted"]:
+                position = change["position"]
+                tl_tracks[position:position] = change["inserted"]
+            if change["removed"]:
+                removed = set(change["removed"])
+                tl_tracks = [t for t in tl_tracks if t.tlid not in removed]
+            if change["moved"]:
+                by_tlid = {t.tlid: t for t in tl_tracks}
+                moved = set(change["moved"])
+                tl_tracks = [t for t in tl_tracks if t.tlid not in moved]
+                position = change["position"]
+                tl_tracks[position:position] = [
+                    by_tlid[tlid] for tlid in change["moved"]
+                ]
+            if change["updated"]:
+                updated = {t.tlid: t for t in change["updated"]}
+                tl_tracks = [updated.get(t.tlid, t) for t in tl_tracks]
+        return tl_tracks
+
+    def test_changes_since_version_give_current_tracklist(self):
+        version = self.core.tracklist.get_version()
+
+        self.core.tracklist.add(uris=["dummy1:a", "dummy1:b"], at_position=1)
+        self.core.tracklist.move(0, 2, 3)
+        self.core.tracklist.remove({"uri": ["dummy1:c"]})
+        self.core.tracklist.shuffle(1, 3)
+        self.core.tracklist.add(uris=["dummy1:c"])
+
+        changes = self.core.tracklist.get_changes(version)
+
+        assert [change["version"] for change in changes] == list(
+            range(version + 1, version + 6)
+        )
+        assert self.apply(self.tl_tracks, changes) == (
+            self.core.tracklist.get_tl_tracks()
+        )
+
+    def test_changes_include_looked_up_tracks(self):
+        version = self.core.tracklist.get_version()
+
+        self.core.tracklist.add(
+            uris=["dummy1:b", "dummy1:unknown", "dummy1:c"], at_position=1, lazy=True
+        )
+
+        changes = self.core.tracklist.get_changes(version)
+        assert self.apply(self.tl_tracks, changes) == (
+            self.core.tracklist.get_tl_tracks()
+        )
+
+    def test_changes_from_start_give_current_tracklist(self):
+        self.core.tracklist.clear()
+        self.core.tracklist.add(uris=["dummy1:b"])
+
+        changes = self.core.tracklist.get_changes(0)
+
+        assert self.apply([], changes) == self.core.tracklist.get_tl_tracks()
+
+    def test_no_changes_since_current_version(self):
+        version = self.core.tracklist.get_version()
+
+        assert self.core.tracklist.get_changes(version) == []
+
+    def test_no_changes_for_future_version(self):
+        version = self.core.tracklist.get_version()
+
+        assert self.core.tracklist.get_changes(version + 1) is None
+
+    def test_no_changes_when_dropped_from_journal(self):
+        with mock.patch("mopidy.core._tracklist._CHANGE_JOURNAL_SIZE", 2):
+            version = self.core.tracklist.get_version()
+            self.core.tracklist.move(0, 1, 2)
+            self.core.tracklist.move(0, 1, 2)
+            self.core.tracklist.move(0, 1, 2)
+
+            assert self.core.tracklist.get_changes(version) is None
+            assert len(self.core.tracklist.get_changes(version + 1)) == 2
+
+
+class TracklistApplyTest(unittest.TestCase):
+    def setUp(self):
+        config = {"core": {"max_tracklist_length": 10000}}
+
+        self.tracks = [
+            Track(uri="dummy1:a", name="foo"),
+            Track(uri="dummy1:b", name="foo"),
+            Track(uri="dummy1:c", name="bar"),
+        ]
+
+        def lookup(uris):
+            return {u: [t for t in self.tracks if t.uri == u] for u in uris}
+
+        self.core = core.Core(config, mixer=None, backends=[])
+        self.core.library = mock.Mock(spec=core.LibraryController)
+        self.core.library.lookup.side_effect = lookup
+
+        self.core.playback = mock.Mock(spec=core.PlaybackController)
+
+        self.tl_tracks = self.core.tracklist.add(uris=[t.uri for t in self.tracks])
+
+    def test_apply_runs_operations_in_order(self):
+        results = self.core.tracklist.apply(
+            [
+                {"method": "remove", "params": {"criteria": {"uri": ["dummy1:a"]}}},
+                {"method": "add", "params": {"uris": ["dummy1:a"], "at_position": 1}},
+                {"method": "move", "params": {"start": 0, "end": 1, "to_position": 2}},
+            ]
+        )
+
+        removed, added, moved = results
+        assert removed == [self.tl_tracks[0]]
+        assert moved is None
+        assert self.core.tracklist.get_tl_tracks() == [
+            added[0],
+            self.tl_tracks[2],
+            self.tl_tracks[1],
+        ]
+
+    def test_apply_increases_version_once(self):
+        version = self.core.tracklist.get_version()
+        self.core.playback.reset_mock()
+
+        with mock.patch.object(core.CoreListener, "send") as send:
+            self.core.tracklist.apply(
+                [
+                    {"method": "clear"},
+                    {"method": "add", "params": {"uris": ["dummy1:a"]}},
+                    {"method": "add", "params": {"uris": ["dummy1:b"]}},
+                ]
+            )
+
+        assert self.core.tracklist.get_version() == version + 1
+        assert self.core.playback._on_tracklist_change.call_count == 1
+        send.assert_called_once_with("tracklist_changed")
+        changes = self.core.tracklist.get_changes(version)
+        assert len(changes) == 3
+        assert {change["version"] for change in changes} == {version + 1}
+
+    def test_apply_without_changes_keeps_version(self):
+        version = self.core.tracklist.get_version()
+
+        self.core.tracklist.apply([])
+
+        assert self.core.tracklist.get_version() == version
+
+    def test_apply_restores_tracklist_on_error(self):
+        version = self.core.tracklist.get_version()
+
+        with pytest.raises(AssertionError):
+            self.core.tracklist.apply(
+                [
+                    {"method": "clear"},
+                    {"method": "add", "params": {"uris": ["dummy1:a"]}},
+                    {
+                        "method": "move",
+                        "params": {"start": 0, "end": 5, "to_position": 0},
+                    },
+                ]
+            )
+
+        assert self.core.tracklist.get_tl_tracks() == self.tl_tracks
+        assert self.core.tracklist.get_version() == version
+        assert self.core.tracklist.get_changes(version) == []
+        assert self.core.tracklist.index(self.tl_tracks[2]) == 2
+
+    def test_apply_restores_random_state_on_error(self):
+        self.core.tracklist.set_random(True)
+        self.core.tracklist._mark_playing(self.tl_tracks[0])
+        shuffled = list(self.core.tracklist._shuffled)
+        next_tlid = self.core.tracklist._next_tlid
+        version = self.core.tracklist.get_version()
+
+        with (
+            mock.patch.object(self.core.tracklist, "_schedule_resolve"),
+            pytest.raises(AssertionError),
+        ):
+            self.core.tracklist.apply(
+                [
+                    {"method": "add", "params": {"uris": ["dummy1:a"]}},
+                    {
+                        "method": "add",
+                        "params": {"uris": ["dummy1:b"], "lazy": True},
+                    },
+                    {
+                        "method": "move",
+                        "params": {"start": 0, "end": 1, "to_position": 10},
+                    },
+                ]
+            )
+
+        assert self.core.tracklist.get_tl_tracks() == self.tl_tracks
+        assert list(self.core.tracklist._shuffled) == shuffled
+        assert not self.core.tracklist._shuffled.contains_key(self.tl_tracks[0].tlid)
+        assert self.core.tracklist._next_tlid == next_tlid
+        assert not self.core.tracklist._unresolved
+        assert self.core.tracklist.get_version() == version
+
+    def test_apply_rejects_unknown_methods(self):
+        with pytest.raises(exceptions.ValidationError):
+            self.core.tracklist.apply([{"method": "get_tl_tracks"}])
+
 
 class TracklistSaveLoadStateTest(unittest.TestCase):
     def setUp(self):
@@ -27,6 +27,7 @@ class DummyAudio(audio.Audio, pykka.ThreadingActor):
         self._position = DurationMs(0)
         self._source_setup_callback = None
         self._about_to_finish_callback = None
+        self._next_uri = None
         self._uri = None
         self._stream_changed = False
         self._live_stream = False
@@ -42,6 +43,17 @@ class DummyAudio(audio.Audio, pykka.ThreadingActor):
         self._live_stream = live_stream
         self._tags = {}
 
+    @override
+    def set_next_uri(
+        self,
+        uri,
+        live_stream=False,
+        download=False,
+        source_setup_callback=None,
+        track_uri=None,
+    ):
+        self._next_uri = None if uri is None else (uri, track_uri)
+
     @override
     def set_source_setup_callback(self, callback):
         self._source_setup_callback = callback
@@ -71,11 +83,13 @@ class DummyAudio(audio.Audio, pykka.ThreadingActor):
     @override
     def prepare_change(self):
         self._uri = None
+        self._next_uri = None
         self._source_setup_callback = None
         return True
 
     @override
     def stop_playback(self):
+        self._next_uri = None
         return self._change_state(PlaybackState.STOPPED)
 
     @override
@@ -129,11 +143,17 @@ class DummyAudio(audio.Audio, pykka.ThreadingActor):
     def get_about_to_finish_callback(self):
         # This needs to be called from outside the actor or we lock up.
         def wrapper():
-            if self._about_to_finish_callback:
+            next_uri = self._next_uri
+            if next_uri:
+                uri, track_uri = next_uri
+                self.prepare_change()
+                self.set_uri(uri)
+                audio.AudioListener.send("next_uri_used", uri=uri, track_uri=track_uri)
+            elif self._about_to_finish_callback:
                 self.prepare_change()
                 self._about_to_finish_callback()
 
-            if not self._uri or not self._about_to_finish_callback:
+            if not self._uri or not (next_uri or self._about_to_finish_callback):
                 self._tags = {}
                 audio.AudioListener.send("reached_end_of_stream")
             else:
@@ -46,7 +46,11 @@ class DummyLibraryProvider(backend.LibraryProvider):
         return self.dummy_get_distinct_result.get(field, set())
 
     def lookup_many(self, uris):
-        return {uri: [t for t in self.dummy_library if uri == t.uri] for uri in uris}
+        tracks = {uri: [] for uri in uris}
+        for track in self.dummy_library:
+            if track.uri in tracks:
+                tracks[track.uri].append(track)
+        return tracks
 
     def refresh(self, uri=None):
         pass